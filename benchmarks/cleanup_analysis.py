@@ -0,0 +1,59 @@
+# Benchmark of the process-pool cleanup analysis (Analysis Workers option).
+#
+#   blender --background --factory-startup --python benchmarks/cleanup_analysis.py -- 1 4 8
+#
+# Builds MESHES grid meshes of about VERTICES vertices each, then times
+# analyze_meshes with each worker count given (1 = in-process). Signatures
+# from every run are checked against the single-worker run. Scaling depends on
+# the machine's core count, which is printed first.
+import os
+import sys
+import time
+import importlib
+
+MESHES = 64
+VERTICES = 90_000
+
+
+def import_addon_module(name):
+    """Import a module of this checkout as a package, whatever its folder is called"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, os.path.dirname(root))
+    return importlib.import_module(f"{os.path.basename(root)}.{name}")
+
+
+def grid_meshes(count, vertex_count):
+    # bpy is imported here, not at the top: spawn workers re-run this script as
+    # __mp_main__ in a plain Python that has no bpy
+    import bpy
+    side = max(2, int(vertex_count ** 0.5))
+    meshes = []
+    for _ in range(count):
+        bpy.ops.mesh.primitive_grid_add(x_subdivisions=side - 1, y_subdivisions=side - 1)
+        meshes.append(bpy.context.active_object.data)
+    return meshes
+
+
+def main(worker_counts):
+    cleanup_analysis = import_addon_module("utlity.cleanup_analysis")
+    meshes = grid_meshes(MESHES, VERTICES)
+    print(f"{len(meshes)} meshes x {len(meshes[0].vertices)} vertices, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8} {'time':>9} {'speedup':>8}  signatures")
+
+    reference = None
+    base_time = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        plan = cleanup_analysis.analyze_meshes(meshes, workers=workers)
+        elapsed = time.perf_counter() - start
+
+        signatures = {name: result['signature'] for name, result in plan.items()}
+        if reference is None:
+            reference, base_time = signatures, elapsed
+        print(f"{workers:>8} {elapsed:>8.2f}s {base_time / elapsed:>7.2f}x  "
+              f"{'same' if signatures == reference else 'DIFFERENT'}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    main([int(arg) for arg in args] or [1, 4, 8])
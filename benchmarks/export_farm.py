@@ -0,0 +1,94 @@
+# Benchmark of the split FBX exporter's background worker farm (Background Workers option).
+#
+#   blender --background --factory-startup --python benchmarks/export_farm.py -- 0 1 2 4 8
+#
+# Builds OBJECTS subdivided monkeys and exports one FBX per object. 0 exports
+# inside this session through the operator's collection path; N hands the same
+# job list to ExportFarm with N background Blender processes. Farm times are
+# wall clock from start() to the last worker exiting, so they include saving
+# the snapshot and each worker's start-up. Needs the Blender executable - the
+# farm can't run from bpy imported as a Python module.
+import os
+import sys
+import time
+import shutil
+import tempfile
+import importlib
+from types import SimpleNamespace
+import bpy
+
+OBJECTS = 200
+
+
+def import_addon_module(name):
+    """Import a module of this checkout as a package, whatever its folder is called"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, os.path.dirname(root))
+    return importlib.import_module(f"{os.path.basename(root)}.{name}")
+
+
+def monkey_objects(count):
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    objects = []
+    for index in range(count):
+        bpy.ops.mesh.primitive_monkey_add(location=(index * 3.0, 0.0, 0.0))
+        obj = bpy.context.active_object
+        obj.name = f"monkey_{index:04d}"
+        obj.modifiers.new("Subdivision", 'SUBSURF').levels = 1
+        objects.append(obj)
+    return objects
+
+
+def export_in_session(objects, directory):
+    operator = import_addon_module("operators.export_fbx_multi").DH_OP_dcc_split_export
+    exporter = SimpleNamespace(export_collections=[])
+    collections = operator.make_export_collections(exporter, objects)
+    for obj, collection in zip(objects, collections):
+        operator.export_object(exporter, bpy.context, obj, os.path.join(directory, f"{obj.name}.fbx"), collection)
+    exporter.export_collections = collections
+    operator.remove_export_collections(exporter)
+    return 0
+
+
+def export_with_farm(objects, directory, workers):
+    export_farm = import_addon_module("utlity.export_farm")
+    jobs = [(obj.name, os.path.join(directory, f"{obj.name}.fbx")) for obj in objects]
+    farm = export_farm.ExportFarm(jobs, workers, [len(obj.data.polygons) for obj in objects])
+    try:
+        farm.start()
+        while farm.poll():
+            time.sleep(0.05)
+    finally:
+        farm.cleanup()
+    return len(farm.failed)
+
+
+def main(worker_counts):
+    if any(worker_counts) and not bpy.app.binary_path:
+        print("Worker counts above 0 need the Blender executable (bpy.app.binary_path is empty)")
+        return
+
+    objects = monkey_objects(OBJECTS)
+    faces = sum(len(obj.data.polygons) for obj in objects) * 4
+    print(f"{len(objects)} objects, {faces} faces after subdivision, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8} {'time':>9} {'speedup':>8} {'failed':>7}")
+
+    base_time = None
+    for workers in worker_counts:
+        directory = tempfile.mkdtemp(prefix="dh_farm_bench_")
+        try:
+            start = time.perf_counter()
+            if workers == 0:
+                failed = export_in_session(objects, directory)
+            else:
+                failed = export_with_farm(objects, directory, workers)
+            elapsed = time.perf_counter() - start
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+        base_time = base_time or elapsed
+        print(f"{workers:>8} {elapsed:>8.2f}s {base_time / elapsed:>7.2f}x {failed:>7}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    main([int(arg) for arg in args] or [0, 1, 2, 4, 8])
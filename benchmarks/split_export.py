@@ -0,0 +1,70 @@
+# Benchmark of the split FBX exporter's per-object export paths (Keep Selection option).
+#
+#   blender --background --factory-startup --python benchmarks/split_export.py -- 100 1000 5000
+#
+# Builds N one-triangle objects and exports every one of them to its own FBX,
+# once through the old select-and-export path and once through the temporary
+# collections, using the operator's own export_object / make_export_collections.
+# The selection path deselects the whole scene per object, so its cost per
+# object grows with scene size; expect it to take minutes at 5000 objects.
+import os
+import sys
+import time
+import shutil
+import tempfile
+import importlib
+from types import SimpleNamespace
+import bpy
+
+
+def import_addon_module(name):
+    """Import a module of this checkout as a package, whatever its folder is called"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, os.path.dirname(root))
+    return importlib.import_module(f"{os.path.basename(root)}.{name}")
+
+
+def triangle_objects(count):
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    mesh = bpy.data.meshes.new("tri")
+    mesh.from_pydata([(0, 0, 0), (1, 0, 0), (0, 1, 0)], [], [(0, 1, 2)])
+    objects = []
+    for index in range(count):
+        obj = bpy.data.objects.new(f"tri_{index:05d}", mesh)
+        bpy.context.scene.collection.objects.link(obj)
+        objects.append(obj)
+    return objects
+
+
+def export_all(exporter, operator, objects, directory, use_collections):
+    """Seconds to export every object, collection set-up and teardown included"""
+    start = time.perf_counter()
+    collections = operator.make_export_collections(exporter, objects) if use_collections else []
+    for index, obj in enumerate(objects):
+        collection = collections[index] if collections else None
+        operator.export_object(exporter, bpy.context, obj, os.path.join(directory, f"{obj.name}.fbx"), collection)
+    if collections:
+        exporter.export_collections = collections
+        operator.remove_export_collections(exporter)
+    return time.perf_counter() - start
+
+
+def main(sizes):
+    operator = import_addon_module("operators.export_fbx_multi").DH_OP_dcc_split_export
+    exporter = SimpleNamespace(export_collections=[])
+    print(f"{'objects':>8} {'selection path':>22} {'collection path':>22}")
+    for size in sizes:
+        objects = triangle_objects(size)
+        directory = tempfile.mkdtemp(prefix="dh_split_bench_")
+        try:
+            selection_time = export_all(exporter, operator, objects, directory, use_collections=False)
+            collection_time = export_all(exporter, operator, objects, directory, use_collections=True)
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+        print(f"{size:>8} {selection_time:>9.2f}s ({selection_time / size * 1000:>5.1f} ms/obj) "
+              f"{collection_time:>9.2f}s ({collection_time / size * 1000:>5.1f} ms/obj)")
+
+
+if __name__ == "__main__":
+    args = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    main([int(arg) for arg in args] or [100, 1000])
@@ -0,0 +1,129 @@
+# Benchmark of the streaming OBJ / PLY writer against Blender's own exporters.
+#
+#   blender --background --factory-startup --python benchmarks/stream_export.py -- 1000000 4000000
+#
+# Each size is the total face count, spread over OBJECTS grids that each carry a
+# Subdivision modifier, so every exporter has to work from evaluated meshes.
+# "preload" is the stream writer fed meshes that were all read up front (how
+# dh.stream_export worked before it read one mesh at a time).
+#
+# Peak RSS only ever grows, so every (exporter, size) pair runs in a fresh
+# Blender process and reports its peak above the level reached after building
+# the scene. Memory figures need the resource module (Linux / macOS).
+import os
+import sys
+import time
+import resource
+import tempfile
+import subprocess
+import importlib.util
+import numpy as np
+import bpy
+
+OBJECTS = 4
+EXPORTERS = ("stream_obj", "preload_obj", "stock_obj", "stream_ply", "preload_ply", "stock_ply")
+
+
+def load_mesh_stream():
+    """utlity/mesh_stream.py only needs numpy, so it loads without enabling the addon"""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "utlity", "mesh_stream.py")
+    spec = importlib.util.spec_from_file_location("mesh_stream", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def build_scene(face_count):
+    """OBJECTS grids whose level-1 Subdivision adds up to about `face_count` faces"""
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete()
+    side = max(2, int((face_count / OBJECTS / 4) ** 0.5))
+    for index in range(OBJECTS):
+        bpy.ops.mesh.primitive_grid_add(x_subdivisions=side, y_subdivisions=side, location=(index * 3.0, 0.0, 0.0))
+        bpy.context.active_object.modifiers.new("Subdivision", 'SUBSURF').levels = 1
+    bpy.ops.object.select_all(action='SELECT')
+    return [obj for obj in bpy.context.scene.objects if obj.type == 'MESH']
+
+
+class Preloaded:
+    """Stands in for a MeshSource whose arrays were all read before writing started"""
+
+    def __init__(self, source):
+        self.vertex_count = source.vertex_count
+        self.face_count = source.face_count
+        self.max_corners = source.max_corners
+        self.mesh = source.read()
+
+    def read(self, coords=True, faces=True):
+        return self.mesh
+
+
+def run_case(exporter, face_count):
+    """Child process: build the scene, export once, print one RESULT line"""
+    mesh_stream = load_mesh_stream()
+    objects = build_scene(face_count)
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    faces = sum(len(obj.evaluated_get(depsgraph).data.polygons) for obj in objects)
+    baseline = peak_rss_mb()
+
+    kind, file_format = exporter.split("_")
+    filepath = os.path.join(tempfile.gettempdir(), f"dh_stream_bench_{os.getpid()}.{file_format}")
+    start = time.perf_counter()
+    if kind == "stock":
+        options = dict(filepath=filepath, apply_modifiers=True, export_uv=False, export_normals=False)
+        if file_format == "obj":
+            bpy.ops.wm.obj_export(export_materials=False, **options)
+        else:
+            bpy.ops.wm.ply_export(export_colors='NONE', ascii_format=False, **options)
+    else:
+        sources = []
+        for obj in objects:
+            matrix = np.array(obj.matrix_world, dtype=np.float64)
+            matrix[:3] = mesh_stream.Y_UP @ matrix[:3]
+            sources.append(mesh_stream.MeshSource(obj, depsgraph, matrix))
+        if kind == "preload":
+            sources = [Preloaded(source) for source in sources]
+        writer = mesh_stream.write_ply if file_format == "ply" else mesh_stream.write_obj
+        writer(filepath, sources)
+    elapsed = time.perf_counter() - start
+
+    size_mb = os.path.getsize(filepath) / (1024 * 1024)
+    os.remove(filepath)
+    print(f"RESULT {exporter} {faces} {elapsed:.4f} {peak_rss_mb() - baseline:.1f} {size_mb:.1f}")
+
+
+def spawn(exporter, face_count):
+    script = os.path.abspath(__file__)
+    if bpy.app.binary_path:
+        command = [bpy.app.binary_path, "--background", "--factory-startup", "--python", script]
+    else:
+        command = [sys.executable, script]     # bpy as a Python module
+    command += ["--", "--case", exporter, str(face_count)]
+    output = subprocess.run(command, capture_output=True, text=True).stdout
+    for line in output.splitlines():
+        if line.startswith("RESULT "):
+            _, _, faces, elapsed, peak, size = line.split()
+            return int(faces), float(elapsed), float(peak), float(size)
+    raise RuntimeError(f"{exporter} at {face_count} faces produced no result:\n{output[-2000:]}")
+
+
+def main(sizes):
+    print(f"{'faces':>10} {'exporter':>12} {'time':>9} {'peak +RSS':>10} {'file':>9}")
+    for size in sizes:
+        for exporter in EXPORTERS:
+            faces, elapsed, peak, file_size = spawn(exporter, size)
+            print(f"{faces:>10} {exporter:>12} {elapsed:>8.2f}s {peak:>7.0f} MB {file_size:>6.0f} MB")
+
+
+if __name__ == "__main__":
+    args = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    if args[:1] == ["--case"]:
+        run_case(args[1], int(args[2]))
+        sys.stdout.flush()
+        os._exit(0)
+    main([int(arg) for arg in args] or [1_000_000, 4_000_000])
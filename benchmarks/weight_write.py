@@ -0,0 +1,43 @@
+# Micro-benchmark of the Weight Fill Shell write path.
+#
+#   blender --background --factory-startup --python benchmarks/weight_write.py -- 10000 100000 1000000
+#
+# Times writing one weight to N vertices of a vertex group the old way (one
+# VertexGroup.add call per vertex) against one add() call with the whole list.
+import sys
+import time
+import bpy
+
+
+def grid_object(vertex_count):
+    side = max(2, int(vertex_count ** 0.5))
+    bpy.ops.mesh.primitive_grid_add(x_subdivisions=side - 1, y_subdivisions=side - 1)
+    return bpy.context.active_object
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main(sizes):
+    print(f"{'verts':>10} {'per-vertex add':>16} {'bulk add':>10} {'speedup':>8}")
+    for size in sizes:
+        obj = grid_object(size)
+        group = obj.vertex_groups.new(name="bench")
+        indices = list(range(len(obj.data.vertices)))
+
+        def per_vertex():
+            for index in indices:
+                group.add([index], 0.5, 'REPLACE')
+
+        per_vertex_time = timed(per_vertex)
+        bulk_time = timed(lambda: group.add(indices, 0.75, 'REPLACE'))
+        print(f"{len(indices):>10} {per_vertex_time:>15.3f}s {bulk_time:>9.4f}s {per_vertex_time / bulk_time:>7.0f}x")
+        bpy.data.meshes.remove(obj.data)
+
+
+if __name__ == "__main__":
+    args = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    main([int(arg) for arg in args] or [10_000, 100_000, 1_000_000])
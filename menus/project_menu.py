@@ -22,6 +22,9 @@ def draw_project(layout, context):
     layout.operator("dh.dcc_importer", text="DCC Import")
     layout.operator("dh.dcc_exporter", text="DCC Export")
     layout.operator("dh.dcc_split_exporter", text="Multi FBX Export") # new operator 
+    layout.operator("dh.export_pipeline", text="Multi-Format Export")
+    layout.operator("dh.stream_export", text="Stream OBJ/PLY Export")
+    layout.operator("dh.export_store_gc", text="Clean Export Archive")
 
 
 
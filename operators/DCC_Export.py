@@ -1,8 +1,12 @@
 import bpy
 import os
-import re # Import the regular expression module
 import subprocess # Import for opening the folder
 import sys # Import for checking the operating system
+import time
+from ..utlity.export_progress import ExportProgress
+from ..utlity.version_index import VersionIndex
+from ..utlity.export_manifest import break_hard_link
+from ..utlity.export_store import ExportStore, POINTER_SUFFIX
 
 class DH_OP_dcc_export(bpy.types.Operator):
     """Exports selected objects to an FBX file with version control"""
@@ -40,6 +44,12 @@ class DH_OP_dcc_export(bpy.types.Operator):
         default=False,
     ) # type: ignore
 
+    archive: bpy.props.BoolProperty(
+        name="Archive Mode",
+        description="Keep each export once in FBX/.store (by content) and hard-link it into the version folder, so unchanged versions take no extra space",
+        default=False,
+    ) # type: ignore
+
     def invoke(self, context, event):
         # If there is a single selected object, set the default export name
         if len(context.selected_objects) == 1:
@@ -55,6 +65,7 @@ class DH_OP_dcc_export(bpy.types.Operator):
         layout.prop(self, "overwrite", text="Overwrite Latest")
         layout.prop(self, "open_folder", text="Open Folder After")
         layout.prop(self, "ignore_suffix", text="Ignore Suffix")
+        layout.prop(self, "archive", text="Archive Mode")
 
     def execute(self, context):
         # --- 1. Get Base Path ---
@@ -76,29 +87,9 @@ class DH_OP_dcc_export(bpy.types.Operator):
         fbx_filename = f"{object_name}.fbx"
 
         # --- 3. Determine Version Folder ---
-        version_num = 0
-        latest_version_folder = ""
-
-        # Find the highest existing version number
-        try:
-            version_pattern = re.compile(r"^v(\d{3})$") # Matches "v" followed by 3 digits
-            for item in os.listdir(fbx_directory):
-                item_path = os.path.join(fbx_directory, item)
-                if os.path.isdir(item_path):
-                    match = version_pattern.match(item)
-                    if match:
-                        num = int(match.group(1))
-                        if num > version_num:
-                            version_num = num
-        except FileNotFoundError:
-             # This shouldn't happen since we create fbx_directory, but handle just in case
-             pass
-
-        # Decide which version number to use
-        if version_num > 0:
-            latest_version_folder = os.path.join(
-                fbx_directory, f"v{str(version_num).zfill(3)}"
-            )
+        # Cached index: two stats on the fast path, full rescan if it's missing or stale
+        self.version_index = VersionIndex(fbx_directory)
+        version_num = self.version_index.latest
 
         if self.overwrite:
             version_to_use = max(1, version_num)
@@ -106,39 +97,95 @@ class DH_OP_dcc_export(bpy.types.Operator):
             if version_num == 0:
                 version_to_use = 1
             else:
-                latest_file = os.path.join(latest_version_folder, fbx_filename)
-                if os.path.exists(latest_file):
+                latest_files = self.version_index.latest_files
+                if fbx_filename in latest_files or fbx_filename + POINTER_SUFFIX in latest_files:
                     version_to_use = version_num + 1
                 else:
                     version_to_use = version_num
 
-        version_folder = os.path.join(fbx_directory, f"v{str(version_to_use).zfill(3)}")
+        version_folder = self.version_index.folder(version_to_use)
         os.makedirs(version_folder, exist_ok=True) # Create the folder if it doesn't exist
+        self.version_num = version_to_use
 
         # --- 4. Set Full Export Path ---
         export_path = os.path.join(version_folder, fbx_filename)
 
-        # --- 5. Export ---
+        # --- 5. Export (Modal) ---
+        # One FBX holds the whole selection, so there is a single export call. Going
+        # modal lets the overlay (with an ETA from recent exports) draw first and ESC
+        # cancel before the call starts.
+        self.export_path = export_path
+        self.store = ExportStore(fbx_directory) if self.archive else None
+        self.version_folder = version_folder
+        self.object_count = len(context.selected_objects)
+        self.ticks = 0
+        self.progress = ExportProgress(f"FBX export ({self.object_count} objects)", 1, self.object_count)
+
+        wm = context.window_manager
+        self.progress.start(context)
+        self._timer = wm.event_timer_add(0.05, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self.end_modal(context)
+            self.report({'WARNING'}, "FBX export cancelled")
+            return {'CANCELLED'}
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        # First tick only lets the viewport draw the overlay
+        self.ticks += 1
+        if self.ticks < 2:
+            return {'RUNNING_MODAL'}
+
+        start = time.perf_counter()
+        if self.store:
+            # Export next to the blobs, then file it under its content hash
+            target_path = self.store.incoming_path(os.path.basename(self.export_path))
+        else:
+            # An archived version is a hard link into the store - don't write through it
+            break_hard_link(self.export_path)
+            target_path = self.export_path
         try:
             bpy.ops.export_scene.fbx(
-                filepath=export_path,
+                filepath=target_path,
                 use_selection=True,
                 # Add any other specific FBX settings you need here
                 # e.g., apply_scale_options='FBX_SCALE_ALL', object_types={'MESH', 'ARMATURE'}, etc.
                 check_existing=False # We handle versioning, let Blender overwrite if needed
             )
+            if self.store:
+                key, is_new = self.store.add(target_path)
+                placed_path = self.store.place(key, self.export_path)
+                state = "new blob" if is_new else "identical to an earlier export, stored once"
+                print(f"📦 Archived {os.path.basename(self.export_path)} as {key[:12]} ({state})")
+                if placed_path != self.export_path:
+                    self.report({'WARNING'}, "Hard links not supported here - wrote a pointer file into the version folder")
         except Exception as e:
+            self.end_modal(context)
             self.report({'ERROR'}, f"Export failed: {e}")
             return {'CANCELLED'}
 
-        self.report({'INFO'}, f"FBX exported to: {export_path}")
+        self.progress.record(os.path.basename(self.export_path), time.perf_counter() - start, self.object_count)
+        self.progress.update(1)
+        self.end_modal(context)
+        self.version_index.record_export(self.version_num)
+
+        self.report({'INFO'}, f"FBX exported to: {self.export_path}")
 
         # --- 6. Open Folder (Optional) ---
         if self.open_folder:
-            self.open_file_explorer(version_folder)
+            self.open_file_explorer(self.version_folder)
 
         return {'FINISHED'}
 
+    def end_modal(self, context):
+        context.window_manager.event_timer_remove(self._timer)
+        self.progress.finish()
+
     def open_file_explorer(self, path):
         """Opens the given path in the system's file explorer."""
         real_path = os.path.realpath(path) # Get the absolute path
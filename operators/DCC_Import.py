@@ -1,8 +1,10 @@
 import bpy
+import os
+from ..utlity.dcc_bridge import exchange_directory, newest_exchange_file, import_exchange_file
 
 class DH_OP_dcc_import(bpy.types.Operator):
     
-    ## imports objects from temp folder from other DCC's
+    ## imports objects from the bridge exchange folder written by other DCC's
     
     bl_idname = "dh.dcc_importer"
     bl_label = "DCC_Import"
@@ -25,6 +27,18 @@ class DH_OP_dcc_import(bpy.types.Operator):
     
     
     def execute(self, context):
-        directory = 'C:\\temp\\exported.obj'
-        bpy.ops.import_scene.obj(filepath = directory)
-        return {'FINISHED'}
\ No newline at end of file
+        directory = exchange_directory()
+        filepath = newest_exchange_file(directory)
+        if filepath is None:
+            self.report({'WARNING'}, f"Nothing to import in {directory}")
+            return {'CANCELLED'}
+
+        try:
+            objects, reused = import_exchange_file(context, filepath)
+        except Exception as e:
+            self.report({'ERROR'}, f"Import failed: {e}")
+            return {'CANCELLED'}
+
+        action = "Reused" if reused else "Imported"
+        self.report({'INFO'}, f"{action} {len(objects)} objects from {os.path.basename(filepath)}")
+        return {'FINISHED'}
@@ -8,6 +8,9 @@ from .open_proj_dir import DH_OP_Open_Proj_Dir
 from .DCC_Export import DH_OP_dcc_export
 from .mask_tools import DH_OP_MaskExtract
 from .export_fbx_multi import DH_OP_dcc_split_export
+from .export_pipeline import DH_OP_export_pipeline
+from .stream_export import DH_OP_stream_export
+from .export_store_gc import DH_OP_export_store_gc
 from .collection_tools import (DH_OP_MoveToNewCollection,DH_OP_SelectAllInCollection)
 from .project_manager import (
     DH_OP_CreateProjectDirectories,
@@ -33,7 +36,7 @@ from .utils import DH_OT_smart_hide
 from .cycle_vertex_groups import DH_OP_CycleVertexGroups
 from .shader_builder import DH_OP_BuildShader
 from .weight_fill_shell import DH_OP_WeightFillModal
-from .scene_cleanup import DH_OP_comprehensive_cleanup, DH_OP_cleanup_dialog
+from .scene_cleanup import DH_OP_comprehensive_cleanup, DH_OP_cleanup_dialog, DH_OP_export_cleanup_plan
 
 
 # classes tuple
@@ -48,6 +51,9 @@ classes = (
     DH_OP_dcc_export,
     DH_OP_MaskExtract,
     DH_OP_dcc_split_export, 
+    DH_OP_export_pipeline,
+    DH_OP_stream_export,
+    DH_OP_export_store_gc,
     SetMultiresViewportLevelsMax,
     SetMultiresViewportLevelsZero,
     ApplyMultiresBase,
@@ -68,6 +74,7 @@ classes = (
     DH_OP_comprehensive_cleanup,
     DH_OP_multires_level_modal,
     DH_OP_cleanup_dialog,
+    DH_OP_export_cleanup_plan,
     DH_OP_MultiresSubdivide,
     DH_OP_AddMultires,
     DH_OP_MoveToNewCollection,
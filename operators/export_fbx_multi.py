@@ -1,8 +1,19 @@
 import bpy
 import os
-import re  # Import the regular expression module
 import subprocess  # Import for opening the folder
 import sys  # Import for checking the operating system
+import time
+from ..utlity.export_manifest import (
+    object_content_hash,
+    read_manifest,
+    write_manifest,
+    link_or_copy,
+    break_hard_link,
+)
+from ..utlity.export_farm import ExportFarm
+from ..utlity.export_progress import ExportProgress
+from ..utlity.version_index import VersionIndex
+from ..utlity.lod_chain import LodChain, parse_lod_ratios, lod_file_names
 
 class DH_OP_dcc_split_export(bpy.types.Operator):
     """Exports each selected object as its own FBX file with version control"""
@@ -10,6 +21,8 @@ class DH_OP_dcc_split_export(bpy.types.Operator):
     bl_label = "DCC Split Exporter"
     bl_options = {'REGISTER', 'UNDO'}
 
+    _farm = None
+
     overwrite: bpy.props.BoolProperty(
         name="Overwrite Latest Version",
         description="If unchecked, it will create a new versioned folder. If checked, it uses the latest version folder.",
@@ -22,6 +35,38 @@ class DH_OP_dcc_split_export(bpy.types.Operator):
         default=True,
     ) # type: ignore
 
+    only_changed: bpy.props.BoolProperty(
+        name="Export Only Changed",
+        description="Hash each object (evaluated mesh, materials, transform) and hard-link unchanged files from the latest version instead of re-exporting",
+        default=False,
+    ) # type: ignore
+
+    keep_selection: bpy.props.BoolProperty(
+        name="Keep Selection",
+        description="Export each object from a temporary collection instead of re-selecting it, so large scenes don't pay a full deselect per object",
+        default=True,
+    ) # type: ignore
+
+    lod_chain: bpy.props.BoolProperty(
+        name="Export LOD Chain",
+        description="Write name_LOD0..N.fbx per object, each LOD decimated from the previous one. No modifiers are left on the objects",
+        default=False,
+    ) # type: ignore
+
+    lod_ratios: bpy.props.StringProperty(
+        name="LOD Ratios",
+        description="Comma-separated face ratio per LOD, relative to the full-res evaluated mesh",
+        default="1.0, 0.5, 0.25, 0.1",
+    ) # type: ignore
+
+    workers: bpy.props.IntProperty(
+        name="Background Workers",
+        description="0 exports inside this session. 1 or more exports in that many background Blender processes, keeping the UI responsive",
+        default=0,
+        min=0,
+        max=32,
+    ) # type: ignore
+
     def invoke(self, context, event):
         # Simply open the dialog for options
         return context.window_manager.invoke_props_dialog(self)
@@ -30,6 +75,15 @@ class DH_OP_dcc_split_export(bpy.types.Operator):
         layout = self.layout
         layout.prop(self, "overwrite", text="Overwrite Latest")
         layout.prop(self, "open_folder", text="Open Folder After")
+        layout.prop(self, "only_changed", text="Only Changed")
+        layout.prop(self, "keep_selection", text="Keep Selection")
+        layout.prop(self, "lod_chain", text="LOD Chain")
+        row = layout.row()
+        row.enabled = self.lod_chain
+        row.prop(self, "lod_ratios", text="Ratios")
+        row = layout.row()
+        row.enabled = not self.lod_chain
+        row.prop(self, "workers", text="Background Workers")
 
     def execute(self, context):
         # --- 1. Get Base Path ---
@@ -51,29 +105,24 @@ class DH_OP_dcc_split_export(bpy.types.Operator):
             self.report({'ERROR'}, "No objects selected for export.")
             return {'CANCELLED'}
 
+        self.ratios = []
+        if self.lod_chain:
+            try:
+                self.ratios = parse_lod_ratios(self.lod_ratios)
+            except ValueError as e:
+                self.report({'ERROR'}, f"Invalid LOD ratios: {e}")
+                return {'CANCELLED'}
+
         # --- 3. Determine Version Folder ---
-        version_num = 0
+        # Cached index: two stats on the fast path, full rescan if it's missing or stale
+        self.version_index = VersionIndex(split_fbx_directory)
+        version_num = self.version_index.latest
+        latest_files = self.version_index.latest_files
         latest_version_folder = ""
 
-        # Find the highest existing version number
-        try:
-            version_pattern = re.compile(r"^v(\d{3})$") # Matches "v" followed by 3 digits
-            for item in os.listdir(split_fbx_directory):
-                item_path = os.path.join(split_fbx_directory, item)
-                if os.path.isdir(item_path):
-                    match = version_pattern.match(item)
-                    if match:
-                        num = int(match.group(1))
-                        if num > version_num:
-                            version_num = num
-        except FileNotFoundError:
-            pass # Folder exists or is created
-
         # Decide which version number to use
         if version_num > 0:
-            latest_version_folder = os.path.join(
-                split_fbx_directory, f"v{str(version_num).zfill(3)}"
-            )
+            latest_version_folder = self.version_index.folder(version_num)
 
         if self.overwrite:
             version_to_use = max(1, version_num)
@@ -81,62 +130,272 @@ class DH_OP_dcc_split_export(bpy.types.Operator):
             if version_num == 0:
                 version_to_use = 1
             else:
-                file_exists = False
-                for obj in selected_objects:
-                    check_path = os.path.join(latest_version_folder, f"{obj.name}.fbx")
-                    if os.path.exists(check_path):
-                        file_exists = True
-                        break
+                file_exists = any(
+                    file_name in latest_files for obj in selected_objects for file_name in self.file_names(obj.name)
+                )
                 if file_exists:
                     version_to_use = version_num + 1
                 else:
                     version_to_use = version_num
 
-        version_folder = os.path.join(split_fbx_directory, f"v{str(version_to_use).zfill(3)}")
+        version_folder = self.version_index.folder(version_to_use)
         os.makedirs(version_folder, exist_ok=True)
+        self.version_num = version_to_use
 
-        # --- 4. Loop Through and Export ---
-        exported_count = 0
-        try:
-            for obj in selected_objects:
-                # Only export mesh objects (optional, but good practice)
-                if obj.type != 'MESH':
-                    print(f"Skipping non-mesh object: {obj.name}")
+        # --- 4. Load Previous Manifest (Incremental Mode) ---
+        previous_hashes = {}
+        self.new_hashes = read_manifest(version_folder) if self.only_changed else {}
+        if self.only_changed and latest_version_folder:
+            previous_hashes = read_manifest(latest_version_folder)
+        depsgraph = context.evaluated_depsgraph_get()
+
+        self.version_folder = version_folder
+        self.exported_count = 0
+        self.reused_count = 0
+        self.failed_names = []
+        self.start_time = time.perf_counter()
+
+        # --- 5. Work Out What Needs Exporting ---
+        to_export = []
+        self.pending_hashes = {}
+        for obj in selected_objects:
+            # Only export mesh objects (optional, but good practice)
+            if obj.type != 'MESH':
+                print(f"Skipping non-mesh object: {obj.name}")
+                continue
+
+            file_names = self.file_names(obj.name)
+            fbx_files = [os.path.join(version_folder, file_name) for file_name in file_names]
+
+            if self.only_changed:
+                content_hash = object_content_hash(obj, depsgraph)
+                if self.ratios:
+                    content_hash += "-lod" + ",".join(f"{ratio:g}" for ratio in self.ratios)
+                if previous_hashes.get(obj.name) == content_hash and all(name in latest_files for name in file_names):
+                    # Unchanged - same bytes as last time, just link them into this version
+                    for file_name, fbx_file in zip(file_names, fbx_files):
+                        link_or_copy(os.path.join(latest_version_folder, file_name), fbx_file)
+                    self.new_hashes[obj.name] = content_hash
+                    self.reused_count += 1
                     continue
+                # Only recorded once the export actually succeeds
+                self.pending_hashes[obj.name] = content_hash
 
-                # Deselect all objects
-                bpy.ops.object.select_all(action='DESELECT')
+            to_export.append((obj, fbx_files))
 
-                # Select and make active the current object
-                obj.select_set(True)
-                context.view_layer.objects.active = obj
+        # Remembered by name - the user can keep working while the export runs
+        self.selected_names = [obj.name for obj in selected_objects]
+        self.active_name = active_object.name if active_object else None
 
-                # Set the output FBX file path
-                fbx_file = os.path.join(version_folder, f"{obj.name}.fbx")
+        if not to_export:
+            if self.only_changed:
+                write_manifest(version_folder, self.new_hashes)
+            self.version_index.record_export(version_to_use)
+            return self.finish_export(context)
 
-                # Export the current object
-                bpy.ops.export_scene.fbx(
-                    filepath=fbx_file,
-                    use_selection=True,
-                    # Add any other specific FBX settings you need here
-                    check_existing=False # Let it overwrite within the target folder
-                )
-                exported_count += 1
+        self.progress = ExportProgress("Split export", len(to_export))
+        if self.ratios:
+            # Workers would need the chain too - LODs are built in this session
+            self.progress.label = f"Split export ({len(self.ratios)} LODs)"
+        elif self.workers > 0:
+            return self.start_farm(context, to_export)
 
-        except Exception as e:
-            self.report({'ERROR'}, f"Export failed during loop: {e}")
+        # --- 6. Export One Object Per Timer Tick ---
+        self.queue = [(obj.name, fbx_files) for obj, fbx_files in to_export]
+        self.next_index = 0
+        self.export_collections = []
+        if self.keep_selection:
+            self.export_collections = self.make_export_collections([obj for obj, _ in to_export])
+        return self.start_modal(context, 0.01)
+
+    def make_export_collections(self, objects):
+        """One unlinked collection per object, all made up front.
+
+        The FBX exporter's `collection` source exports exactly that collection's
+        objects, so nothing has to be (de)selected per export. Creating them in one
+        go means the depsgraph relations are rebuilt once, not once per object.
+        """
+        names = []
+        for obj in objects:
+            collection = bpy.data.collections.new(f"DH_SplitExport_{obj.name}")
+            collection.objects.link(obj)
+            names.append(collection.name)
+        return names
+
+    def remove_export_collections(self):
+        collections = [bpy.data.collections.get(name) for name in self.export_collections]
+        bpy.data.batch_remove([collection for collection in collections if collection])
+        self.export_collections = []
+
+    def file_names(self, name):
+        """Files one object produces in a version folder"""
+        if self.ratios:
+            return lod_file_names(name, len(self.ratios))
+        return [f"{name}.fbx"]
+
+    def mark_exported(self, name):
+        if name in self.pending_hashes:
+            self.new_hashes[name] = self.pending_hashes.pop(name)
+
+    def start_modal(self, context, interval):
+        wm = context.window_manager
+        wm.progress_begin(0, self.progress.total)
+        self.progress.start(context)
+        self._timer = wm.event_timer_add(interval, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            if self._farm:
+                self._farm.cancel()
+            self.end_modal(context)
+            self.report({'WARNING'}, f"Split export cancelled after {self.progress.done}/{self.progress.total} objects")
             return {'CANCELLED'}
-        finally:
-            # --- 5. Restore Original Selection ---
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        if self._farm:
+            running = self.poll_farm(context)
+        else:
+            running = self.export_next(context)
+        context.window_manager.progress_update(self.progress.done)
+        if running:
+            return {'RUNNING_MODAL'}
+
+        self.end_modal(context)
+        return self.finish_export(context)
+
+    def export_next(self, context):
+        """Export one queued object (or its whole LOD chain); False once the queue is empty"""
+        name, fbx_files = self.queue[self.next_index]
+        collection = self.export_collections[self.next_index] if self.export_collections else None
+        self.next_index += 1
+
+        obj = context.view_layer.objects.get(name)
+        start = time.perf_counter()
+        try:
+            if obj is None:
+                raise KeyError("object was removed during the export")
+
+            if self.ratios:
+                with LodChain(obj, context.evaluated_depsgraph_get(), self.ratios) as chain:
+                    for mesh, fbx_file in zip(chain.meshes, fbx_files):
+                        chain.use(mesh)
+                        self.export_object(context, obj, fbx_file, collection)
+            else:
+                self.export_object(context, obj, fbx_files[0], collection)
+
+            self.progress.record(name, time.perf_counter() - start)
+            self.exported_count += 1
+            self.mark_exported(name)
+        except Exception as e:
+            print(f"❌ Export failed: {name}: {e}")
+            self.failed_names.append(name)
+
+        self.progress.update(self.next_index, name)
+        return self.next_index < len(self.queue)
+
+    def export_object(self, context, obj, fbx_file, collection):
+        # Unchanged objects are hard-linked between versions - don't write through the link
+        break_hard_link(fbx_file)
+
+        if collection:
+            # Export straight from the object's temp collection - selection untouched
+            bpy.ops.export_scene.fbx(
+                filepath=fbx_file,
+                collection=collection,
+                check_existing=False
+            )
+            return
+
+        # Deselect all objects
+        bpy.ops.object.select_all(action='DESELECT')
+
+        # Select and make active the current object
+        obj.select_set(True)
+        context.view_layer.objects.active = obj
+
+        # Export the current object
+        bpy.ops.export_scene.fbx(
+            filepath=fbx_file,
+            use_selection=True,
+            # Add any other specific FBX settings you need here
+            check_existing=False # Let it overwrite within the target folder
+        )
+
+    def end_modal(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        self.progress.finish()
+
+        if self._farm:
+            self._farm.cleanup()
+        elif self.export_collections:
+            self.remove_export_collections()
+        else:
+            # --- 7. Restore Original Selection ---
+            view_layer = context.view_layer
             bpy.ops.object.select_all(action='DESELECT')
-            for obj in selected_objects:
-                obj.select_set(True)
-            context.view_layer.objects.active = active_object
+            for name in self.selected_names:
+                obj = view_layer.objects.get(name)
+                if obj:
+                    obj.select_set(True)
+            view_layer.objects.active = view_layer.objects.get(self.active_name) if self.active_name else None
+
+        if self.only_changed:
+            write_manifest(self.version_folder, self.new_hashes)
+        self.version_index.record_export(self.version_num)
+
+    # --- Background Worker Mode ---
 
+    def start_farm(self, context, to_export):
+        """Hand the export list to background Blender processes and go modal"""
+        jobs = [(obj.name, fbx_files[0]) for obj, fbx_files in to_export]
+        for _, fbx_file in jobs:
+            break_hard_link(fbx_file)
+        weights = [len(obj.data.polygons) for obj, _ in to_export]
+        self._farm = ExportFarm(jobs, self.workers, weights)
+        self.recorded = set()
+        try:
+            self._farm.start()
+        except Exception as e:
+            self._farm.cancel()
+            self._farm.cleanup()
+            self._farm = None
+            self.report({'ERROR'}, f"Could not start export workers: {e}")
+            return {'CANCELLED'}
+
+        self.progress.label = f"Split export ({len(self._farm.processes)} workers)"
+        return self.start_modal(context, 0.1)
+
+    def poll_farm(self, context):
+        farm = self._farm
+        running = farm.poll()
+        for index in sorted(set(farm.durations) - self.recorded):
+            name = farm.jobs[index][0]
+            self.progress.record(name, farm.durations[index])
+            self.mark_exported(name)
+            self.recorded.add(index)
+        self.exported_count = len(farm.durations)
+        self.failed_names = [farm.jobs[index][0] for index in sorted(farm.failed)]
+        self.progress.update(farm.done_count)
+        return running
+
+    def finish_export(self, context):
+        elapsed = time.perf_counter() - self.start_time
+        version_folder = self.version_folder
+        if self.only_changed:
+            self.report({'INFO'}, f"Exported {self.exported_count} changed, reused {self.reused_count} unchanged objects in {elapsed:.1f}s to: {version_folder}")
+        else:
+            self.report({'INFO'}, f"Exported {self.exported_count} objects in {elapsed:.1f}s to: {version_folder}")
 
-        self.report({'INFO'}, f"Exported {exported_count} objects to: {version_folder}")
+        if self.failed_names:
+            self.report({'WARNING'}, f"{len(self.failed_names)} objects failed to export: {', '.join(self.failed_names[:5])}")
 
-        # --- 6. Open Folder (Optional) ---
+        # --- 8. Open Folder (Optional) ---
         if self.open_folder:
             self.open_file_explorer(version_folder)
 
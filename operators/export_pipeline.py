@@ -0,0 +1,138 @@
+import bpy
+import os
+import subprocess # Import for opening the folder
+import sys # Import for checking the operating system
+import time
+from ..utlity.export_formats import EXPORT_FORMATS, EXPORT_FORMAT_ITEMS, BakedModifiers, run_exporter
+from ..utlity.version_index import VersionIndex
+from ..utlity.export_store import POINTER_SUFFIX
+
+class DH_OP_export_pipeline(bpy.types.Operator):
+    """Exports the selection to several formats from one modifier evaluation, with version control"""
+    bl_idname = "dh.export_pipeline"
+    bl_label = "Multi-Format Export"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    export_name: bpy.props.StringProperty(
+        name="Export Name",
+        description="Name of the exported files (without extension)",
+        default="exported"
+    ) # type: ignore
+
+    formats: bpy.props.EnumProperty(
+        name="Formats",
+        description="Formats to write - each goes into its own versioned folder next to the blend folder",
+        items=EXPORT_FORMAT_ITEMS,
+        options={'ENUM_FLAG'},
+        default={'FBX', 'GLTF', 'OBJ'},
+    ) # type: ignore
+
+    overwrite: bpy.props.BoolProperty(
+        name="Overwrite Latest Version",
+        description="If unchecked, it will create a new versioned folder. If checked, it uses the latest version folder.",
+        default=False,
+    ) # type: ignore
+
+    open_folder: bpy.props.BoolProperty(
+        name="Open Folder After Export",
+        description="Opens the first format's folder in your file explorer after a successful export",
+        default=False,
+    ) # type: ignore
+
+    def invoke(self, context, event):
+        # If there is a single selected object, set the default export name
+        if len(context.selected_objects) == 1:
+            active_object = context.view_layer.objects.active
+            if active_object:
+                self.export_name = active_object.name
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "export_name", text="File Name")
+        layout.label(text="Formats:")
+        layout.prop(self, "formats", expand=True)
+        layout.prop(self, "overwrite", text="Overwrite Latest")
+        layout.prop(self, "open_folder", text="Open Folder After")
+
+    def execute(self, context):
+        # --- 1. Get Base Path ---
+        filepath = bpy.data.filepath
+        if not filepath:
+            self.report({'ERROR'}, "Please save the .blend file before exporting.")
+            return {'CANCELLED'}
+        if not self.formats:
+            self.report({'ERROR'}, "Pick at least one format.")
+            return {'CANCELLED'}
+        if not context.selected_objects:
+            self.report({'ERROR'}, "No objects selected for export.")
+            return {'CANCELLED'}
+
+        directory = os.path.dirname(filepath)
+        parent_directory = os.path.abspath(os.path.join(directory, os.pardir))
+        formats = [entry for entry in EXPORT_FORMATS if entry[0] in self.formats]
+
+        # --- 2. Determine Version (shared, so one run lands in the same vNNN everywhere) ---
+        indices = {}
+        version_to_use = 1
+        for key, _, folder, extension, _, _ in formats:
+            index = VersionIndex(os.path.join(parent_directory, folder))
+            file_name = f"{self.export_name}{extension}"
+            indices[key] = index
+            if self.overwrite or index.latest == 0:
+                version = max(1, index.latest)
+            # Archive mode leaves a pointer file instead where hard links aren't supported
+            elif any(name in index.latest_files for name in (file_name, file_name + POINTER_SUFFIX)):
+                version = index.latest + 1
+            else:
+                version = index.latest
+            version_to_use = max(version_to_use, version)
+
+        # --- 3. Evaluate Once, Export Every Format ---
+        written = []
+        timings = []
+        start = time.perf_counter()
+        depsgraph = context.evaluated_depsgraph_get()
+        try:
+            with BakedModifiers(context.selected_objects, depsgraph) as baked:
+                bake_time = time.perf_counter() - start
+                print(f"⏱️ Baked modifiers on {len(baked.objects)} objects in {bake_time:.3f}s")
+
+                for key, label, _, extension, operator, preset in formats:
+                    version_folder = indices[key].folder(version_to_use)
+                    os.makedirs(version_folder, exist_ok=True)
+                    export_path = os.path.join(version_folder, f"{self.export_name}{extension}")
+
+                    format_start = time.perf_counter()
+                    run_exporter(operator, export_path, preset)
+                    timings.append((label, time.perf_counter() - format_start))
+                    written.append(export_path)
+                    indices[key].record_export(version_to_use)
+        except Exception as e:
+            self.report({'ERROR'}, f"Export failed: {e}")
+            return {'CANCELLED'}
+
+        for label, seconds in timings:
+            print(f"   {label}: {seconds:.3f}s")
+        elapsed = time.perf_counter() - start
+        self.report({'INFO'}, f"Exported {', '.join(label for label, _ in timings)} (v{str(version_to_use).zfill(3)}) in {elapsed:.1f}s")
+
+        # --- 4. Open Folder (Optional) ---
+        if self.open_folder and written:
+            self.open_file_explorer(os.path.dirname(written[0]))
+
+        return {'FINISHED'}
+
+    def open_file_explorer(self, path):
+        """Opens the given path in the system's file explorer."""
+        real_path = os.path.realpath(path) # Get the absolute path
+        try:
+            if sys.platform == "win32":
+                subprocess.Popen(['explorer', real_path])
+            elif sys.platform == "darwin": # macOS
+                subprocess.Popen(['open', real_path])
+            else: # Linux and other Unix-like systems
+                subprocess.Popen(['xdg-open', real_path])
+        except Exception as e:
+            print(f"Could not open folder: {e}")
+            self.report({'WARNING'}, f"Could not open folder: {e}")
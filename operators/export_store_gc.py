@@ -0,0 +1,41 @@
+import bpy
+import os
+from ..utlity.export_store import ExportStore
+
+class DH_OP_export_store_gc(bpy.types.Operator):
+    """Deletes archived FBX exports that no version folder uses any more and reports the space reclaimed"""
+    bl_idname = "dh.export_store_gc"
+    bl_label = "Clean Export Archive"
+    bl_options = {'REGISTER'}
+
+    dry_run: bpy.props.BoolProperty(
+        name="Dry Run",
+        description="Only report what would be deleted",
+        default=False,
+    ) # type: ignore
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.label(text="Delete unreferenced blobs in FBX/.store?")
+        layout.prop(self, "dry_run")
+
+    def execute(self, context):
+        filepath = bpy.data.filepath
+        if not filepath:
+            self.report({'ERROR'}, "Please save the .blend file first.")
+            return {'CANCELLED'}
+
+        directory = os.path.dirname(filepath)
+        parent_directory = os.path.abspath(os.path.join(directory, os.pardir))
+        store = ExportStore(os.path.join(parent_directory, "FBX"))
+
+        removed, reclaimed = store.collect_garbage(dry_run=self.dry_run)
+        size_mb = reclaimed / (1024 * 1024)
+        if self.dry_run:
+            self.report({'INFO'}, f"Would remove {removed} unreferenced blobs, reclaiming {size_mb:.1f} MB")
+        else:
+            self.report({'INFO'}, f"Removed {removed} unreferenced blobs, reclaimed {size_mb:.1f} MB")
+        return {'FINISHED'}
@@ -1,5 +1,18 @@
 import bpy
-from mathutils import Vector
+import bmesh
+import time
+import numpy as np
+from mathutils import Matrix
+from ..utlity.mesh_fingerprint import MeshFingerprintCache, read_vertex_coords, frame_to_frame_matrix
+from ..utlity.cleanup_analysis import analyze_meshes
+from ..utlity.cleanup_plan import (
+    build_cleanup_plan,
+    get_cached_plan,
+    clear_cached_plan,
+    find_datablock_duplicates,
+)
+from ..utlity.dupe_index import get_dupe_index
+from ..utlity.orphan_purge import PURGE_TYPE_ITEMS, DEFAULT_PURGE_TYPES, purge_orphans, format_bytes
 
 class DH_OP_cleanup_dialog(bpy.types.Operator):
     """Dialog to choose what cleanup operations to perform"""
@@ -20,6 +33,12 @@ class DH_OP_cleanup_dialog(bpy.types.Operator):
         default=True
     )
     
+    merge_instanced_dupes: bpy.props.BoolProperty(
+        name="Merge Instanced Duplicates",
+        description="Relink identical meshes (even moved, rotated or scaled inside the mesh data) to one shared mesh",
+        default=False
+    )
+    
     cleanup_meshes: bpy.props.BoolProperty(
         name="Clean Mesh Data",
         description="Merge vertices, remove doubles, dissolve degenerate faces",
@@ -44,6 +63,22 @@ class DH_OP_cleanup_dialog(bpy.types.Operator):
         default=True
     )
     
+    purge_types: bpy.props.EnumProperty(
+        name="Purge Types",
+        description="Which kinds of orphan data to purge",
+        items=PURGE_TYPE_ITEMS,
+        options={'ENUM_FLAG'},
+        default=DEFAULT_PURGE_TYPES
+    )
+    
+    analysis_workers: bpy.props.IntProperty(
+        name="Analysis Workers",
+        description="Worker processes for duplicate/degenerate analysis (1 = analyze on the main thread as needed)",
+        default=1,
+        min=1,
+        max=32
+    )
+    
     # Preview data
     overlapping_count: bpy.props.IntProperty(default=0)
     datablock_count: bpy.props.IntProperty(default=0)
@@ -53,6 +88,10 @@ class DH_OP_cleanup_dialog(bpy.types.Operator):
         self.scan_duplicates(context)
         return context.window_manager.invoke_props_dialog(self, width=400)
     
+    def cancel(self, context):
+        # The scene can be edited before the dialog is opened again - don't let that run reuse this scan
+        clear_cached_plan()
+    
     def draw(self, context):
         layout = self.layout
         
@@ -78,6 +117,8 @@ class DH_OP_cleanup_dialog(bpy.types.Operator):
         else:
             row.label(text="(none found)", icon='CHECKMARK')
         
+        box.prop(self, "merge_instanced_dupes")
+        
         # Mesh cleanup section
         box = layout.box()
         box.label(text="Mesh Cleanup:", icon='MESH_DATA')
@@ -89,80 +130,26 @@ class DH_OP_cleanup_dialog(bpy.types.Operator):
         box.prop(self, "remove_unused_materials")
         box.prop(self, "remove_unused_images")
         box.prop(self, "purge_orphan_data")
+        if self.purge_orphan_data:
+            box.prop(self, "purge_types")
+        
+        layout.prop(self, "analysis_workers")
+        layout.operator("dh.export_cleanup_plan", text="Export Plan (JSON)", icon='EXPORT')
         
         layout.separator()
         layout.label(text="⚠️ This operation cannot be undone!", icon='ERROR')
     
     def scan_duplicates(self, context):
-        """Quick scan to count duplicates for preview using same logic as main functions"""
-        self.overlapping_count = 0
-        self.datablock_count = 0
-        
-        mesh_objects = [ob for ob in context.view_layer.objects if ob.type == 'MESH']
-        
-        # Count overlapping duplicates using bounding box method
-        def get_world_bbox_quick(obj):
-            if obj.type != 'MESH' or not obj.data:
-                return None
-            bbox_corners = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-            min_x = min(corner.x for corner in bbox_corners)
-            max_x = max(corner.x for corner in bbox_corners)
-            min_y = min(corner.y for corner in bbox_corners)
-            max_y = max(corner.y for corner in bbox_corners)
-            min_z = min(corner.z for corner in bbox_corners)
-            max_z = max(corner.z for corner in bbox_corners)
-            return (min_x, max_x, min_y, max_y, min_z, max_z)
-        
-        def bboxes_overlap_quick(bbox1, bbox2):
-            if not (bbox1 and bbox2):
-                return False
-            min_x1, max_x1, min_y1, max_y1, min_z1, max_z1 = bbox1
-            min_x2, max_x2, min_y2, max_y2, min_z2, max_z2 = bbox2
-            x_overlap = not (max_x1 + 0.1 < min_x2 or max_x2 + 0.1 < min_x1)
-            y_overlap = not (max_y1 + 0.1 < min_y2 or max_y2 + 0.1 < min_y1)
-            z_overlap = not (max_z1 + 0.1 < min_z2 or max_z2 + 0.1 < min_z1)
-            return x_overlap and y_overlap and z_overlap
-        
-        def get_basic_signature(obj):
-            if obj.type != 'MESH' or not obj.data:
-                return None
-            mesh = obj.data
-            return (len(mesh.vertices), len(mesh.edges), len(mesh.polygons))
-        
-        processed = set()
-        for i, obj1 in enumerate(mesh_objects):
-            if obj1.name in processed:
-                continue
-            bbox1 = get_world_bbox_quick(obj1)
-            sig1 = get_basic_signature(obj1)
-            if not (bbox1 and sig1):
-                continue
-                
-            for obj2 in mesh_objects[i+1:]:
-                if obj2.name in processed:
-                    continue
-                bbox2 = get_world_bbox_quick(obj2)
-                sig2 = get_basic_signature(obj2)
-                if not (bbox2 and sig2):
-                    continue
-                    
-                if sig1 == sig2 and bboxes_overlap_quick(bbox1, bbox2):
-                    self.overlapping_count += 1
-                    processed.add(obj2.name)
-        
-        # Count data-block duplicates (same as before)
-        mesh_data_users = {}
-        for obj in mesh_objects:
-            mesh_name = obj.data.name
-            if mesh_name not in mesh_data_users:
-                mesh_data_users[mesh_name] = []
-            mesh_data_users[mesh_name].append(obj)
-        
-        for mesh_name, users in mesh_data_users.items():
-            if len(users) > 1:
-                for obj in users[1:]:
-                    if any(suffix in obj.name for suffix in ['.001', '.002', '.003', '.004', '.005']):
-                        self.datablock_count += 1
+        """Scan for duplicates with the exact same logic as the cleanup - the plan is cached for execute"""
+        index = get_dupe_index()
+        if index is not None and get_cached_plan(context) is None:
+            # Live index already knows - execute builds the plan from its warm fingerprints
+            self.overlapping_count, self.datablock_count = index.counts(context.view_layer)
+            return
+        
+        plan = get_cached_plan(context) or build_cleanup_plan(context)
+        self.overlapping_count = len(plan.overlapping)
+        self.datablock_count = len(plan.datablock_dupes)
     
     def execute(self, context):
         # Run the actual cleanup with selected options
@@ -170,10 +157,13 @@ class DH_OP_cleanup_dialog(bpy.types.Operator):
             'INVOKE_DEFAULT',
             remove_overlapping=self.remove_overlapping,
             remove_datablock_dupes=self.remove_datablock_dupes,
+            merge_instanced_dupes=self.merge_instanced_dupes,
             cleanup_meshes=self.cleanup_meshes,
             remove_unused_materials=self.remove_unused_materials,
             remove_unused_images=self.remove_unused_images,
-            purge_orphan_data=self.purge_orphan_data
+            purge_orphan_data=self.purge_orphan_data,
+            purge_types=self.purge_types,
+            analysis_workers=self.analysis_workers
         )
         return {'FINISHED'}
 
@@ -186,15 +176,19 @@ class DH_OP_comprehensive_cleanup(bpy.types.Operator):
     # Options passed from dialog
     remove_overlapping: bpy.props.BoolProperty(default=True)
     remove_datablock_dupes: bpy.props.BoolProperty(default=True)
+    merge_instanced_dupes: bpy.props.BoolProperty(default=False)
     cleanup_meshes: bpy.props.BoolProperty(default=True)
     remove_unused_materials: bpy.props.BoolProperty(default=True)
     remove_unused_images: bpy.props.BoolProperty(default=True)
     purge_orphan_data: bpy.props.BoolProperty(default=True)
+    purge_types: bpy.props.EnumProperty(items=PURGE_TYPE_ITEMS, options={'ENUM_FLAG'}, default=DEFAULT_PURGE_TYPES)
+    analysis_workers: bpy.props.IntProperty(default=1, min=1, max=32)
     
     def execute(self, context):
         stats = {
             'overlapping_objects': 0,
             'datablock_dupes': 0,
+            'instanced_meshes': 0,
             'merged_vertices': 0,
             'cleaned_meshes': 0,
             'unused_materials': 0,
@@ -204,6 +198,29 @@ class DH_OP_comprehensive_cleanup(bpy.types.Operator):
         
         self.report({'INFO'}, "🔥 Starting cleanup...")
         
+        # Exact geometry hashes, computed once per mesh datablock this run
+        # (or kept warm across runs by the live dupe index)
+        index = get_dupe_index()
+        if index is not None:
+            index.flush(context.view_layer)
+            self.fingerprints = index.fingerprints
+        else:
+            self.fingerprints = MeshFingerprintCache(precision=3)
+        
+        # Reuse the preview scan if nothing changed since the dialog opened
+        self.cleanup_plan = get_cached_plan(context)
+        if self.cleanup_plan:
+            self.fingerprints = self.cleanup_plan.fingerprints
+            print("♻️ Scene unchanged since preview - reusing cleanup plan")
+        
+        # 0. Fan the pure-math analysis out to worker processes, apply its plan below
+        self.analysis_plan = None
+        if self.analysis_workers > 1 and (self.remove_overlapping or self.cleanup_meshes):
+            self.analysis_plan = self.run_parallel_analysis(context)
+        
+        if self.cleanup_plan is None and self.remove_overlapping:
+            self.cleanup_plan = build_cleanup_plan(context, self.fingerprints)
+        
         # 1. Remove overlapping duplicates
         if self.remove_overlapping:
             stats['overlapping_objects'] = self.remove_overlapping_objects(context)
@@ -212,6 +229,10 @@ class DH_OP_comprehensive_cleanup(bpy.types.Operator):
         if self.remove_datablock_dupes:
             stats['datablock_dupes'] = self.remove_datablock_duplicates(context)
         
+        # 2b. Relink pose-normalized identical meshes to one shared datablock
+        if self.merge_instanced_dupes:
+            stats['instanced_meshes'] = self.merge_instanced_duplicates(context)
+        
         # 3. Clean mesh data
         if self.cleanup_meshes:
             stats['merged_vertices'], stats['cleaned_meshes'] = self.cleanup_mesh_data(context)
@@ -228,187 +249,223 @@ class DH_OP_comprehensive_cleanup(bpy.types.Operator):
         if self.purge_orphan_data:
             stats['purged_data'] = self.purge_orphan_data_blocks()
         
+        # Scene changed - the plan is stale now
+        clear_cached_plan()
+        
         self.report_results(stats)
         return {'FINISHED'}
     
+    def run_parallel_analysis(self, context):
+        """Export mesh buffers to shared memory and analyze them in a process pool"""
+        meshes = {}
+        for ob in context.view_layer.objects:
+            if ob.type == 'MESH' and ob.data:
+                meshes.setdefault(ob.data.name_full, ob.data)
+        if not meshes:
+            return None
+        
+        start = time.perf_counter()
+        plan = analyze_meshes(list(meshes.values()), workers=self.analysis_workers, precision=self.fingerprints.precision)
+        
+        # Main thread: feed the results back into this run's caches
+        for mesh_name, result in plan.items():
+            self.fingerprints.prime(mesh_name, result['signature'])
+        
+        dirty = sum(1 for result in plan.values() if result['needs_cleanup'])
+        print(f"⏱️ Analyzed {len(plan)} meshes on {self.analysis_workers} workers in "
+              f"{time.perf_counter() - start:.3f}s ({dirty} need mesh cleanup)")
+        return plan
+    
     def remove_overlapping_objects(self, context):
-        """Remove objects that have overlapping bounding boxes and similar geometry"""
-        
-        def get_world_bbox(obj):
-            """Get world-space bounding box corners"""
-            if obj.type != 'MESH' or not obj.data:
-                return None
-            # Transform local bounding box to world space
-            bbox_corners = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-            
-            # Get min/max for each axis
-            min_x = min(corner.x for corner in bbox_corners)
-            max_x = max(corner.x for corner in bbox_corners)
-            min_y = min(corner.y for corner in bbox_corners)
-            max_y = max(corner.y for corner in bbox_corners)
-            min_z = min(corner.z for corner in bbox_corners)
-            max_z = max(corner.z for corner in bbox_corners)
-            
-            return (min_x, max_x, min_y, max_y, min_z, max_z)
-        
-        def bboxes_overlap(bbox1, bbox2, tolerance=0.1):
-            """Check if two bounding boxes overlap with tolerance"""
-            if not (bbox1 and bbox2):
-                return False
-            
-            min_x1, max_x1, min_y1, max_y1, min_z1, max_z1 = bbox1
-            min_x2, max_x2, min_y2, max_y2, min_z2, max_z2 = bbox2
-            
-            # Check overlap on each axis with tolerance
-            x_overlap = not (max_x1 + tolerance < min_x2 or max_x2 + tolerance < min_x1)
-            y_overlap = not (max_y1 + tolerance < min_y2 or max_y2 + tolerance < min_y1)
-            z_overlap = not (max_z1 + tolerance < min_z2 or max_z2 + tolerance < min_z1)
-            
-            return x_overlap and y_overlap and z_overlap
-        
-        def get_mesh_signature(obj):
-            """Get simplified mesh signature for comparison"""
-            if obj.type != 'MESH' or not obj.data:
-                return None
-            mesh = obj.data
-            
-            # Basic stats
-            stats = (len(mesh.vertices), len(mesh.edges), len(mesh.polygons))
-            
-            # Sample some vertices for geometry comparison
-            vert_count = len(mesh.vertices)
-            if vert_count <= 50:
-                # Small mesh - check all vertices in local space
-                verts = tuple(sorted((round(v.co.x, 3), round(v.co.y, 3), round(v.co.z, 3)) 
-                                   for v in mesh.vertices))
-            else:
-                # Large mesh - sample vertices
-                sample_rate = max(1, vert_count // 30)
-                verts = tuple(sorted((round(mesh.vertices[i].co.x, 3), 
-                                    round(mesh.vertices[i].co.y, 3), 
-                                    round(mesh.vertices[i].co.z, 3)) 
-                                   for i in range(0, vert_count, sample_rate)))
-            
-            return (stats, verts)
-        
-        bpy.ops.object.select_all(action='DESELECT')
-        mesh_objects = [ob for ob in context.view_layer.objects if ob.type == 'MESH']
+        """Remove objects that have overlapping bounding boxes and identical geometry (from the scan plan)"""
+        fingerprints = self.fingerprints
+        verified = set()
         overlapping_dupes = []
-        
-        print(f"🔍 Checking {len(mesh_objects)} objects for overlapping bounding boxes...")
-        
-        processed = set()
-        for i, obj1 in enumerate(mesh_objects):
-            if obj1.name in processed:
+        for dupe_name, keep_name in self.cleanup_plan.overlapping:
+            obj = bpy.data.objects.get(dupe_name)
+            keep = bpy.data.objects.get(keep_name)
+            if not obj or not keep:
                 continue
-                
-            bbox1 = get_world_bbox(obj1)
-            sig1 = get_mesh_signature(obj1)
-            if not (bbox1 and sig1):
+            
+            # The plan may predate an edit the scene token can't see - rehash both meshes before deleting
+            for mesh in (obj.data, keep.data):
+                if mesh and mesh.name_full not in verified:
+                    fingerprints.invalidate(mesh.name_full)
+                    verified.add(mesh.name_full)
+            sig = fingerprints.signature(obj)
+            if sig is None or sig != fingerprints.signature(keep):
+                print(f"⚠️ Skipped '{dupe_name}': no longer identical to '{keep_name}'")
                 continue
-                
-            for obj2 in mesh_objects[i+1:]:
-                if obj2.name in processed:
-                    continue
-                    
-                bbox2 = get_world_bbox(obj2)
-                sig2 = get_mesh_signature(obj2)
-                if not (bbox2 and sig2):
-                    continue
-                
-                # Check if they have similar geometry first (faster)
-                if sig1[0] == sig2[0]:  # Same basic stats
-                    # Now check if bounding boxes overlap
-                    if bboxes_overlap(bbox1, bbox2, tolerance=0.1):
-                        # If they also have similar vertex data, they're overlapping duplicates
-                        if sig1 == sig2:
-                            overlapping_dupes.append(obj2)
-                            processed.add(obj2.name)
-                            print(f"💀 Overlapping bboxes: '{obj2.name}' overlaps '{obj1.name}'")
-                        else:
-                            # Same basic stats and overlapping but different geometry - just warn
-                            print(f"⚠️ Bbox overlap but different geometry: '{obj2.name}' and '{obj1.name}'")
+            overlapping_dupes.append(obj)
         
         # Delete overlapping duplicates
-        for obj in overlapping_dupes:
-            if obj.name in context.view_layer.objects:
-                obj.select_set(True)
-        
-        if overlapping_dupes:
-            bpy.ops.object.delete(use_global=False)
-        
-        return len(overlapping_dupes)
+        return self.delete_objects(context, overlapping_dupes, "overlapping")
     
     def remove_datablock_duplicates(self, context):
         """Remove objects sharing mesh data with auto-generated names"""
+        # Cheap O(n) pass - redone live since the overlap step may have removed users
         mesh_objects = [ob for ob in context.view_layer.objects if ob.type == 'MESH']
         datablock_dupes = []
+        for obj_name, mesh_name in find_datablock_duplicates(mesh_objects):
+            datablock_dupes.append(bpy.data.objects[obj_name])
+            print(f"📐 Data-block dupe: '{obj_name}' shares mesh '{mesh_name}'")
         
-        mesh_data_users = {}
-        for obj in mesh_objects:
-            mesh_name = obj.data.name
-            if mesh_name not in mesh_data_users:
-                mesh_data_users[mesh_name] = []
-            mesh_data_users[mesh_name].append(obj)
-        
-        for mesh_name, users in mesh_data_users.items():
-            if len(users) > 1:
-                for obj in users[1:]:
-                    if any(suffix in obj.name for suffix in ['.001', '.002', '.003', '.004', '.005']):
-                        datablock_dupes.append(obj)
-                        print(f"📐 Data-block dupe: '{obj.name}' shares mesh '{mesh_name}'")
-        
-        for obj in datablock_dupes:
-            if obj.name in context.view_layer.objects:
-                obj.select_set(True)
-        
-        if datablock_dupes:
-            bpy.ops.object.delete(use_global=False)
+        return self.delete_objects(context, datablock_dupes, "data-block")
+    
+    def delete_objects(self, context, objects, label):
+        """Bulk-delete objects straight from bpy.data - no selection, no per-call operator overhead
+
+        Like object.delete(use_global=False) this only takes objects out of the
+        current scene: ones other scenes still use are unlinked, not removed.
+        """
+        doomed = [obj for obj in objects if obj.name in context.view_layer.objects]
+        if not doomed:
+            return 0
+        
+        scene = context.scene
+        shared = [obj for obj in doomed if any(user != scene for user in obj.users_scene)]
+        if shared:
+            scene_collections = {scene.collection, *scene.collection.children_recursive}
+            for obj in shared:
+                for collection in obj.users_collection:
+                    if collection in scene_collections:
+                        collection.objects.unlink(obj)
+            shared_names = {obj.name for obj in shared}
+            doomed_here = [obj for obj in doomed if obj.name not in shared_names]
+        else:
+            doomed_here = doomed
+        
+        names = [obj.name for obj in doomed_here]
+        start = time.perf_counter()
+        try:
+            bpy.data.batch_remove(doomed_here)
+        except (AttributeError, RuntimeError) as e:
+            print(f"⚠️ batch_remove failed ({e}), removing one by one")
+            for name in names:
+                obj = bpy.data.objects.get(name)
+                if obj:
+                    bpy.data.objects.remove(obj, do_unlink=True)
+        
+        # One depsgraph update for the whole batch
+        context.view_layer.update()
+        print(f"⏱️ Deleted {len(doomed)} {label} dupes in {time.perf_counter() - start:.3f}s")
+        
+        return len(doomed)
+    
+    def merge_instanced_duplicates(self, context):
+        """Relink meshes that are the same part in a different pose to one shared mesh"""
+        fingerprints = self.fingerprints
+        
+        # One entry per mesh datablock, with every object using it
+        mesh_users = {}
+        for obj in context.view_layer.objects:
+            if obj.type == 'MESH' and obj.data:
+                mesh_users.setdefault(obj.data.name_full, (obj.data, []))[1].append(obj)
+        
+        groups = {}
+        for mesh, users in mesh_users.values():
+            # Shape keys or modifiers work in local space - relinking would change the result
+            if mesh.shape_keys or any(obj.modifiers for obj in users):
+                continue
+            # Weights live on the mesh but their group names on the objects - both have to agree
+            group_names = tuple(group.name for group in users[0].vertex_groups)
+            sig, frame = fingerprints.canonical_signature(mesh, weights=bool(group_names))
+            if sig is not None:
+                groups.setdefault((sig, group_names), []).append((mesh, frame, users))
+        
+        merged_meshes = 0
+        for members in groups.values():
+            if len(members) < 2:
+                continue
+            
+            keep_mesh, keep_frame, _ = members[0]
+            keep_coords = read_vertex_coords(keep_mesh).astype(np.float64)
+            
+            for mesh, frame, users in members[1:]:
+                # mesh = transform @ keep_mesh, in local space
+                transform = frame_to_frame_matrix(keep_frame, frame)
+                
+                # A mirrored match would flip the winding, so normals would point inward
+                if np.linalg.det(transform[:3, :3]) < 0:
+                    print(f"⚠️ Canonical match rejected (mirrored): '{mesh.name}' vs '{keep_mesh.name}'")
+                    continue
+                
+                # Quantized hashes can collide at rounding edges - check the real vertices
+                mapped = keep_coords @ transform[:3, :3].T + transform[:3, 3]
+                tolerance = 1e-4 * max(frame[2], 1e-6)
+                if not np.allclose(mapped, read_vertex_coords(mesh), atol=tolerance):
+                    print(f"⚠️ Canonical match rejected: '{mesh.name}' vs '{keep_mesh.name}'")
+                    continue
+                
+                transform = Matrix(transform.tolist())
+                transform_inv = transform.inverted_safe()
+                for obj in users:
+                    obj.data = keep_mesh
+                    obj.matrix_world = obj.matrix_world @ transform
+                    # Keep children where they were
+                    for child in obj.children:
+                        child.matrix_parent_inverse = transform_inv @ child.matrix_parent_inverse
+                    print(f"🧬 Instanced dupe: '{obj.name}' now shares mesh '{keep_mesh.name}'")
+                
+                merged_meshes += 1
         
-        return len(datablock_dupes)
+        return merged_meshes
     
     def cleanup_mesh_data(self, context):
-        """Clean mesh data - merge vertices, remove doubles"""
+        """Clean mesh data - merge vertices, remove doubles (pure bmesh, no Edit Mode round-trips)"""
         if context.mode != 'OBJECT':
             bpy.ops.object.mode_set(mode='OBJECT')
         
-        mesh_objects = [ob for ob in context.view_layer.objects if ob.type == 'MESH']
-        if not mesh_objects:
+        # Each mesh datablock once, however many objects share it
+        meshes = {}
+        for ob in context.view_layer.objects:
+            if ob.type == 'MESH' and ob.data and not ob.data.library:
+                meshes.setdefault(ob.data.name_full, ob.data)
+        if not meshes:
             return 0, 0
         
         merged_verts = 0
         cleaned_count = 0
-        
-        bpy.ops.object.select_all(action='DESELECT')
-        
-        for obj in mesh_objects:
+        start = time.perf_counter()
+        
+        plan = getattr(self, 'analysis_plan', None)
+        if plan:
+            # Analysis proved these have no doubles, degenerate or loose geometry
+            skipped = [name for name in meshes if name in plan and not plan[name]['needs_cleanup']]
+            for name in skipped:
+                del meshes[name]
+            if skipped:
+                print(f"⏭️ Skipping {len(skipped)} already-clean meshes")
+        
+        for mesh in meshes.values():
+            bm = bmesh.new()
             try:
-                if obj.name not in context.view_layer.objects:
-                    continue
+                bm.from_mesh(mesh)
                 
-                obj.select_set(True)
-                context.view_layer.objects.active = obj
-                bpy.ops.object.mode_set(mode='EDIT')
-                bpy.ops.mesh.select_all(action='SELECT')
+                before_count = len(bm.verts)
+                bmesh.ops.remove_doubles(bm, verts=bm.verts[:], dist=0.0001)
+                merged_verts += (before_count - len(bm.verts))
                 
-                before_count = len(obj.data.vertices)
-                bpy.ops.mesh.remove_doubles(threshold=0.0001)
-                after_count = len(obj.data.vertices)
-                merged_verts += (before_count - after_count)
+                bmesh.ops.dissolve_degenerate(bm, dist=0.0001, edges=bm.edges[:])
                 
-                bpy.ops.mesh.dissolve_degenerate()
-                bpy.ops.mesh.delete_loose()
-                bpy.ops.object.mode_set(mode='OBJECT')
-                obj.select_set(False)
+                # Same as mesh.delete_loose defaults: wire edges, then isolated verts
+                loose_edges = [e for e in bm.edges if not e.link_faces]
+                if loose_edges:
+                    bmesh.ops.delete(bm, geom=loose_edges, context='EDGES')
+                loose_verts = [v for v in bm.verts if not v.link_edges]
+                if loose_verts:
+                    bmesh.ops.delete(bm, geom=loose_verts, context='VERTS')
+                
+                bm.to_mesh(mesh)
+                mesh.update()
                 cleaned_count += 1
                 
             except Exception as e:
-                print(f"⚠️ Error cleaning '{obj.name}': {e}")
-                try:
-                    bpy.ops.object.mode_set(mode='OBJECT')
-                except:
-                    pass
+                print(f"⚠️ Error cleaning '{mesh.name}': {e}")
+            finally:
+                bm.free()
         
+        print(f"⏱️ Cleaned {cleaned_count} meshes in {time.perf_counter() - start:.3f}s")
         return merged_verts, cleaned_count
     
     def cleanup_materials(self):
@@ -427,11 +484,11 @@ class DH_OP_comprehensive_cleanup(bpy.types.Operator):
         return len(unused_images)
     
     def purge_orphan_data_blocks(self):
-        """Purge orphaned data"""
-        before_total = len(bpy.data.meshes) + len(bpy.data.curves) + len(bpy.data.armatures)
-        bpy.ops.outliner.orphans_purge(do_local_ids=True, do_linked_ids=True, do_recursive=True)
-        after_total = len(bpy.data.meshes) + len(bpy.data.curves) + len(bpy.data.armatures)
-        return before_total - after_total
+        """Purge orphaned data of the picked types, recursing only into what the freed blocks used"""
+        start = time.perf_counter()
+        self.purge_stats = purge_orphans(self.purge_types)
+        print(f"⏱️ Orphan purge took {time.perf_counter() - start:.3f}s")
+        return sum(entry['count'] for entry in self.purge_stats.values())
     
     def report_results(self, stats):
         """Report cleanup results"""
@@ -445,6 +502,8 @@ class DH_OP_comprehensive_cleanup(bpy.types.Operator):
                 print(f"💀 Overlapping Objects: {stats['overlapping_objects']}")
             if stats['datablock_dupes'] > 0:
                 print(f"📐 Data-block Dupes: {stats['datablock_dupes']}")
+            if stats['instanced_meshes'] > 0:
+                print(f"🧬 Meshes Relinked to Shared Data: {stats['instanced_meshes']}")
             if stats['merged_vertices'] > 0:
                 print(f"🔗 Vertices Merged: {stats['merged_vertices']}")
             if stats['cleaned_meshes'] > 0:
@@ -455,6 +514,9 @@ class DH_OP_comprehensive_cleanup(bpy.types.Operator):
                 print(f"🖼️ Images Removed: {stats['unused_images']}")
             if stats['purged_data'] > 0:
                 print(f"🗑️ Data Blocks Purged: {stats['purged_data']}")
+                for key, entry in getattr(self, 'purge_stats', {}).items():
+                    if entry['count'] > 0:
+                        print(f"   • {key.title()}: {entry['count']} (~{format_bytes(entry['bytes'])})")
             
             print(f"\n🎯 TOTAL ITEMS CLEANED: {total}")
             self.report({'INFO'}, f"Cleaned {total} items!")
@@ -463,3 +525,30 @@ class DH_OP_comprehensive_cleanup(bpy.types.Operator):
             self.report({'INFO'}, "Scene is already clean!")
         print("="*50)
 
+
+
+class DH_OP_export_cleanup_plan(bpy.types.Operator):
+    """Write the current cleanup plan (dupes, candidate pairs, orphans) to JSON for auditing"""
+    bl_idname = "dh.export_cleanup_plan"
+    bl_label = "Export Cleanup Plan"
+    bl_options = {'REGISTER'}
+    
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(default="*.json", options={'HIDDEN'})
+    
+    def invoke(self, context, event):
+        if not self.filepath:
+            blend_name = bpy.path.basename(bpy.data.filepath).rsplit('.', 1)[0] or "untitled"
+            self.filepath = f"{blend_name}_cleanup_plan.json"
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+    
+    def execute(self, context):
+        plan = get_cached_plan(context) or build_cleanup_plan(context)
+        try:
+            plan.export_json(bpy.path.abspath(self.filepath))
+        except OSError as e:
+            self.report({'ERROR'}, f"Could not write plan: {e}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Cleanup plan written to: {self.filepath}")
+        return {'FINISHED'}
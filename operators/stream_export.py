@@ -0,0 +1,88 @@
+import bpy
+import os
+import time
+import numpy as np
+from ..utlity.mesh_stream import MeshSource, Y_UP, write_obj, write_ply
+from ..utlity.dcc_bridge import exchange_directory, record_own_write, DEFAULT_EXCHANGE_FILE
+
+class DH_OP_stream_export(bpy.types.Operator):
+    """Streams selected meshes to OBJ or binary PLY in fixed-size blocks - for very high-poly sculpts"""
+    bl_idname = "dh.stream_export"
+    bl_label = "Stream OBJ/PLY Export"
+    bl_options = {'REGISTER'}
+
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH') # type: ignore
+
+    file_format: bpy.props.EnumProperty(
+        name="Format",
+        items=[
+            ("OBJ", "OBJ", "Text OBJ, positions and faces"),
+            ("PLY", "PLY", "Binary PLY - smallest file and fastest to write"),
+        ],
+        default="OBJ",
+    ) # type: ignore
+
+    apply_modifiers: bpy.props.BoolProperty(
+        name="Apply Modifiers",
+        description="Export the evaluated mesh (multires, subdivision...) instead of the base mesh",
+        default=True,
+    ) # type: ignore
+
+    y_up: bpy.props.BoolProperty(
+        name="Y Up",
+        description="Convert to Y-up (-Z forward) like the stock OBJ exporter, for ZBrush and Maya",
+        default=True,
+    ) # type: ignore
+
+    @classmethod
+    def poll(cls, context):
+        return any(obj.type == 'MESH' for obj in context.selected_objects)
+
+    def invoke(self, context, event):
+        if not self.filepath:
+            # Default to the bridge folder so ZBrush/Maya pick it up
+            self.filepath = os.path.join(exchange_directory(), DEFAULT_EXCHANGE_FILE)
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "file_format")
+        layout.prop(self, "apply_modifiers")
+        layout.prop(self, "y_up")
+
+    def execute(self, context):
+        extension = "." + self.file_format.lower()
+        filepath = bpy.path.ensure_ext(bpy.path.abspath(self.filepath), extension)
+        objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        if not objects:
+            self.report({'WARNING'}, "No mesh objects selected")
+            return {'CANCELLED'}
+
+        start = time.perf_counter()
+        depsgraph = context.evaluated_depsgraph_get()
+        sources = []
+        for obj in objects:
+            matrix = np.array(obj.matrix_world, dtype=np.float64)
+            if self.y_up:
+                matrix[:3] = Y_UP @ matrix[:3]
+            evaluated = depsgraph if self.apply_modifiers and obj.modifiers else None
+            sources.append(MeshSource(obj, evaluated, matrix))
+
+        # Each mesh is read, written and dropped before the next one is touched
+        try:
+            if self.file_format == 'PLY':
+                faces = write_ply(filepath, sources)
+            else:
+                faces = write_obj(filepath, sources)
+        except (OSError, ValueError) as e:
+            self.report({'ERROR'}, f"Export failed: {e}")
+            return {'CANCELLED'}
+        # The bridge watcher may be watching this folder - don't let it import our own file back
+        record_own_write(filepath)
+
+        elapsed = time.perf_counter() - start
+        size_mb = os.path.getsize(filepath) / (1024 * 1024)
+        print(f"⏱️ Stream export: {elapsed:.2f}s, {faces:,} faces, {size_mb:.1f} MB")
+        self.report({'INFO'}, f"Exported {faces:,} faces to {filepath} in {elapsed:.1f}s")
+        return {'FINISHED'}
@@ -1,17 +1,64 @@
 import bpy
-import bmesh
-from bpy.props import FloatProperty
+from bpy.props import FloatProperty, EnumProperty
+import numpy as np
+from math import radians, degrees, pi
 from mathutils import Vector
+from mathutils.bvhtree import BVHTree
 from bpy_extras import view3d_utils
 from ..utlity.text_overlay import TextOverlay
+from ..utlity.draw_2d import Draw2D
+from ..utlity.mesh_stream import StreamMesh
+from ..utlity.mesh_regions import mesh_regions
+
+DRAG_THRESHOLD = 8      # pixels before a click turns into a lasso
+LASSO_SPACING = 4       # pixels between recorded lasso points
+
+FILL_MODE_ITEMS = [
+    ('SHELL', "Shell", "Connected geometry"),
+    ('UV_ISLAND', "UV Island", "Faces connected without a UV seam"),
+    ('MATERIAL', "Material", "Connected faces with the same material slot"),
+    ('FACE_SET', "Face Set", "Connected faces in the same sculpt face set"),
+    ('NORMAL', "Normal Angle", "Connected faces whose normals differ less than the angle"),
+]
+FILL_MODE_KEYS = {'ONE': 'SHELL', 'TWO': 'UV_ISLAND', 'THREE': 'MATERIAL', 'FOUR': 'FACE_SET', 'FIVE': 'NORMAL'}
+ANGLE_STEP = radians(5)
+
+
+def points_in_lasso(points, lasso):
+    """Even-odd test of (n, 2) screen points against a closed lasso polygon"""
+    inside = np.zeros(len(points), dtype=bool)
+    x, y = points[:, 0], points[:, 1]
+    for (x0, y0), (x1, y1) in zip(lasso, np.roll(lasso, -1, axis=0)):
+        if y0 == y1:
+            continue
+        crosses = (y0 > y) != (y1 > y)
+        inside ^= crosses & (x < x0 + (y - y0) * (x1 - x0) / (y1 - y0))
+    return inside
+
 
 class DH_OP_WeightFillModal(bpy.types.Operator):
-    """Click to flood fill connected vertices with current brush weight"""
+    """Click to flood fill connected vertices with current brush weight, or drag a lasso to fill every shell it touches"""
     bl_idname = "dh.weight_fill_modal"
     bl_label = "Weight Fill Shell"
     bl_description = "Click to flood fill connected vertices with weight"
     bl_options = {'REGISTER', 'UNDO'}
     
+    fill_mode: EnumProperty(
+        name="Fill Mode",
+        description="What bounds a fill - switch with 1-5 while the tool runs",
+        items=FILL_MODE_ITEMS,
+        default='SHELL',
+    ) # type: ignore
+    
+    normal_angle: FloatProperty(
+        name="Normal Angle",
+        description="Largest angle between neighbouring face normals inside one region - adjust with [ and ] while the tool runs",
+        subtype='ANGLE',
+        default=radians(30),
+        min=0.0,
+        max=pi,
+    ) # type: ignore
+    
     @classmethod
     def poll(cls, context):
         return (context.active_object and 
@@ -26,11 +73,35 @@ class DH_OP_WeightFillModal(bpy.types.Operator):
             self.cleanup(context)
             return {'CANCELLED'}
         
+        elif event.type in FILL_MODE_KEYS and event.value == 'PRESS':
+            self.set_fill_mode(context, FILL_MODE_KEYS[event.type])
+            return {'RUNNING_MODAL'}
+        
+        elif event.type in {'LEFT_BRACKET', 'RIGHT_BRACKET'} and event.value == 'PRESS':
+            step = ANGLE_STEP if event.type == 'RIGHT_BRACKET' else -ANGLE_STEP
+            self.normal_angle = min(max(self.normal_angle + step, 0.0), pi)
+            if self.fill_mode == 'NORMAL':
+                self.set_fill_mode(context, 'NORMAL')
+            return {'RUNNING_MODAL'}
+        
         elif event.type == 'LEFTMOUSE' and event.value == 'PRESS':
-            # Raycast to find clicked vertex
-            clicked_vert = self.raycast_vertex(context, event)
-            if clicked_vert is not None:
-                self.flood_fill_from_vertex(context, clicked_vert)
+            self.lasso = [(event.mouse_region_x, event.mouse_region_y)]
+            self.dragging = False
+            return {'RUNNING_MODAL'}
+        
+        elif event.type == 'MOUSEMOVE' and self.lasso:
+            self.extend_lasso(event)
+            return {'RUNNING_MODAL'}
+        
+        elif event.type == 'LEFTMOUSE' and event.value == 'RELEASE' and self.lasso:
+            if self.dragging:
+                self.fill_lasso(context)
+            else:
+                # Raycast to find clicked vertex
+                clicked_vert, clicked_face = self.raycast_vertex(context, event)
+                if clicked_vert is not None:
+                    self.flood_fill_from_vertex(context, clicked_vert, clicked_face)
+            self.end_lasso()
             return {'RUNNING_MODAL'}
         
         return {'RUNNING_MODAL'}
@@ -40,18 +111,27 @@ class DH_OP_WeightFillModal(bpy.types.Operator):
             # Set cursor
             context.window.cursor_set('EYEDROPPER')
             
-            # Setup text overlay
-            current_weight = context.tool_settings.unified_paint_settings.weight
-            active_group = context.active_object.vertex_groups.active.name
+            # Build the pick BVH once - every click is then a tree query
+            self.build_bvh(context.active_object)
+            # Shell labels are cached per mesh and only rebuilt when its topology changes
+            self.regions = mesh_regions(context.active_object.data)
+            self.region_index = None
             
+            # Lasso state - a drag fills every shell it touches in one batch
+            self.lasso = []
+            self.dragging = False
+            self.lasso_draw = None
+            
+            # Setup text overlay
             self.text_overlay = TextOverlay(
-                text=f"Weight Fill Shell Active | Group: {active_group} | Weight: {current_weight:.2f} | LMB: Fill | RMB/ESC: Cancel",
+                text="",
                 position="BOTTOM_CENTER",
                 size=24,
                 color=(0, 0.8, 1, 1),
                 outline=True
             )
             self.text_overlay.setup_handler(context)
+            self.set_fill_mode(context, self.fill_mode)
             
             context.window_manager.modal_handler_add(self)
             return {'RUNNING_MODAL'}
@@ -63,12 +143,22 @@ class DH_OP_WeightFillModal(bpy.types.Operator):
         context.window.cursor_set('DEFAULT')
         if hasattr(self, 'text_overlay'):
             self.text_overlay.remove_handler()
+        if hasattr(self, 'lasso_draw'):
+            self.end_lasso()
     
     def cancel(self, context):
         self.cleanup(context)
     
+    def build_bvh(self, obj):
+        """BVH over the original mesh, so hit faces index straight into obj.data"""
+        mesh = StreamMesh(obj.name, obj.data)
+        loop_verts = mesh.loop_verts.tolist()
+        polygons = [loop_verts[start:start + total] for start, total in zip(mesh.loop_starts.tolist(), mesh.loop_totals.tolist())]
+        self.bvh = BVHTree.FromPolygons(mesh.coords.tolist(), polygons)
+        self.pick_mesh = mesh
+    
     def raycast_vertex(self, context, event):
-        """Find the closest vertex to mouse click"""
+        """(vertex, face) under the mouse - the hit face's vertex closest to the hit point"""
         region = context.region
         rv3d = context.region_data
         coord = event.mouse_region_x, event.mouse_region_y
@@ -86,37 +176,142 @@ class DH_OP_WeightFillModal(bpy.types.Operator):
         ray_origin_obj = matrix_inv @ ray_origin
         ray_direction_obj = matrix_inv.to_3x3() @ view_vector
         
-        # Create bmesh from mesh
-        bm = bmesh.new()
-        bm.from_mesh(obj.data)
-        bm.verts.ensure_lookup_table()
-        bm.transform(matrix)
-        
-        # Find closest vertex to ray
-        closest_vert = None
-        min_dist = float('inf')
-        
-        for vert in bm.verts:
-            # Calculate distance from vertex to ray
-            to_vert = vert.co - ray_origin
-            proj_length = to_vert.dot(view_vector)
-            if proj_length > 0:  # In front of camera
-                proj_point = ray_origin + view_vector * proj_length
-                dist = (vert.co - proj_point).length
-                
-                if dist < min_dist:
-                    min_dist = dist
-                    closest_vert = vert.index
-        
-        bm.free()
-        
-        # Only return if reasonably close to click
-        if min_dist < 0.1:  # Adjust threshold as needed
-            return closest_vert
-        return None
-    
-    def flood_fill_from_vertex(self, context, start_vert_idx):
+        location, _, face_index, _ = self.bvh.ray_cast(ray_origin_obj, ray_direction_obj.normalized())
+        if face_index is None:
+            return None, None
+        
+        # Nearest corner of the hit face
+        mesh = self.pick_mesh
+        start = mesh.loop_starts[face_index]
+        face_verts = mesh.loop_verts[start:start + mesh.loop_totals[face_index]]
+        offsets = mesh.coords[face_verts] - np.array(location, dtype=np.float32)
+        return int(face_verts[np.argmin(np.einsum('ij,ij->i', offsets, offsets))]), face_index
+    
+    def mode_label(self):
+        label = dict((key, name) for key, name, _ in FILL_MODE_ITEMS)[self.fill_mode]
+        if self.fill_mode == 'NORMAL':
+            label += f" {degrees(self.normal_angle):.0f}°"
+        return label
+    
+    def hint_text(self, context):
+        obj = context.active_object
+        current_weight = context.tool_settings.unified_paint_settings.weight
+        return (f"Mode: {self.mode_label()} | Group: {obj.vertex_groups.active.name} | Weight: {current_weight:.2f}"
+                f" | LMB: Fill | Drag: Lasso Fill | 1-5: Mode | [ ]: Angle | RMB/ESC: Exit")
+    
+    def set_fill_mode(self, context, mode):
+        """Switch mode and fetch its face regions - cached per mesh, so switching back is free"""
+        if mode != 'SHELL':
+            try:
+                self.region_index = self.regions.face_regions(mode, context.active_object.data, self.normal_angle)
+            except ValueError as e:
+                self.report({'WARNING'}, f"Can't fill by {mode.replace('_', ' ').lower()}: {e}")
+                # Keep the current mode if it has its regions, else fall back to shells
+                mode = self.fill_mode if self.region_index is not None else 'SHELL'
+        self.fill_mode = mode
+        self.text_overlay.update_text(f"Weight Fill Active | {self.hint_text(context)}")
+    
+    def extend_lasso(self, event):
+        point = (event.mouse_region_x, event.mouse_region_y)
+        last = self.lasso[-1]
+        if not self.dragging:
+            first = self.lasso[0]
+            if abs(point[0] - first[0]) + abs(point[1] - first[1]) < DRAG_THRESHOLD:
+                return
+            self.dragging = True
+            self.lasso_draw = Draw2D()
+            self.lasso_draw.setup_handler()
+        if abs(point[0] - last[0]) + abs(point[1] - last[1]) < LASSO_SPACING:
+            return
+        self.lasso.append(point)
+        self.lasso_draw.clear()
+        self.lasso_draw.add_line_loop(self.lasso, (0, 0.8, 1, 1))
+    
+    def end_lasso(self):
+        self.lasso = []
+        self.dragging = False
+        if self.lasso_draw:
+            self.lasso_draw.remove_handler()
+            self.lasso_draw = None
+    
+    def project_vertices(self, context):
+        """Region pixel coordinates of every vertex, and which unhidden ones are in front of the view"""
+        matrix = np.array(context.region_data.perspective_matrix @ context.active_object.matrix_world, dtype=np.float64)
+        coords = self.pick_mesh.coords
+        clip = coords @ matrix[:, :3].T + matrix[:, 3]
+        in_front = clip[:, 3] > 1e-6
+        hidden = np.zeros(len(coords), dtype=bool)
+        context.active_object.data.vertices.foreach_get("hide", hidden)
+        in_front &= ~hidden
+        w = np.where(in_front, clip[:, 3], 1.0)
+        region = context.region
+        screen = np.empty((len(coords), 2))
+        screen[:, 0] = (clip[:, 0] / w + 1.0) * 0.5 * region.width
+        screen[:, 1] = (clip[:, 1] / w + 1.0) * 0.5 * region.height
+        return screen, in_front
+    
+    def visible_vertices(self, context, indices):
+        """Which of `indices` nothing on the mesh hides from the view - a BVH ray cast per vertex"""
+        rv3d = context.region_data
+        matrix_inv = context.active_object.matrix_world.inverted()
+        view_inv = rv3d.view_matrix.inverted()
+        coords = self.pick_mesh.coords[indices].astype(np.float64)
+        if rv3d.is_perspective:
+            origins = np.broadcast_to(np.array(matrix_inv @ view_inv.translation), coords.shape)
+        else:
+            # Orthographic rays are parallel - start each one outside the mesh's bounds
+            direction = np.array((matrix_inv.to_3x3() @ view_inv.to_3x3() @ Vector((0.0, 0.0, -1.0))).normalized())
+            reach = np.ptp(self.pick_mesh.coords, axis=0).sum() + 1.0
+            origins = coords - direction * reach
+        
+        visible = np.ones(len(indices), dtype=bool)
+        ray_cast = self.bvh.ray_cast
+        for i, (origin, target) in enumerate(zip(origins.tolist(), coords.tolist())):
+            ray = Vector(target) - Vector(origin)
+            distance = ray.length
+            if distance > 0.0:
+                # Stop just short of the vertex so the faces it belongs to don't count as hits
+                visible[i] = ray_cast(origin, ray / distance, distance * 0.999)[0] is None
+        return visible
+    
+    def fill_lasso(self, context):
+        """Fill every shell (or region) with at least one vertex inside the lasso"""
+        if len(self.lasso) < 3:
+            return
+        lasso = np.array(self.lasso, dtype=np.float64)
+        screen, candidates = self.project_vertices(context)
+        
+        # Bounding box first, so the polygon test only sees nearby vertices
+        low, high = lasso.min(axis=0), lasso.max(axis=0)
+        candidates &= np.all((screen >= low) & (screen <= high), axis=1)
+        candidate_indices = np.flatnonzero(candidates)
+        hit = candidate_indices[points_in_lasso(screen[candidate_indices], lasso)]
+        
+        # Like lasso select: only what can be seen, unless X-ray shows everything
+        shading = context.space_data.shading
+        xray = shading.show_xray_wireframe if shading.type == 'WIREFRAME' else shading.show_xray
+        if len(hit) and not xray:
+            hit = hit[self.visible_vertices(context, hit)]
+        if not len(hit):
+            return
+        
+        if self.fill_mode == 'SHELL':
+            vertices, region_count = self.regions.shells_vertices(hit)
+        else:
+            vertices, region_count = self.regions.regions_vertices(self.region_index, hit)
+        self.fill_vertices(context, vertices.tolist(), region_count)
+    
+    def flood_fill_from_vertex(self, context, start_vert_idx, face_index):
         """Flood fill connected vertices with current brush weight"""
+        # Precomputed shell or region - a slice lookup instead of a BFS
+        if self.fill_mode == 'SHELL':
+            connected_verts = self.regions.shell_vertices(start_vert_idx)
+        else:
+            connected_verts = self.regions.region_vertices(self.region_index, face_index)
+        self.fill_vertices(context, connected_verts.tolist(), 1)
+    
+    def fill_vertices(self, context, connected_verts, region_count):
+        """Write the brush weight to `connected_verts` with a single vertex group call"""
         obj = context.active_object
         mesh = obj.data
         
@@ -127,47 +322,18 @@ class DH_OP_WeightFillModal(bpy.types.Operator):
         # Get current weight from unified paint settings - BLENDER 4.4 FIX!
         current_weight = context.tool_settings.unified_paint_settings.weight
         
-        # Switch to edit mode to access bmesh
-        bpy.ops.object.mode_set(mode='EDIT')
-        
-        bm = bmesh.new()
-        bm.from_mesh(mesh)
-        bm.verts.ensure_lookup_table()
-        
-        # Flood fill algorithm
-        visited = set()
-        to_visit = {bm.verts[start_vert_idx]}
-        connected_verts = set()
-        
-        while to_visit:
-            current = to_visit.pop()
-            if current in visited:
-                continue
-                
-            visited.add(current)
-            connected_verts.add(current.index)
-            
-            # Add connected vertices
-            for edge in current.link_edges:
-                other_vert = edge.other_vert(current)
-                if other_vert not in visited:
-                    to_visit.add(other_vert)
-        
-        bm.free()
-        
-        # Back to weight paint mode
-        bpy.ops.object.mode_set(mode='WEIGHT_PAINT')
-        
-        # Apply weights using current brush weight
-        for vert_idx in connected_verts:
-            obj.vertex_groups.active.add([vert_idx], current_weight, 'REPLACE')
+        # Weight Paint edits obj.data directly - no Edit Mode round-trip needed
+        # Apply weights using current brush weight - one RNA call for the whole batch
+        obj.vertex_groups.active.add(connected_verts, current_weight, 'REPLACE')
         
+        # Redraw the weights without a mode change
         mesh.update()
         
+        # The tool ends with CANCELLED, so nothing gets pushed for it - give every fill its own Ctrl+Z step
+        bpy.ops.ed.undo_push(message="Weight Fill")
+        
         # Update overlay with result
-        active_group = obj.vertex_groups.active.name
-        self.text_overlay.update_text(
-            f"Filled {len(connected_verts)} vertices | Group: {active_group} | Weight: {current_weight:.2f} | LMB: Fill Again | RMB/ESC: Exit"
-        )
+        regions = f"{region_count} {self.mode_label()} regions, " if region_count > 1 else ""
+        self.text_overlay.update_text(f"Filled {regions}{len(connected_verts)} vertices | {self.hint_text(context)}")
         
-        self.report({'INFO'}, f"Filled {len(connected_verts)} vertices with weight {current_weight:.2f}")
\ No newline at end of file
+        self.report({'INFO'}, f"Filled {regions}{len(connected_verts)} vertices with weight {current_weight:.2f}")
@@ -7,6 +7,8 @@ def register_addon():
     from ..operators import register_operators
     from ..menus import register_menus
     from .keymap import register_keymap
+    from ..utlity.dupe_index import register_dupe_index
+    from ..utlity.dcc_bridge import register_bridge
     
     # Register preferences FIRST so keymap can access them
     print("🔥 DH Toolkit: Registering preferences...")
@@ -22,6 +24,12 @@ def register_addon():
     print("🔥 DH Toolkit: Registering menus...")
     register_menus()
     
+    # Live dupe index is opt-in via preferences
+    register_dupe_index()
+    
+    # Exchange folder watcher is opt-in via preferences
+    register_bridge()
+    
     # Register keymaps LAST so they can read preferences
     print("🔥 DH Toolkit: Registering keymaps...")
     register_keymap()
@@ -33,6 +41,14 @@ def unregister_addon():
     from ..operators import unregister_operators
     from ..property import unregister_properties
     from .preferences import unregister_preferences
+    from ..utlity.dupe_index import unregister_dupe_index
+    from ..utlity.dcc_bridge import unregister_bridge
+    
+    # Stop the exchange folder watcher
+    unregister_bridge()
+    
+    # Drop the live dupe index handlers
+    unregister_dupe_index()
     
     # Unregister keymap first
     print("🔥 DH Toolkit: Unregistering keymaps...")
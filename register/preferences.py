@@ -53,6 +53,30 @@ class DH_ToolkitPreferences(bpy.types.AddonPreferences):
         default=""
     )
 
+    # Scene cleanup settings
+    track_duplicates: bpy.props.BoolProperty(
+        name="Track Duplicates Live",
+        description="Keep a background index of bboxes and geometry fingerprints, updated from depsgraph changes, so the cleanup dialog opens instantly",
+        default=False,
+        update=lambda self, context: self.update_dupe_index(context)
+    )
+
+    # DCC bridge settings
+    bridge_directory: bpy.props.StringProperty(
+        name="Exchange Folder",
+        description="Folder shared with ZBrush, Maya, etc. Leave empty to use <system temp>/dh_bridge",
+        subtype='DIR_PATH',
+        default="",
+        update=lambda self, context: self.update_bridge_watcher(context)
+    )
+
+    bridge_watch: bpy.props.BoolProperty(
+        name="Watch Exchange Folder",
+        description="Import files automatically when another app writes them into the exchange folder",
+        default=False,
+        update=lambda self, context: self.update_bridge_watcher(context)
+    )
+
     # KEYMAP SETTINGS - The shit that actually works
     keymap_key: bpy.props.EnumProperty(
         name="Key",
@@ -167,6 +191,22 @@ class DH_ToolkitPreferences(bpy.types.AddonPreferences):
         except Exception as e:
             print(f"🔥 DH Toolkit: Failed to update keymaps: {e}")
 
+    def update_dupe_index(self, context):
+        """Subscribe/unsubscribe the live duplicate index"""
+        from ..utlity.dupe_index import enable_dupe_index, disable_dupe_index
+        if self.track_duplicates:
+            enable_dupe_index()
+        else:
+            disable_dupe_index()
+
+    def update_bridge_watcher(self, context):
+        """Start/stop (or re-point) the exchange folder watcher"""
+        from ..utlity.dcc_bridge import enable_bridge_watcher, disable_bridge_watcher
+        if self.bridge_watch:
+            enable_bridge_watcher()
+        else:
+            disable_bridge_watcher()
+
     def get_keymap_string(self):
         """Get human-readable keymap string"""
         modifiers = []
@@ -194,6 +234,19 @@ class DH_ToolkitPreferences(bpy.types.AddonPreferences):
         proj_box.label(text="Project Settings", icon='FILE_FOLDER')
         proj_box.prop(self, "default_projects_dir")
 
+        # Scene cleanup settings
+        layout.separator()
+        cleanup_box = layout.box()
+        cleanup_box.label(text="Scene Cleanup", icon='TRASH')
+        cleanup_box.prop(self, "track_duplicates")
+
+        # DCC bridge settings
+        layout.separator()
+        bridge_box = layout.box()
+        bridge_box.label(text="DCC Bridge", icon='LINKED')
+        bridge_box.prop(self, "bridge_directory")
+        bridge_box.prop(self, "bridge_watch")
+
         # Shader Builder settings (collapsed)
         layout.separator()
         shader_box = layout.box()
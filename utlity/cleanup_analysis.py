@@ -0,0 +1,220 @@
+# Parallel cleanup analysis over shared-memory mesh buffers.
+# Nothing in here imports bpy - worker processes only get NumPy views onto
+# shared memory, so they can be spawned from inside Blender.
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context, shared_memory
+
+from .mesh_fingerprint import quantize_coords, hash_geometry
+
+# (attribute, per-element width, dtype) for every exported buffer
+BUFFER_LAYOUT = (
+    ("coords", 3, np.float32),       # vertices.co
+    ("edges", 2, np.int32),          # edges.vertices
+    ("loop_verts", 1, np.int32),     # loops.vertex_index
+    ("loop_edges", 1, np.int32),     # loops.edge_index
+    ("loop_totals", 1, np.int32),    # polygons.loop_total
+)
+
+
+def _read_mesh_arrays(mesh):
+    """Pull the analysis arrays out of a bpy mesh with foreach_get"""
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edges)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    return {
+        "coords": coords,
+        "edges": edges,
+        "loop_verts": loop_verts,
+        "loop_edges": loop_edges,
+        "loop_totals": loop_totals,
+    }
+
+
+class SharedMeshBuffers:
+    """All meshes' arrays concatenated into one shared-memory block per attribute.
+
+    offsets[attr][k]:offsets[attr][k + 1] is mesh k's slice in elements (not floats).
+    Call close() when done - the owner also unlinks the blocks.
+    """
+
+    def __init__(self, names, arrays):
+        self.names = list(names)
+        self.blocks = {}
+        self.offsets = {}
+
+        for attr, width, dtype in BUFFER_LAYOUT:
+            parts = [np.asarray(a[attr], dtype=dtype).reshape(-1) for a in arrays]
+            counts = np.array([len(p) // width for p in parts], dtype=np.int64)
+            self.offsets[attr] = np.concatenate(([0], np.cumsum(counts)))
+
+            total = int(self.offsets[attr][-1]) * width
+            block = shared_memory.SharedMemory(create=True, size=max(1, total * np.dtype(dtype).itemsize))
+            view = np.ndarray((total,), dtype=dtype, buffer=block.buf)
+            if total:
+                view[:] = np.concatenate(parts)
+            self.blocks[attr] = block
+
+    @classmethod
+    def from_meshes(cls, meshes):
+        """Export bpy meshes (main thread only)"""
+        return cls([mesh.name_full for mesh in meshes], [_read_mesh_arrays(mesh) for mesh in meshes])
+
+    def descriptor(self):
+        """Picklable handle workers use to attach"""
+        return {
+            attr: (self.blocks[attr].name, width, np.dtype(dtype).str, int(self.offsets[attr][-1]))
+            for attr, width, dtype in BUFFER_LAYOUT
+        }
+
+    def close(self):
+        for block in self.blocks.values():
+            block.close()
+            block.unlink()
+        self.blocks = {}
+
+
+def _may_have_doubles(coords, dist):
+    """Conservative: True if any two vertices could be within `dist` of each other.
+
+    Points within dist on every axis always share a cell in at least one of the
+    8 half-shifted grids of size 2*dist, so a grid with no collisions proves
+    there's nothing for remove_doubles to merge there.
+    """
+    if len(coords) < 2:
+        return False
+    scaled = coords.astype(np.float64) / (2.0 * dist)
+    for shift in range(8):
+        offset = np.array([(shift >> axis) & 1 for axis in range(3)], dtype=np.float64) * 0.5
+        cells = np.floor(scaled + offset).astype(np.int64)
+        cells = cells[np.lexsort((cells[:, 2], cells[:, 1], cells[:, 0]))]
+        if np.any(np.all(cells[1:] == cells[:-1], axis=1)):
+            return True
+    return False
+
+
+def analyze_mesh(coords, edges, loop_verts, loop_edges, loop_totals, precision=3, dist=0.0001):
+    """Pure-math analysis of one mesh: exact signature + what cleanup would touch"""
+    vert_count, edge_count, face_count = len(coords), len(edges), len(loop_totals)
+    stats = (vert_count, edge_count, face_count)
+    signature = (stats, hash_geometry(stats, quantize_coords(coords, precision)))
+
+    short_edges = 0
+    if edge_count:
+        lengths = np.linalg.norm(coords[edges[:, 0]] - coords[edges[:, 1]], axis=1)
+        short_edges = int((lengths < dist).sum())
+
+    tiny_faces = 0
+    if face_count:
+        # Newell normal per polygon: |sum(cross(v_i, v_i+1))| / 2 is the area
+        starts = np.concatenate(([0], np.cumsum(loop_totals)[:-1]))
+        nexts = np.arange(len(loop_verts)) + 1
+        ends = starts + loop_totals
+        wrap = np.repeat(ends, loop_totals) == nexts
+        nexts[wrap] = np.repeat(starts, loop_totals)[wrap]
+        cross = np.cross(coords[loop_verts], coords[loop_verts[nexts]])
+        areas = np.linalg.norm(np.add.reduceat(cross, starts, axis=0), axis=1) * 0.5
+        tiny_faces = int((areas < dist * dist).sum())
+
+    used_verts = np.zeros(vert_count, dtype=bool)
+    used_verts[edges.reshape(-1)] = True
+    face_edges = np.zeros(edge_count, dtype=bool)
+    face_edges[loop_edges] = True
+    loose = int((~used_verts).sum()) + int((~face_edges).sum())
+
+    doubles = _may_have_doubles(coords, dist)
+
+    return {
+        "signature": signature,
+        "short_edges": short_edges,
+        "tiny_faces": tiny_faces,
+        "loose": loose,
+        "may_have_doubles": doubles,
+        "needs_cleanup": bool(doubles or short_edges or tiny_faces or loose),
+    }
+
+
+def _analyze_slice(descriptor, offsets, indices, precision, dist):
+    """Worker entry point: attach to the shared blocks and analyze meshes `indices`"""
+    blocks = []
+    views = {}
+    try:
+        for attr, (name, width, dtype, count) in descriptor.items():
+            block = shared_memory.SharedMemory(name=name)
+            blocks.append(block)
+            views[attr] = np.ndarray((count, width), dtype=np.dtype(dtype), buffer=block.buf)
+
+        results = {}
+        for k in indices:
+            parts = {attr: views[attr][offsets[attr][k]:offsets[attr][k + 1]] for attr in views}
+            results[k] = analyze_mesh(
+                parts["coords"],
+                parts["edges"],
+                parts["loop_verts"][:, 0],
+                parts["loop_edges"][:, 0],
+                parts["loop_totals"][:, 0],
+                precision,
+                dist,
+            )
+            parts = None
+        return results
+    finally:
+        views = None
+        for block in blocks:
+            block.close()
+
+
+def _balanced_slices(weights, count):
+    """Split indices into `count` slices of roughly equal total weight (heaviest first)"""
+    slices = [[] for _ in range(count)]
+    loads = [0] * count
+    for index in sorted(range(len(weights)), key=lambda k: -weights[k]):
+        target = loads.index(min(loads))
+        slices[target].append(index)
+        loads[target] += weights[index] + 1
+    return [s for s in slices if s]
+
+
+def analyze_buffers(buffers, workers=4, precision=3, dist=0.0001):
+    """Analyze every mesh in a SharedMeshBuffers; returns {mesh_name: result}.
+
+    workers <= 1 runs in-process. Pool start-up failures fall back to in-process too.
+    """
+    descriptor = buffers.descriptor()
+    offsets = {attr: buffers.offsets[attr].tolist() for attr in buffers.offsets}
+    vertex_counts = np.diff(buffers.offsets["coords"]).tolist()
+    results = {}
+
+    if workers > 1 and len(buffers.names) > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as pool:
+                futures = [
+                    pool.submit(_analyze_slice, descriptor, offsets, indices, precision, dist)
+                    for indices in _balanced_slices(vertex_counts, workers * 4)
+                ]
+                for future in futures:
+                    results.update(future.result())
+        except Exception as e:
+            print(f"⚠️ Parallel analysis failed ({e}), running in-process")
+            results = {}
+
+    if not results:
+        results = _analyze_slice(descriptor, offsets, list(range(len(buffers.names))), precision, dist)
+
+    return {buffers.names[k]: result for k, result in results.items()}
+
+
+def analyze_meshes(meshes, workers=4, precision=3, dist=0.0001):
+    """Export bpy meshes to shared memory, analyze them in a process pool, return the plan"""
+    buffers = SharedMeshBuffers.from_meshes(meshes)
+    try:
+        return analyze_buffers(buffers, workers, precision, dist)
+    finally:
+        buffers.close()
@@ -0,0 +1,193 @@
+import bpy
+import json
+import hashlib
+import time
+import numpy as np
+
+from .spatial import collect_mesh_bboxes, find_overlapping_pairs, build_overlap_neighbors
+from .mesh_fingerprint import MeshFingerprintCache
+
+# Most recent plan from a preview scan - reused by execute while the token still matches
+_cached_plan = None
+
+
+def scene_change_token(context):
+    """Cheap fingerprint of the view layer: object/mesh names, transforms, local bounds
+    and per-mesh vertex/edge/face counts.
+
+    Two foreach_get reads plus one join - far cheaper than any dupe scan, and it
+    changes whenever objects are added, removed, renamed, moved or re-shaped.
+    An edit that keeps the counts and bounds (moving an inner vertex) slips
+    through, which is why the cleanup re-checks each dupe before deleting it.
+    """
+    objects = context.view_layer.objects
+    count = len(objects)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{bpy.data.filepath}|{context.scene.name}|{context.view_layer.name}|{count}".encode())
+
+    if count:
+        matrices = np.empty(count * 16, dtype=np.float32)
+        bounds = np.empty(count * 24, dtype=np.float32)
+        objects.foreach_get("matrix_world", matrices)
+        objects.foreach_get("bound_box", bounds)
+        digest.update(matrices.tobytes())
+        digest.update(bounds.tobytes())
+        digest.update("|".join(
+            f"{ob.name_full}:{ob.data.name_full if ob.data else ''}" for ob in objects
+        ).encode())
+
+        # Topology counts catch edits that leave the bounding box alone
+        counts = {}
+        for ob in objects:
+            if ob.type == 'MESH' and ob.data and ob.data.name_full not in counts:
+                mesh = ob.data
+                counts[mesh.name_full] = (len(mesh.vertices), len(mesh.edges), len(mesh.polygons))
+        digest.update(np.array(list(counts.values()), dtype=np.int64).tobytes())
+
+    return digest.hexdigest()
+
+
+def find_overlapping_duplicates(mesh_objects, bboxes, fingerprints, tolerance=0.1):
+    """Broadphase + exact fingerprint check.
+
+    Returns (candidate_pairs, dupes) where candidate_pairs are (name, name) tuples that
+    passed the bbox broadphase and dupes are (dupe_name, keep_name) in scan order.
+    """
+    pairs = find_overlapping_pairs(bboxes, tolerance=tolerance)
+    neighbors = build_overlap_neighbors(pairs)
+    print(f"🔍 Broadphase: {len(pairs)} candidate pairs")
+
+    dupes = []
+    processed = set()
+    for i, obj1 in enumerate(mesh_objects):
+        if i in processed or i not in neighbors:
+            continue
+
+        sig1 = fingerprints.signature(obj1)
+        if not sig1:
+            continue
+
+        for j in neighbors[i]:
+            if j in processed:
+                continue
+
+            obj2 = mesh_objects[j]
+            sig2 = fingerprints.signature(obj2)
+            if not sig2:
+                continue
+
+            # Broadphase already guarantees overlapping bounding boxes
+            if sig1[0] == sig2[0]:  # Same basic stats
+                # If they also hash to the same vertex data, they're overlapping duplicates
+                if sig1 == sig2:
+                    dupes.append((obj2.name, obj1.name))
+                    processed.add(j)
+                    print(f"💀 Overlapping bboxes: '{obj2.name}' overlaps '{obj1.name}'")
+                else:
+                    # Same basic stats and overlapping but different geometry - just warn
+                    print(f"⚠️ Bbox overlap but different geometry: '{obj2.name}' and '{obj1.name}'")
+
+    candidate_pairs = [(mesh_objects[i].name, mesh_objects[j].name) for i, j in pairs]
+    return candidate_pairs, dupes
+
+
+def find_datablock_duplicates(mesh_objects):
+    """Objects sharing mesh data with auto-generated names: [(obj_name, mesh_name), ...]"""
+    mesh_data_users = {}
+    for obj in mesh_objects:
+        mesh_data_users.setdefault(obj.data.name, []).append(obj)
+
+    dupes = []
+    for mesh_name, users in mesh_data_users.items():
+        if len(users) > 1:
+            for obj in users[1:]:
+                if any(suffix in obj.name for suffix in ['.001', '.002', '.003', '.004', '.005']):
+                    dupes.append((obj.name, mesh_name))
+    return dupes
+
+
+def find_orphans():
+    """Names of zero-user datablocks per type, for the audit report"""
+    collections = {
+        'materials': bpy.data.materials,
+        'images': bpy.data.images,
+        'meshes': bpy.data.meshes,
+        'curves': bpy.data.curves,
+        'armatures': bpy.data.armatures,
+        'actions': bpy.data.actions,
+    }
+    return {
+        kind: [block.name for block in blocks if block.users == 0 and not block.use_fake_user]
+        for kind, blocks in collections.items()
+    }
+
+
+class CleanupPlan:
+    """Result of one dupe scan: what a cleanup would remove, plus the token it is valid for"""
+
+    def __init__(self, token, fingerprints):
+        self.token = token
+        self.fingerprints = fingerprints
+        self.created = time.time()
+        self.mesh_object_count = 0
+        self.candidate_pairs = []
+        self.overlapping = []
+        self.datablock_dupes = []
+        self.orphans = {}
+
+    def dupe_groups(self):
+        """{keep_name: [dupe_name, ...]} for the overlapping dupes"""
+        groups = {}
+        for dupe_name, keep_name in self.overlapping:
+            groups.setdefault(keep_name, []).append(dupe_name)
+        return groups
+
+    def to_dict(self):
+        return {
+            'token': self.token,
+            'created': time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.created)),
+            'blend_file': bpy.data.filepath,
+            'mesh_objects': self.mesh_object_count,
+            'candidate_pairs': [list(pair) for pair in self.candidate_pairs],
+            'overlapping': [{'object': dupe, 'keeps': keep} for dupe, keep in self.overlapping],
+            'dupe_groups': self.dupe_groups(),
+            'datablock_dupes': [{'object': obj, 'mesh': mesh} for obj, mesh in self.datablock_dupes],
+            'orphans': self.orphans,
+        }
+
+    def export_json(self, filepath):
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+def build_cleanup_plan(context, fingerprints=None, tolerance=0.1):
+    """Full dupe scan of the view layer - caches and returns the plan"""
+    global _cached_plan
+
+    if fingerprints is None:
+        fingerprints = MeshFingerprintCache(precision=3)
+    plan = CleanupPlan(scene_change_token(context), fingerprints)
+
+    mesh_objects, bboxes = collect_mesh_bboxes(context.view_layer.objects)
+    print(f"🔍 Checking {len(mesh_objects)} objects for overlapping bounding boxes...")
+    plan.mesh_object_count = len(mesh_objects)
+    plan.candidate_pairs, plan.overlapping = find_overlapping_duplicates(
+        mesh_objects, bboxes, fingerprints, tolerance
+    )
+    plan.datablock_dupes = find_datablock_duplicates(mesh_objects)
+    plan.orphans = find_orphans()
+
+    _cached_plan = plan
+    return plan
+
+
+def get_cached_plan(context):
+    """The cached plan if the scene hasn't changed since it was built, else None"""
+    if _cached_plan is not None and _cached_plan.token == scene_change_token(context):
+        return _cached_plan
+    return None
+
+
+def clear_cached_plan():
+    global _cached_plan
+    _cached_plan = None
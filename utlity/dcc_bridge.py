@@ -0,0 +1,257 @@
+import bpy
+import os
+import hashlib
+import tempfile
+from .mesh_fingerprint import read_vertex_coords, read_loop_vertices
+
+# (extension, importer operator) - first match wins
+IMPORTERS = (
+    (".obj", "wm.obj_import"),
+    (".fbx", "import_scene.fbx"),
+    (".ply", "wm.ply_import"),
+    (".glb", "import_scene.gltf"),
+    (".gltf", "import_scene.gltf"),
+    (".usd", "wm.usd_import"),
+    (".usda", "wm.usd_import"),
+    (".usdc", "wm.usd_import"),
+)
+DEFAULT_EXCHANGE_FILE = "exported.obj"
+
+# Stamped on imported meshes so an unchanged file can reuse them, even after a reload
+HASH_PROP = "dh_bridge_hash"
+SOURCE_PROP = "dh_bridge_source"
+GEOMETRY_PROP = "dh_bridge_geometry"     # the mesh as imported - an edit since then rules out reuse
+
+MIN_INTERVAL = 0.5
+MAX_INTERVAL = 8.0
+
+# Running watcher while "Watch Exchange Folder" is on in the addon preferences
+_watcher = None
+
+# normalized path -> (mtime_ns, size) of files this addon wrote - the watcher skips exactly that state
+_own_writes = {}
+
+
+def _preferences():
+    try:
+        return bpy.context.preferences.addons["DH_Toolkit"].preferences
+    except (KeyError, AttributeError):
+        return None
+
+
+def exchange_directory():
+    """Folder shared with ZBrush/Maya/etc. - the preference, or <temp>/dh_bridge"""
+    prefs = _preferences()
+    directory = bpy.path.abspath(prefs.bridge_directory) if prefs and prefs.bridge_directory else ""
+    if not directory:
+        directory = os.path.join(tempfile.gettempdir(), "dh_bridge")
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+
+def importer_for(path):
+    lower = path.lower()
+    for extension, operator in IMPORTERS:
+        if lower.endswith(extension):
+            return operator
+    return None
+
+
+def _normalize(path):
+    return os.path.normcase(os.path.abspath(path))
+
+
+def record_own_write(path):
+    """Call after writing into the exchange folder so the watcher doesn't import our own export"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return
+    _own_writes[_normalize(path)] = (stat.st_mtime_ns, stat.st_size)
+
+
+def file_hash(path):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def geometry_hash(mesh):
+    """blake2b of counts, vertex positions and face corners - changes with any edit to the shape"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{len(mesh.vertices)}|{len(mesh.edges)}|{len(mesh.polygons)}".encode())
+    digest.update(read_vertex_coords(mesh).tobytes())
+    digest.update(read_loop_vertices(mesh).tobytes())
+    return digest.hexdigest()
+
+
+def newest_exchange_file(directory):
+    """The default exchange file if present, else the most recently written importable file"""
+    default = os.path.join(directory, DEFAULT_EXCHANGE_FILE)
+    if os.path.isfile(default):
+        return default
+    candidates = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file() and importer_for(entry.name):
+                candidates.append((entry.stat().st_mtime_ns, entry.path))
+    return max(candidates)[1] if candidates else None
+
+
+def _reuse_meshes(context, path, digest):
+    """Link fresh objects to meshes a previous import of this exact file produced"""
+    source = _normalize(path)
+    meshes = [
+        mesh for mesh in bpy.data.meshes
+        if mesh.get(HASH_PROP) == digest and mesh.get(SOURCE_PROP) == source
+    ]
+    if not meshes:
+        return None
+
+    if any(mesh.get(GEOMETRY_PROP) != geometry_hash(mesh) for mesh in meshes):
+        # Edited since the import - these meshes no longer stand for the file
+        for mesh in meshes:
+            for prop in (HASH_PROP, SOURCE_PROP, GEOMETRY_PROP):
+                mesh.pop(prop, None)
+        return None
+
+    users = [ob for ob in context.view_layer.objects if ob.type == 'MESH' and ob.data in meshes]
+    if users:
+        # Still in the scene - nothing to do at all
+        return users
+
+    objects = []
+    for mesh in meshes:
+        obj = bpy.data.objects.new(mesh.name, mesh)
+        context.collection.objects.link(obj)
+        objects.append(obj)
+    return objects
+
+
+def import_exchange_file(context, path):
+    """Import `path`, or reuse the meshes from last time if its bytes haven't changed.
+
+    Returns (objects, reused).
+    """
+    operator = importer_for(path)
+    if operator is None:
+        raise ValueError(f"No importer for '{os.path.basename(path)}'")
+
+    digest = file_hash(path)
+    reused = _reuse_meshes(context, path, digest)
+    if reused:
+        return reused, True
+
+    before = set(bpy.data.objects)
+    module, name = operator.split(".")
+    getattr(getattr(bpy.ops, module), name)(filepath=path)
+    objects = [ob for ob in bpy.data.objects if ob not in before]
+
+    source = _normalize(path)
+    for ob in objects:
+        if ob.type == 'MESH' and ob.data and ob.data.get(HASH_PROP) != digest:
+            ob.data[HASH_PROP] = digest
+            ob.data[SOURCE_PROP] = source
+            ob.data[GEOMETRY_PROP] = geometry_hash(ob.data)
+    return objects, False
+
+
+class BridgeWatcher:
+    """Polls the exchange folder from a bpy.app.timers callback.
+
+    One scandir per tick; the interval doubles (up to MAX_INTERVAL) while
+    nothing changes and drops back to MIN_INTERVAL as soon as something does.
+    A file is imported once its size and mtime hold still for one tick, so
+    half-written exports from the other app are never picked up.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.interval = MIN_INTERVAL
+        self.seen = self._scan()        # path -> (mtime_ns, size) - existing files don't auto-import
+        self.pending = {}               # path -> (mtime_ns, size) last seen while changing
+
+    def _scan(self):
+        found = {}
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if entry.is_file() and importer_for(entry.name):
+                        stat = entry.stat()
+                        found[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            pass
+        return found
+
+    def tick(self):
+        current = self._scan()
+        changed = False
+        ready = []
+        for path, state in current.items():
+            if self.seen.get(path) == state:
+                continue
+            if _own_writes.get(_normalize(path)) == state:
+                # Written by this addon - only a later write by another app is news
+                self.seen[path] = state
+                self.pending.pop(path, None)
+                continue
+            changed = True
+            if self.pending.get(path) == state:
+                ready.append(path)
+                self.seen[path] = state
+                self.pending.pop(path, None)
+            else:
+                self.pending[path] = state
+
+        for path in ready:
+            self._import(path)
+
+        self.interval = MIN_INTERVAL if changed else min(self.interval * 2.0, MAX_INTERVAL)
+        return self.interval
+
+    def _import(self, path):
+        context = bpy.context
+        window = context.window_manager.windows[0] if context.window_manager.windows else None
+        try:
+            if window:
+                with context.temp_override(window=window):
+                    objects, reused = import_exchange_file(bpy.context, path)
+            else:
+                objects, reused = import_exchange_file(context, path)
+            action = "Reused" if reused else "Imported"
+            print(f"🔁 Bridge: {action} {len(objects)} objects from {os.path.basename(path)}")
+        except Exception as e:
+            print(f"❌ Bridge: failed to import {path}: {e}")
+
+
+def _timer():
+    if _watcher is None:
+        return None
+    return _watcher.tick()
+
+
+def enable_bridge_watcher():
+    global _watcher
+    _watcher = BridgeWatcher(exchange_directory())
+    if not bpy.app.timers.is_registered(_timer):
+        bpy.app.timers.register(_timer, first_interval=MIN_INTERVAL, persistent=True)
+
+
+def disable_bridge_watcher():
+    global _watcher
+    _watcher = None
+    if bpy.app.timers.is_registered(_timer):
+        bpy.app.timers.unregister(_timer)
+
+
+def register_bridge():
+    """Start watching if the preference is on"""
+    prefs = _preferences()
+    if prefs and prefs.bridge_watch:
+        enable_bridge_watcher()
+
+
+def unregister_bridge():
+    disable_bridge_watcher()
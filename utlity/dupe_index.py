@@ -0,0 +1,277 @@
+import bpy
+from bpy.app.handlers import persistent
+
+from .spatial import collect_world_bboxes, find_overlapping_pairs, build_overlap_neighbors
+from .mesh_fingerprint import MeshFingerprintCache
+
+DATABLOCK_SUFFIXES = ('.001', '.002', '.003', '.004', '.005')
+
+# Live index while "Track Duplicates" is on in the addon preferences
+_index = None
+
+
+class DupeIndex:
+    """Per-object bboxes and fingerprints kept current from depsgraph updates.
+
+    The depsgraph handler only marks objects and meshes dirty; flush() re-measures
+    just those objects and re-counts the signature/mesh groups they touch. Totals
+    are kept as running sums, so counts() is O(1) once nothing is pending.
+    Entries are keyed by as_pointer() so renames don't orphan them, and groups
+    are counted in view-layer order, the order the remover walks.
+    """
+
+    def __init__(self):
+        self.fingerprints = MeshFingerprintCache(precision=3)
+        self._reset()
+
+    def _reset(self):
+        self.entries = {}           # obj pointer -> (obj name, mesh pointer, mesh name, bbox, signature)
+        self.groups = {}            # signature -> set of obj pointers
+        self.group_counts = {}      # signature -> overlapping dupes in that group
+        self.mesh_users = {}        # mesh pointer -> set of obj pointers
+        self.mesh_counts = {}       # mesh pointer -> data-block dupes sharing it
+        self.orphaned = {}          # mesh name -> pointer of a mesh whose last user was removed
+        self.order = {}             # obj pointer -> position in view_layer.objects
+        self.overlapping_total = 0
+        self.datablock_total = 0
+
+        self.dirty_objects = {}     # obj pointer -> name when it was tagged
+        self.dirty_meshes = set()   # mesh pointers
+        self.check_membership = False
+        self.needs_rebuild = True
+        self.view_layer_key = None
+        self.object_count = 0
+
+    # --- Bookkeeping ---
+
+    def _remove(self, key, touched_groups, touched_meshes):
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        _, mesh_key, mesh_name, _, signature = entry
+        self.groups[signature].discard(key)
+        self.mesh_users[mesh_key].discard(key)
+        if not self.mesh_users[mesh_key]:
+            # Last user gone - the mesh may be purged and its name reused by a new one
+            self.orphaned[mesh_name] = mesh_key
+        touched_groups.add(signature)
+        touched_meshes.add(mesh_key)
+
+    def _add(self, obj, bbox, touched_groups, touched_meshes):
+        key = obj.as_pointer()
+        mesh_key = obj.data.as_pointer()
+        if self.orphaned.pop(obj.data.name_full, mesh_key) != mesh_key:
+            # A different mesh now carries the name of one that lost its users
+            self.fingerprints.invalidate(obj.data.name_full)
+        signature = self.fingerprints.signature(obj)
+        if signature is None:
+            return
+        self.entries[key] = (obj.name, mesh_key, obj.data.name_full, tuple(bbox), signature)
+        self.groups.setdefault(signature, set()).add(key)
+        self.mesh_users.setdefault(mesh_key, set()).add(key)
+        touched_groups.add(signature)
+        touched_meshes.add(mesh_key)
+
+    def _in_order(self, keys):
+        """`keys` sorted the way view_layer.objects lists them"""
+        last = len(self.order)
+        return sorted(keys, key=lambda key: self.order.get(key, last))
+
+    def _recount_group(self, signature):
+        """Greedy overlap count for one identical-geometry group (same rule as the remover)"""
+        keys = self._in_order(self.groups.get(signature, ()))
+        count = 0
+        if len(keys) > 1:
+            neighbors = build_overlap_neighbors(
+                find_overlapping_pairs([self.entries[key][3] for key in keys], tolerance=0.1)
+            )
+            processed = set()
+            for i in range(len(keys)):
+                if i in processed:
+                    continue
+                for j in neighbors.get(i, ()):
+                    if j not in processed:
+                        processed.add(j)
+                        count += 1
+        if not keys:
+            self.groups.pop(signature, None)
+
+        self.overlapping_total += count - self.group_counts.get(signature, 0)
+        self.group_counts[signature] = count
+
+    def _recount_mesh(self, mesh_key):
+        keys = self._in_order(self.mesh_users.get(mesh_key, ()))
+        count = sum(
+            1 for key in keys[1:]
+            if any(suffix in self.entries[key][0] for suffix in DATABLOCK_SUFFIXES)
+        )
+        if not keys:
+            self.mesh_users.pop(mesh_key, None)
+
+        self.datablock_total += count - self.mesh_counts.get(mesh_key, 0)
+        self.mesh_counts[mesh_key] = count
+
+    # --- Updates ---
+
+    def _mesh_objects(self, view_layer):
+        """{pointer: obj} for the view layer's mesh objects, refreshing the order map on the way"""
+        self.order = {}
+        mesh_objects = {}
+        for position, ob in enumerate(view_layer.objects):
+            key = ob.as_pointer()
+            self.order[key] = position
+            if ob.type == 'MESH' and ob.data:
+                mesh_objects[key] = ob
+        self.object_count = len(self.order)
+        return mesh_objects
+
+    def rebuild(self, view_layer):
+        self._reset()
+        self.fingerprints.clear()
+        self.view_layer_key = (view_layer.id_data.name, view_layer.name)
+
+        mesh_objects = self._mesh_objects(view_layer)
+        self._update_objects(list(mesh_objects.values()), set(), set())
+        self.needs_rebuild = False
+
+    def _update_objects(self, objects, touched_groups, touched_meshes):
+        bboxes = collect_world_bboxes(objects).tolist() if objects else []
+        for obj, bbox in zip(objects, bboxes):
+            self._add(obj, bbox, touched_groups, touched_meshes)
+        for mesh_name in self.orphaned:
+            self.fingerprints.invalidate(mesh_name)
+        self.orphaned.clear()
+        for signature in touched_groups:
+            self._recount_group(signature)
+        for mesh_key in touched_meshes:
+            self._recount_mesh(mesh_key)
+
+    def flush(self, view_layer):
+        """Apply pending changes - cost scales with what changed, not the scene size"""
+        if self.needs_rebuild or self.view_layer_key != (view_layer.id_data.name, view_layer.name):
+            self.rebuild(view_layer)
+            self.dirty_objects.clear()
+            self.dirty_meshes.clear()
+            self.check_membership = False
+            return
+
+        touched_groups, touched_meshes = set(), set()
+        mesh_objects = None
+        if self.check_membership:
+            # Objects added, deleted or moved between collections - one pointer pass over the view layer
+            previous = self.order
+            mesh_objects = self._mesh_objects(view_layer)
+            for key in mesh_objects.keys() ^ self.entries.keys():
+                self.dirty_objects.setdefault(key, None)
+            if self._order_changed(previous):
+                touched_groups.update(self.groups)
+                touched_meshes.update(self.mesh_users)
+        self.check_membership = False
+
+        for mesh_key in self.dirty_meshes:
+            for key in self.mesh_users.get(mesh_key, ()):
+                # Drop the hash under the name it was stored with - the mesh may have been renamed
+                self.fingerprints.invalidate(self.entries[key][2])
+                self.dirty_objects.setdefault(key, None)
+        self.dirty_meshes.clear()
+
+        if not self.dirty_objects and not touched_groups and not touched_meshes:
+            return
+
+        objects = view_layer.objects
+        changed = []
+        for key, name in self.dirty_objects.items():
+            self._remove(key, touched_groups, touched_meshes)
+            obj = objects.get(name) if name is not None else None
+            if obj is None or obj.as_pointer() != key:
+                # Renamed again or deleted since it was tagged - find it by pointer
+                if mesh_objects is None:
+                    mesh_objects = self._mesh_objects(view_layer)
+                obj = mesh_objects.get(key)
+            if obj and obj.type == 'MESH' and obj.data:
+                changed.append(obj)
+        self.dirty_objects.clear()
+
+        self._update_objects(changed, touched_groups, touched_meshes)
+
+    def _order_changed(self, previous):
+        """Did objects present before and now swap places? (`previous` is in view-layer order)"""
+        last = -1
+        for key in previous:
+            position = self.order.get(key)
+            if position is None:
+                continue
+            if position < last:
+                return True
+            last = position
+        return False
+
+    def counts(self, view_layer):
+        """(overlapping dupes, data-block dupes) for the view layer right now"""
+        self.flush(view_layer)
+        return self.overlapping_total, self.datablock_total
+
+
+# --- Handlers ---
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    index = _index
+    if index is None or index.needs_rebuild:
+        return
+
+    for update in depsgraph.updates:
+        data = update.id.original
+        if isinstance(data, bpy.types.Object):
+            # A rename comes through with no update flags set, so any update counts
+            if data.type == 'MESH':
+                index.dirty_objects[data.as_pointer()] = data.name
+        elif isinstance(data, bpy.types.Mesh):
+            if update.is_updated_geometry:
+                index.dirty_meshes.add(data.as_pointer())
+        elif isinstance(data, (bpy.types.Scene, bpy.types.Collection)):
+            index.check_membership = True
+
+
+@persistent
+def _on_load_post(*args):
+    if _index is not None:
+        _index.needs_rebuild = True
+
+
+def get_dupe_index():
+    """The live index, or None if tracking is off"""
+    return _index
+
+
+def enable_dupe_index():
+    global _index
+    if _index is None:
+        _index = DupeIndex()
+    if _on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    if _on_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post)
+
+
+def disable_dupe_index():
+    global _index
+    _index = None
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+
+
+def register_dupe_index():
+    """Subscribe if the preference is on"""
+    try:
+        enabled = bpy.context.preferences.addons["DH_Toolkit"].preferences.track_duplicates
+    except (KeyError, AttributeError):
+        enabled = False
+    if enabled:
+        enable_dupe_index()
+
+
+def unregister_dupe_index():
+    disable_dupe_index()
@@ -0,0 +1,124 @@
+import bpy
+import os
+import json
+import queue
+import shutil
+import tempfile
+import threading
+import subprocess
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(__file__), "fbx_farm_worker.py")
+
+
+def balanced_slices(weights, count):
+    """Split job indices into `count` slices of roughly equal total weight (heaviest first)"""
+    slices = [[] for _ in range(count)]
+    loads = [0] * count
+    for index in sorted(range(len(weights)), key=lambda k: -weights[k]):
+        target = loads.index(min(loads))
+        slices[target].append(index)
+        loads[target] += weights[index] + 1
+    return [s for s in slices if s]
+
+
+class ExportFarm:
+    """Split FBX export across background Blender processes.
+
+    start() saves a copy of the current file as a snapshot and launches one
+    `blender --background` per slice. Each worker prints a DH_FARM line per
+    object; reader threads push those onto a queue, and poll() drains it from
+    the UI thread (a modal timer), so Blender never blocks on the workers.
+    """
+
+    def __init__(self, jobs, workers, weights=None):
+        self.jobs = list(jobs)                      # [(object name, fbx path), ...]
+        self.workers = max(1, workers)
+        self.weights = weights or [1] * len(self.jobs)
+
+        self.processes = []
+        self.readers = {}                           # process -> stdout reader thread
+        self.pending = {}                           # process -> set of job indices not yet reported
+        self.durations = {}                         # job index -> seconds inside the worker
+        self.failed = {}                            # job index -> error message
+        self.temp_dir = None
+        self._lines = queue.Queue()
+
+    @property
+    def done_count(self):
+        return len(self.durations) + len(self.failed)
+
+    def start(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="dh_fbx_farm_")
+        snapshot = os.path.join(self.temp_dir, "snapshot.blend")
+        # copy=True leaves the open file (and its dirty state) untouched
+        bpy.ops.wm.save_as_mainfile(filepath=snapshot, copy=True)
+
+        for k, indices in enumerate(balanced_slices(self.weights, self.workers)):
+            job_file = os.path.join(self.temp_dir, f"job_{k}.json")
+            with open(job_file, 'w', encoding='utf-8') as f:
+                json.dump({"objects": [[i, *self.jobs[i]] for i in indices]}, f)
+
+            process = subprocess.Popen(
+                [bpy.app.binary_path, "--background", "--factory-startup", snapshot,
+                 "--python", WORKER_SCRIPT, "--", job_file],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                stdin=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+            )
+            self.processes.append(process)
+            self.pending[process] = set(indices)
+            reader = threading.Thread(target=self._read_output, args=(process,), daemon=True)
+            reader.start()
+            self.readers[process] = reader
+
+        print(f"🚜 FBX farm: {len(self.jobs)} objects across {len(self.processes)} workers")
+
+    def _read_output(self, process):
+        for line in process.stdout:
+            if line.startswith("DH_FARM "):
+                self._lines.put((process, line.rstrip("\n")))
+        process.stdout.close()
+
+    def poll(self):
+        """Apply queued progress lines; True while any worker is still running"""
+        # Readers finish after stdout EOF, so once one is dead all its lines are queued
+        finished = [process for process in self.processes if not self.readers[process].is_alive()]
+        while True:
+            try:
+                process, line = self._lines.get_nowait()
+            except queue.Empty:
+                break
+            _, status, index, detail = line.split(" ", 3)
+            index = int(index)
+            self.pending[process].discard(index)
+            if status == "DONE":
+                self.durations[index] = float(detail)
+            else:
+                self.failed[index] = detail
+                print(f"❌ Farm export failed: {self.jobs[index][0]}: {detail}")
+
+        for process in finished:
+            code = process.wait()
+            if self.pending[process]:
+                # Worker exited (crash, missing exporter...) without reporting these
+                for index in self.pending[process]:
+                    self.failed[index] = f"worker exited with code {code}"
+                self.pending[process] = set()
+        return len(finished) < len(self.processes)
+
+    def cancel(self):
+        for process in self.processes:
+            if process.poll() is None:
+                process.terminate()
+        for process in self.processes:
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    def cleanup(self):
+        if self.temp_dir:
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+            self.temp_dir = None
@@ -0,0 +1,93 @@
+import bpy
+import os
+from .export_manifest import break_hard_link
+from .export_store import POINTER_SUFFIX
+
+# (id, label, export folder, extension, operator, preset kwargs)
+# Every preset exports the selection only and applies modifiers, so when the
+# pipeline has already baked the stack the exporters just read the baked mesh.
+EXPORT_FORMATS = (
+    ('FBX', "FBX", "FBX", ".fbx", "export_scene.fbx", {
+        'use_selection': True,
+        'use_mesh_modifiers': True,
+    }),
+    ('OBJ', "OBJ", "OBJ", ".obj", "wm.obj_export", {
+        'export_selected_objects': True,
+        'apply_modifiers': True,
+    }),
+    ('GLTF', "glTF", "GLTF", ".glb", "export_scene.gltf", {
+        'use_selection': True,
+        'export_format': 'GLB',
+        'export_apply': True,
+    }),
+    ('USD', "USD", "USD", ".usdc", "wm.usd_export", {
+        'selected_objects_only': True,
+    }),
+)
+
+EXPORT_FORMAT_ITEMS = [(key, label, f"Export {label} into ../{folder}/vNNN") for key, label, folder, _, _, _ in EXPORT_FORMATS]
+
+
+def run_exporter(operator, filepath, preset):
+    """Call an exporter by its 'module.name' id with a preset"""
+    # Archive mode hard-links version files to a shared store blob - writing in place would rewrite every version
+    break_hard_link(filepath)
+    # A pointer left by archive mode would claim the old blob is still this file
+    pointer = filepath + POINTER_SUFFIX
+    if os.path.lexists(pointer):
+        os.remove(pointer)
+    module, name = operator.split(".")
+    return getattr(getattr(bpy.ops, module), name)(filepath=filepath, check_existing=False, **preset)
+
+
+def _can_bake(obj):
+    """Armature deform and shape keys have to reach the exporters live, so those objects aren't baked"""
+    if obj.type != 'MESH' or not obj.modifiers:
+        return False
+    if obj.data.shape_keys:
+        return False
+    return not any(mod.type == 'ARMATURE' for mod in obj.modifiers)
+
+
+class BakedModifiers:
+    """Evaluate each object's modifier stack once and let every exporter reuse it.
+
+    On enter, the evaluated mesh is copied into a temporary datablock, swapped in
+    as obj.data and the modifiers are switched off, so each exporter's own
+    depsgraph evaluation is a plain copy. On exit everything is put back and the
+    baked meshes are freed.
+    """
+
+    def __init__(self, objects, depsgraph):
+        self.objects = [obj for obj in objects if _can_bake(obj)]
+        self.depsgraph = depsgraph
+        self.swaps = []             # (obj, original mesh, baked mesh, [(modifier, show_viewport, show_render)])
+
+    def __enter__(self):
+        try:
+            for obj in self.objects:
+                obj_eval = obj.evaluated_get(self.depsgraph)
+                baked = bpy.data.meshes.new_from_object(obj_eval, preserve_all_data_layers=True, depsgraph=self.depsgraph)
+                modifiers = [(mod, mod.show_viewport, mod.show_render) for mod in obj.modifiers]
+                self.swaps.append((obj, obj.data, baked, modifiers))
+                for mod, _, _ in modifiers:
+                    mod.show_viewport = False
+                    mod.show_render = False
+                obj.data = baked
+        except Exception as e:
+            # The with-body never runs, so __exit__ wouldn't either - put back what was already swapped
+            self.__exit__(type(e), e, e.__traceback__)
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        baked_meshes = []
+        for obj, original, baked, modifiers in self.swaps:
+            baked_meshes.append(baked)
+            obj.data = original
+            for mod, show_viewport, show_render in modifiers:
+                mod.show_viewport = show_viewport
+                mod.show_render = show_render
+        bpy.data.batch_remove(baked_meshes)
+        self.swaps = []
+        return False
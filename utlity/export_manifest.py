@@ -0,0 +1,136 @@
+import os
+import json
+import shutil
+import hashlib
+import numpy as np
+import bpy
+from .mesh_fingerprint import hash_mesh_data
+
+MANIFEST_NAME = ".dh_manifest.json"
+
+# Bump when the exporter call changes so old hashes stop matching
+EXPORT_SETTINGS_VERSION = "fbx-2"
+
+# Node settings worth hashing - layout (location, width, select...) isn't
+NODE_BASE_PROPS = {prop.identifier for prop in bpy.types.Node.bl_rna.properties}
+SIMPLE_PROP_TYPES = {'BOOLEAN', 'INT', 'FLOAT', 'STRING', 'ENUM'}
+
+
+def _update_array(digest, collection, attr, count, dtype, width=1):
+    buffer = np.empty(count * width, dtype=dtype)
+    if count:
+        collection.foreach_get(attr, buffer)
+    digest.update(buffer.tobytes())
+
+
+def _socket_value(socket):
+    value = getattr(socket, "default_value", None)
+    try:
+        return tuple(value)
+    except TypeError:
+        return value
+
+
+def _hash_node_tree(digest, tree, seen):
+    """Node types, settings, unlinked input values, links and image paths - group trees included"""
+    if tree is None or tree.name_full in seen:
+        return
+    seen.add(tree.name_full)
+    for node in sorted(tree.nodes, key=lambda node: node.name):
+        digest.update(f"{node.name}|{node.bl_idname}".encode())
+        for prop in node.bl_rna.properties:
+            if prop.identifier in NODE_BASE_PROPS:
+                continue
+            value = getattr(node, prop.identifier, None)
+            if prop.type in SIMPLE_PROP_TYPES:
+                digest.update(f"{prop.identifier}={value!r}".encode())
+            elif isinstance(value, bpy.types.Image):
+                # The FBX references or embeds the file - its path decides what the export points at
+                digest.update(f"{prop.identifier}={value.filepath}|{value.source}|{bool(value.packed_file)}".encode())
+            elif isinstance(value, bpy.types.NodeTree):
+                _hash_node_tree(digest, value, seen)
+        for socket in node.inputs:
+            if not socket.is_linked:
+                digest.update(f"{socket.identifier}={_socket_value(socket)!r}".encode())
+    for link in tree.links:
+        digest.update(f"{link.from_node.name}.{link.from_socket.identifier}>{link.to_node.name}.{link.to_socket.identifier}".encode())
+
+
+def _hash_material(digest, material):
+    digest.update(material.name_full.encode())
+    digest.update(np.array((*material.diffuse_color, material.metallic, material.roughness), dtype=np.float32).tobytes())
+    if material.use_nodes:
+        _hash_node_tree(digest, material.node_tree, set())
+
+
+def object_content_hash(obj, depsgraph):
+    """Hash of what an FBX export of this object would contain.
+
+    Evaluated geometry (modifiers applied), every mesh attribute (UVs, colors,
+    custom normals, sharp flags...), the material slots with their node trees
+    and image paths, and the world transform all go in, so any edit that
+    changes the exported file changes the hash.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{EXPORT_SETTINGS_VERSION}|{obj.name}|{obj.type}".encode())
+    digest.update(np.array(obj.matrix_world, dtype=np.float32).tobytes())
+    for slot in obj.material_slots:
+        if slot.material:
+            _hash_material(digest, slot.material)
+        else:
+            digest.update(b"<empty slot>")
+
+    if obj.type == 'MESH':
+        obj_eval = obj.evaluated_get(depsgraph)
+        mesh = obj_eval.to_mesh()
+        try:
+            _update_array(digest, mesh.vertices, "co", len(mesh.vertices), np.float32, 3)
+            _update_array(digest, mesh.edges, "vertices", len(mesh.edges), np.int32, 2)
+            _update_array(digest, mesh.loops, "vertex_index", len(mesh.loops), np.int32)
+            _update_array(digest, mesh.polygons, "loop_total", len(mesh.polygons), np.int32)
+            _update_array(digest, mesh.polygons, "material_index", len(mesh.polygons), np.int32)
+            _update_array(digest, mesh.polygons, "use_smooth", len(mesh.polygons), bool)
+            hash_mesh_data(digest, mesh)
+        finally:
+            obj_eval.to_mesh_clear()
+
+    return digest.hexdigest()
+
+
+def read_manifest(folder):
+    """{object name: content hash} for a version folder, or {} if none/unreadable"""
+    try:
+        with open(os.path.join(folder, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            return json.load(f).get("objects", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def write_manifest(folder, hashes):
+    """Write the manifest atomically so a crashed export never leaves half a file"""
+    path = os.path.join(folder, MANIFEST_NAME)
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump({"settings": EXPORT_SETTINGS_VERSION, "objects": hashes}, f, indent=2, sort_keys=True)
+    os.replace(temp_path, path)
+
+
+def link_or_copy(source, target):
+    """Hard-link an unchanged export into the new version folder (copy if links aren't supported)"""
+    if os.path.abspath(source) == os.path.abspath(target):
+        return
+    if os.path.exists(target):
+        os.remove(target)
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def break_hard_link(path):
+    """Unlink `path` if other names share its data, so exporting over it can't rewrite older versions"""
+    try:
+        if os.stat(path).st_nlink > 1:
+            os.remove(path)
+    except FileNotFoundError:
+        pass
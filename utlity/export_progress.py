@@ -0,0 +1,70 @@
+import time
+from collections import deque
+
+from .text_overlay import TextOverlay
+
+# Recent per-object export times (seconds) across runs - seeds the ETA before
+# the current run has timed anything itself
+_recent_durations = deque(maxlen=200)
+
+
+def format_eta(seconds):
+    seconds = int(round(seconds))
+    if seconds >= 3600:
+        return f"{seconds // 3600}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+    return f"{seconds // 60}:{seconds % 60:02d}"
+
+
+def estimate_seconds(count):
+    """Rough time for `count` objects from recently recorded exports (None if nothing recorded yet)"""
+    if not _recent_durations:
+        return None
+    return count * sum(_recent_durations) / len(_recent_durations)
+
+
+class ExportProgress:
+    """Viewport progress/ETA overlay plus per-object timing for the modal exporters"""
+
+    def __init__(self, label, total, object_count=None):
+        self.label = label
+        self.total = total                          # ticks of work (objects, or files)
+        self.object_count = object_count or total   # objects those ticks cover, for the ETA seed
+        self.done = 0
+        self.durations = []         # (object name, seconds) in export order
+        self.start_time = time.perf_counter()
+        self.overlay = TextOverlay(text="", position="BOTTOM_CENTER", size=20, color=(1, 1, 1, 1))
+
+    def start(self, context):
+        self.overlay.setup_handler(context)
+        self.update()
+
+    def record(self, name, seconds, objects=1):
+        self.durations.append((name, seconds))
+        _recent_durations.append(seconds / max(1, objects))
+
+    def eta(self):
+        remaining = self.total - self.done
+        if self.done:
+            return (time.perf_counter() - self.start_time) / self.done * remaining
+        return estimate_seconds(self.object_count * remaining / max(1, self.total))
+
+    def update(self, done=None, current=""):
+        if done is not None:
+            self.done = done
+        eta = self.eta()
+        text = f"{self.label}: {self.done}/{self.total}"
+        if current:
+            text += f"  {current}"
+        if eta is not None:
+            text += f"  ETA {format_eta(eta)}"
+        self.overlay.update_text(text + "  (ESC to cancel)")
+
+    def finish(self):
+        self.overlay.update_text("")
+        self.overlay.remove_handler()
+        if self.durations:
+            total = sum(seconds for _, seconds in self.durations)
+            print(f"⏱️ {self.label}: {len(self.durations)} objects, {total:.2f}s exporting "
+                  f"({total / len(self.durations):.3f}s avg)")
+            for name, seconds in sorted(self.durations, key=lambda item: -item[1])[:5]:
+                print(f"   {seconds:.3f}s  {name}")
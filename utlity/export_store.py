@@ -0,0 +1,170 @@
+import os
+import json
+import struct
+import time
+import hashlib
+from .version_index import VERSION_PATTERN
+
+STORE_NAME = ".store"
+POINTER_SUFFIX = ".dhref"
+INCOMING_PREFIX = ".incoming-"
+INCOMING_MAX_AGE = 3600          # seconds before an unfinished export counts as abandoned
+
+FBX_MAGIC = b"Kaydara FBX Binary  \x00"
+# Top-level nodes that change on every export without the scene changing
+FBX_VOLATILE_NODES = {b"FBXHeaderExtension", b"FileId", b"CreationTime"}
+
+
+def _fbx_top_level_nodes(data):
+    """(name, start, end) of each top-level node record in a binary FBX, or None if it isn't one"""
+    if not data.startswith(FBX_MAGIC) or len(data) < 27:
+        return None
+    version = struct.unpack_from("<I", data, 23)[0]
+    wide = version >= 7500         # 64-bit offsets from FBX 7.5 on
+    header = struct.Struct("<QQQB" if wide else "<IIIB")
+
+    nodes = []
+    offset = 27
+    while offset + header.size <= len(data):
+        end, _, _, name_length = header.unpack_from(data, offset)
+        if end == 0:
+            break                   # null record terminates the top level
+        if end <= offset or end > len(data):
+            return None
+        name_start = offset + header.size
+        nodes.append((data[name_start:name_start + name_length], offset, end))
+        offset = end
+    return nodes
+
+
+def content_key(path):
+    """Content address of an exported file.
+
+    Binary FBX stamps the export time into its header, so two exports of an
+    unchanged scene never match byte for byte. For those the volatile header
+    nodes are left out of the hash; anything else is hashed as-is.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    nodes = _fbx_top_level_nodes(data)
+    if nodes is None:
+        digest.update(data)
+    else:
+        digest.update(data[:27])
+        for name, start, end in nodes:
+            if name not in FBX_VOLATILE_NODES:
+                digest.update(data[start:end])
+        digest.update(data[nodes[-1][2] if nodes else 27:])
+    return digest.hexdigest()
+
+
+def _read_pointer(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)["blob"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+class ExportStore:
+    """Content-addressed blobs under <export dir>/.store, shared by all vNNN folders.
+
+    Each version folder gets a hard link to its blob, so identical exports take
+    the space of one file and still open like normal files. Where hard links
+    aren't supported (FAT/exFAT drives, some network shares) a small
+    '<file>.dhref' pointer naming the blob is written instead.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.path = os.path.join(directory, STORE_NAME)
+
+    def blob_path(self, key):
+        return os.path.join(self.path, key)
+
+    def incoming_path(self, file_name):
+        """Where to export before the content hash is known - same volume as the blobs, so adding is a rename"""
+        os.makedirs(self.path, exist_ok=True)
+        return os.path.join(self.path, f"{INCOMING_PREFIX}{os.getpid()}-{file_name}")
+
+    def add(self, source):
+        """Move `source` into the store (or drop it if the blob already exists). Returns (key, is_new)."""
+        key = content_key(source)
+        blob = self.blob_path(key)
+        if os.path.exists(blob):
+            os.remove(source)
+            return key, False
+        os.replace(source, blob)
+        return key, True
+
+    def place(self, key, target):
+        """Put blob `key` at `target`: a hard link, or a pointer file if links fail. Returns the path written."""
+        pointer = target + POINTER_SUFFIX
+        for path in (target, pointer):
+            if os.path.lexists(path):
+                os.remove(path)
+        try:
+            os.link(self.blob_path(key), target)
+            return target
+        except OSError:
+            temp_path = pointer + ".tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({"blob": key, "store": STORE_NAME}, f)
+            os.replace(temp_path, pointer)
+            return pointer
+
+    def referenced_keys(self):
+        """Blob keys named by pointer files in the version folders"""
+        keys = set()
+        try:
+            entries = os.listdir(self.directory)
+        except FileNotFoundError:
+            return keys
+        for item in entries:
+            folder = os.path.join(self.directory, item)
+            if not VERSION_PATTERN.match(item) or not os.path.isdir(folder):
+                continue
+            for file_name in os.listdir(folder):
+                if file_name.endswith(POINTER_SUFFIX):
+                    key = _read_pointer(os.path.join(folder, file_name))
+                    if key:
+                        keys.add(key)
+        return keys
+
+    def collect_garbage(self, dry_run=False):
+        """Delete blobs nothing links to or points at. Returns (blobs removed, bytes reclaimed).
+
+        A blob with a link count above one is still hard-linked from some
+        version folder; deleting a vNNN folder drops its links, which is what
+        makes its blobs collectable.
+        """
+        referenced = self.referenced_keys()
+        removed = 0
+        reclaimed = 0
+        try:
+            entries = list(os.scandir(self.path))
+        except FileNotFoundError:
+            return 0, 0
+
+        for entry in entries:
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            # Not entry.stat(): on Windows DirEntry leaves st_nlink at 0, which would free live blobs
+            stat = os.stat(entry.path, follow_symlinks=False)
+            if entry.name.startswith(INCOMING_PREFIX):
+                # Leftovers from a crashed export - unless it's young enough to still be in flight
+                if time.time() - stat.st_mtime < INCOMING_MAX_AGE:
+                    continue
+            elif stat.st_nlink > 1 or entry.name in referenced:
+                continue
+            if not dry_run:
+                try:
+                    os.remove(entry.path)
+                except OSError as e:
+                    print(f"⚠️ Could not remove {entry.path}: {e}")
+                    continue
+            removed += 1
+            reclaimed += stat.st_size
+        return removed, reclaimed
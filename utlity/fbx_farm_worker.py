@@ -0,0 +1,45 @@
+# Runs inside `blender --background <snapshot> --python fbx_farm_worker.py -- <job.json>`.
+# Exports its slice of the split-export job and prints one DH_FARM line per
+# object so the UI session can stream progress. Standalone on purpose - it is
+# executed as a script, not imported as part of the addon.
+import sys
+import json
+import time
+
+import bpy
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:]
+    with open(argv[0], 'r', encoding='utf-8') as f:
+        job = json.load(f)
+
+    view_layer = bpy.context.view_layer
+    for ob in view_layer.objects:
+        ob.select_set(False)
+
+    previous = None
+    for index, name, filepath in job["objects"]:
+        start = time.perf_counter()
+        try:
+            obj = bpy.data.objects.get(name)
+            if obj is None:
+                raise KeyError(f"object '{name}' not in snapshot")
+
+            if previous is not None:
+                previous.select_set(False)
+            obj.select_set(True)
+            view_layer.objects.active = obj
+            previous = obj
+
+            bpy.ops.export_scene.fbx(
+                filepath=filepath,
+                use_selection=True,
+                check_existing=False,
+            )
+            print(f"DH_FARM DONE {index} {time.perf_counter() - start:.4f}", flush=True)
+        except Exception as e:
+            print(f"DH_FARM FAIL {index} {e}", flush=True)
+
+
+main()
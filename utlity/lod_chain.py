@@ -0,0 +1,110 @@
+import bpy
+
+
+def parse_lod_ratios(text):
+    """'1.0, 0.5, 0.25' -> [1.0, 0.5, 0.25]. Raises ValueError unless every ratio
+    is in (0, 1] and each LOD is lighter than the one before."""
+    ratios = [float(part) for part in text.replace(";", ",").split(",") if part.strip()]
+    if not ratios:
+        raise ValueError("no LOD ratios given")
+    for ratio in ratios:
+        if not 0.0 < ratio <= 1.0:
+            raise ValueError(f"LOD ratio {ratio} is outside (0, 1]")
+    for higher, lower in zip(ratios, ratios[1:]):
+        if lower >= higher:
+            raise ValueError("LOD ratios must decrease")
+    return ratios
+
+
+def lod_file_names(name, count):
+    return [f"{name}_LOD{level}.fbx" for level in range(count)]
+
+
+class LodChain:
+    """Temporary LOD meshes for one object, nothing left on it afterwards.
+
+    The modifier stack is evaluated once into LOD0's source mesh. Each further
+    LOD swaps the previous LOD in as obj.data and evaluates a throwaway Decimate
+    modifier with the *relative* ratio, so LODn is decimated from LODn-1 rather
+    than from full res. While the chain is open the baked modifiers are off, so
+    use(mesh) + any exporter writes exactly that LOD.
+
+    Only the modifiers above the first Armature are baked. The Armature and
+    everything after it stay live, so the LODs keep the rest pose and their
+    (decimate-interpolated) vertex groups, and the exporter skins them as usual.
+    """
+
+    def __init__(self, obj, depsgraph, ratios):
+        self.obj = obj
+        self.depsgraph = depsgraph
+        self.ratios = ratios
+        self.meshes = []            # one per ratio, LOD0 first
+        self._created = []
+        self._original = None
+        self._modifiers = []
+        self._live = []
+
+    def __enter__(self):
+        obj = self.obj
+        depsgraph = self.depsgraph
+        self._original = obj.data
+        self._modifiers = [(mod, mod.show_viewport, mod.show_render) for mod in obj.modifiers]
+        split = next((i for i, (mod, _, _) in enumerate(self._modifiers) if mod.type == 'ARMATURE'), len(self._modifiers))
+        self._live = self._modifiers[split:]
+
+        # Evaluate without the pose - baking the Armature would skin the LODs twice
+        for mod, _, _ in self._live:
+            mod.show_viewport = False
+            mod.show_render = False
+        if self._live:
+            depsgraph.update()
+
+        current = bpy.data.meshes.new_from_object(
+            obj.evaluated_get(depsgraph), preserve_all_data_layers=True, depsgraph=depsgraph
+        )
+        self._created.append(current)
+        for mod, _, _ in self._modifiers[:split]:
+            mod.show_viewport = False
+            mod.show_render = False
+
+        decimate = obj.modifiers.new(name="DH_LOD", type='DECIMATE')
+        try:
+            previous_ratio = 1.0
+            for ratio in self.ratios:
+                relative = ratio / previous_ratio
+                if relative < 0.9999:
+                    obj.data = current
+                    decimate.ratio = relative
+                    depsgraph.update()
+                    current = bpy.data.meshes.new_from_object(
+                        obj.evaluated_get(depsgraph), preserve_all_data_layers=True, depsgraph=depsgraph
+                    )
+                    self._created.append(current)
+                self.meshes.append(current)
+                previous_ratio = ratio
+        except Exception:
+            obj.modifiers.remove(decimate)
+            self._restore()
+            raise
+        obj.modifiers.remove(decimate)
+
+        for mod, show_viewport, show_render in self._live:
+            mod.show_viewport = show_viewport
+            mod.show_render = show_render
+        return self
+
+    def use(self, mesh):
+        self.obj.data = mesh
+
+    def _restore(self):
+        self.obj.data = self._original
+        for mod, show_viewport, show_render in self._modifiers:
+            mod.show_viewport = show_viewport
+            mod.show_render = show_render
+        bpy.data.batch_remove(self._created)
+        self._created = []
+        self.meshes = []
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._restore()
+        return False
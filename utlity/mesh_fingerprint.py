@@ -0,0 +1,200 @@
+import hashlib
+import numpy as np
+
+
+def read_vertex_coords(mesh):
+    """Local vertex positions as an (N, 3) float32 array via foreach_get"""
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    return coords.reshape(-1, 3)
+
+
+def quantize_coords(coords, precision=3):
+    """Round coordinates to `precision` decimals as int64, sorted so vertex order doesn't matter"""
+    quantized = np.round(coords.astype(np.float64) * (10 ** precision)).astype(np.int64)
+    if len(quantized):
+        quantized = quantized[np.lexsort((quantized[:, 2], quantized[:, 1], quantized[:, 0]))]
+    return quantized
+
+
+def hash_geometry(stats, quantized):
+    """blake2b digest of topology counts + quantized vertex buffer"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.asarray(stats, dtype=np.int64).tobytes())
+    digest.update(np.ascontiguousarray(quantized).tobytes())
+    return digest.hexdigest()
+
+
+def read_loop_vertices(mesh):
+    """Face-corner vertex indices as an int32 array via foreach_get"""
+    loops = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loops)
+    return loops
+
+
+# foreach_get property, buffer dtype and width per attribute data type
+ATTRIBUTE_LAYOUT = {
+    'FLOAT': ("value", np.float32, 1),
+    'INT': ("value", np.int32, 1),
+    'INT8': ("value", np.int32, 1),
+    'BOOLEAN': ("value", bool, 1),
+    'FLOAT2': ("vector", np.float32, 2),
+    'FLOAT_VECTOR': ("vector", np.float32, 3),
+    'INT16_2D': ("value", np.int32, 2),
+    'INT32_2D': ("value", np.int32, 2),
+    'FLOAT_COLOR': ("color", np.float32, 4),
+    'BYTE_COLOR': ("color", np.float32, 4),
+    'QUATERNION': ("value", np.float32, 4),
+    'FLOAT4X4': ("value", np.float32, 16),
+}
+
+# Internal layers that still decide which element a per-edge / per-corner value lands on
+INDEXING_ATTRIBUTES = (".edge_verts", ".corner_edge")
+
+
+def hash_mesh_data(digest, mesh):
+    """Feed every mesh-level layer an instance would share into `digest`.
+
+    UV maps, color attributes, custom normals, seams, sharp flags, creases and
+    any other named attribute - everything except positions and the dotted
+    internal/UI layers (selection, hide state), plus the edge indexing those
+    per-edge layers depend on.
+    """
+    attributes = sorted(
+        (attribute for attribute in mesh.attributes
+         if attribute.name != "position"
+         and (not attribute.name.startswith(".") or attribute.name in INDEXING_ATTRIBUTES)),
+        key=lambda attribute: attribute.name,
+    )
+    for attribute in attributes:
+        digest.update(f"{attribute.name}|{attribute.domain}|{attribute.data_type}".encode())
+        layout = ATTRIBUTE_LAYOUT.get(attribute.data_type)
+        if layout is None:
+            # Strings have no foreach_get - compare them one by one
+            digest.update("\0".join(item.value for item in attribute.data).encode())
+            continue
+        prop, dtype, width = layout
+        buffer = np.empty(len(attribute.data) * width, dtype=dtype)
+        attribute.data.foreach_get(prop, buffer)
+        digest.update(buffer.tobytes())
+
+
+def hash_deform_weights(digest, mesh):
+    """Feed (vertex, group index, weight) for every deform weight into `digest` - a Python loop, so only call it for weighted meshes"""
+    weights = [
+        (vertex.index, group.group, group.weight)
+        for vertex in mesh.vertices
+        for group in vertex.groups
+    ]
+    digest.update(np.array(weights, dtype=np.float64).tobytes())
+
+
+def canonical_frame(coords, eigen_gap=1e-4):
+    """Pose-normalize a point set: centroid, PCA axes with skew-fixed signs, RMS radius.
+
+    Returns (centroid, axes, scale, canonical) where canonical = (coords - centroid) @ axes / scale,
+    so coords = centroid + scale * canonical @ axes.T. Axes fall back to identity when the
+    principal axes are ambiguous (cube-like or sphere-like spreads). Returns None for
+    empty or zero-size meshes.
+    """
+    if len(coords) == 0:
+        return None
+    coords = coords.astype(np.float64)
+    centroid = coords.mean(axis=0)
+    centered = coords - centroid
+
+    scale = float(np.sqrt((centered ** 2).sum(axis=1).mean()))
+    if scale <= 0.0:
+        return None
+
+    values, vectors = np.linalg.eigh(centered.T @ centered / len(coords))
+    values, vectors = values[::-1], vectors[:, ::-1]  # Largest spread first
+
+    gaps = np.abs(np.diff(values)) / max(values[0], 1e-12)
+    if np.any(gaps < eigen_gap):
+        axes = np.eye(3)
+    else:
+        axes = vectors.copy()
+        # Eigenvectors have no sign - point each axis toward the heavier tail
+        skew = ((centered @ axes) ** 3).sum(axis=0)
+        axes[:, skew < 0.0] *= -1.0
+
+    canonical = (centered @ axes) / scale
+    return centroid, axes, scale, canonical
+
+
+def frame_to_frame_matrix(frame_from, frame_to):
+    """4x4 NumPy matrix mapping points of the `frame_from` mesh onto the `frame_to` mesh"""
+    centroid_a, axes_a, scale_a, _ = frame_from
+    centroid_b, axes_b, scale_b, _ = frame_to
+
+    linear = (scale_b / scale_a) * (axes_b @ axes_a.T)
+    matrix = np.eye(4)
+    matrix[:3, :3] = linear
+    matrix[:3, 3] = centroid_b - linear @ centroid_a
+    return matrix
+
+
+class MeshFingerprintCache:
+    """Exact geometry fingerprints, hashed once per mesh datablock per cleanup run.
+
+    A signature is ((verts, edges, faces), digest) so callers can still compare
+    the cheap topology counts first. Objects sharing a mesh share the cache entry.
+    """
+
+    def __init__(self, precision=3):
+        self.precision = precision
+        self._signatures = {}
+        self._canonical = {}
+
+    def signature(self, obj):
+        """Get (stats, digest) for a mesh object, or None if it has no mesh data"""
+        if obj.type != 'MESH' or not obj.data:
+            return None
+        mesh = obj.data
+        key = mesh.name_full
+        if key not in self._signatures:
+            stats = (len(mesh.vertices), len(mesh.edges), len(mesh.polygons))
+            quantized = quantize_coords(read_vertex_coords(mesh), self.precision)
+            self._signatures[key] = (stats, hash_geometry(stats, quantized))
+        return self._signatures[key]
+
+    def prime(self, mesh_name, signature):
+        """Seed a signature computed elsewhere (e.g. by a worker process) for a mesh name"""
+        self._signatures[mesh_name] = signature
+
+    def canonical_signature(self, mesh, weights=False):
+        """Pose-invariant (signature, frame) for a mesh, or (None, None) if it can't be normalized.
+
+        Two meshes match when they are the same part moved, rotated or uniformly
+        scaled inside the mesh data. Topology (loop order), material slots, UVs,
+        color and other attributes, custom normals and - with `weights` - deform
+        weights are part of the key, so a matched pair can safely share one datablock.
+        """
+        key = (mesh.name_full, weights)
+        if key not in self._canonical:
+            frame = canonical_frame(read_vertex_coords(mesh))
+            if frame is None:
+                self._canonical[key] = (None, None)
+            else:
+                stats = (len(mesh.vertices), len(mesh.edges), len(mesh.polygons))
+                digest = hashlib.blake2b(digest_size=16)
+                digest.update(read_loop_vertices(mesh).tobytes())
+                digest.update("|".join(mat.name_full if mat else "" for mat in mesh.materials).encode())
+                hash_mesh_data(digest, mesh)
+                if weights:
+                    hash_deform_weights(digest, mesh)
+                topology = digest.hexdigest()
+                quantized = np.round(frame[3] * (10 ** self.precision)).astype(np.int64)
+                self._canonical[key] = ((stats, topology, hash_geometry(stats, quantized)), frame)
+        return self._canonical[key]
+
+    def invalidate(self, mesh_name):
+        """Forget a mesh whose geometry changed"""
+        self._signatures.pop(mesh_name, None)
+        self._canonical.pop((mesh_name, False), None)
+        self._canonical.pop((mesh_name, True), None)
+
+    def clear(self):
+        self._signatures.clear()
+        self._canonical.clear()
@@ -0,0 +1,249 @@
+import hashlib
+import numpy as np
+
+
+def label_components(count, pairs):
+    """Connected-component label per element, given (k, 2) index pairs joining them.
+
+    Vectorized union-find: every round hooks the larger root of each joined
+    pair onto the smaller one, then pointer-jumps until every element points
+    at its root. Pairs already inside one component drop out, so rounds get
+    cheaper and the count stays logarithmic in practice. Labels are the
+    smallest element index of each component.
+    """
+    parent = np.arange(count, dtype=np.int64)
+    a = pairs[:, 0].astype(np.int64)
+    b = pairs[:, 1].astype(np.int64)
+    while len(a):
+        root_a = parent[a]
+        root_b = parent[b]
+        crossing = root_a != root_b
+        a, b = a[crossing], b[crossing]
+        root_a, root_b = root_a[crossing], root_b[crossing]
+        if not len(a):
+            break
+        np.minimum.at(parent, np.maximum(root_a, root_b), np.minimum(root_a, root_b))
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
+    return parent
+
+
+class RegionIndex:
+    """Element lists per label, so a lookup is one slice instead of a walk"""
+
+    def __init__(self, labels):
+        self.labels = labels
+        self.order = np.argsort(labels, kind='stable')
+        sorted_labels = labels[self.order]
+        self.starts = np.searchsorted(sorted_labels, labels, side='left')
+        self.ends = np.searchsorted(sorted_labels, labels, side='right')
+
+    def members(self, index):
+        """Every element sharing `index`'s label"""
+        return self.order[self.starts[index]:self.ends[index]]
+
+    def members_of_all(self, indices):
+        """Every element sharing a label with any of `indices`, and how many labels that was"""
+        labels = np.unique(self.labels[indices])
+        return np.flatnonzero(np.isin(self.labels, labels)), len(labels)
+
+
+# Face-region fill modes: faces join across an edge only if the mode says they belong together
+REGION_MODES = ('UV_ISLAND', 'MATERIAL', 'FACE_SET', 'NORMAL')
+UV_EPSILON = 1e-6
+
+
+def _read(mesh, attribute_name, attribute_prop, collection, prop, count, dtype, width=1):
+    """foreach_get from the raw attribute when it exists, else through RNA"""
+    buffer = np.empty(count * width, dtype=dtype)
+    attribute = mesh.attributes.get(attribute_name)
+    if attribute is not None:
+        attribute.data.foreach_get(attribute_prop, buffer)
+    elif collection is not None:
+        collection.foreach_get(prop, buffer)
+    else:
+        return None
+    return buffer.reshape(-1, width) if width > 1 else buffer
+
+
+def _read_edges(mesh):
+    return _read(mesh, ".edge_verts", "value", mesh.edges, "vertices", len(mesh.edges), np.int32, 2)
+
+
+def topology_key(mesh, edges):
+    """Changes whenever vertices are added/removed or rewired, not when they move or get weights"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.array((len(mesh.vertices), len(mesh.polygons), len(mesh.loops)), dtype=np.int64).tobytes())
+    digest.update(edges.tobytes())
+    return digest.hexdigest()
+
+
+# mesh name -> MeshRegions, reused across modal sessions while the topology holds
+_cache = {}
+CACHE_SIZE = 4
+
+
+class MeshRegions:
+    """Precomputed shells (connected vertex sets) and face regions for one mesh.
+
+    Shells are labelled up front. Face regions (UV island, material, face
+    set, normal angle) share one face-adjacency table built on first use,
+    and each mode's labels are kept with a hash of the data they came from,
+    so switching back to a mode is a dictionary hit as long as the UVs,
+    materials, face sets or shape haven't changed.
+    """
+
+    def __init__(self, mesh, edges, key):
+        self.key = key
+        self.vertex_count = len(mesh.vertices)
+        self.shells = RegionIndex(label_components(self.vertex_count, edges))
+        self.topology = None
+        self.face_regions_cache = {}    # mode -> (data key, RegionIndex over faces)
+
+    def shell_vertices(self, vertex_index):
+        return self.shells.members(vertex_index)
+
+    def shells_vertices(self, vertex_indices):
+        """(vertices, shell count) for every shell containing one of `vertex_indices`"""
+        return self.shells.members_of_all(vertex_indices)
+
+    def _topology(self, mesh):
+        """Corner arrays and edge-adjacent face pairs - the same for every region mode"""
+        if self.topology is not None:
+            return self.topology
+
+        corner_count = len(mesh.loops)
+        face_count = len(mesh.polygons)
+        loop_verts = _read(mesh, ".corner_vert", "value", mesh.loops, "vertex_index", corner_count, np.int32)
+        corner_edges = _read(mesh, ".corner_edge", "value", mesh.loops, "edge_index", corner_count, np.int32)
+        loop_totals = np.empty(face_count, dtype=np.int32)
+        mesh.polygons.foreach_get("loop_total", loop_totals)
+        loop_starts = np.empty(face_count, dtype=np.int32)
+        mesh.polygons.foreach_get("loop_start", loop_starts)
+        corner_faces = np.repeat(np.arange(face_count, dtype=np.int32), loop_totals)
+
+        # Next corner around each face, for the far end of a corner's edge
+        next_corners = np.arange(1, corner_count + 1, dtype=np.int64)
+        next_corners[loop_starts + loop_totals - 1] = loop_starts
+
+        # Corners sharing an edge, chained pairwise so non-manifold fans stay connected
+        order = np.argsort(corner_edges, kind='stable')
+        shared = corner_edges[order[:-1]] == corner_edges[order[1:]]
+        corner_a = order[:-1][shared]
+        corner_b = order[1:][shared]
+
+        self.topology = {
+            "loop_verts": loop_verts,
+            "loop_totals": loop_totals,
+            "loop_starts": loop_starts,
+            "corner_faces": corner_faces,
+            "next_corners": next_corners,
+            "corner_a": corner_a,
+            "corner_b": corner_b,
+            "face_pairs": np.stack((corner_faces[corner_a], corner_faces[corner_b]), axis=1),
+        }
+        return self.topology
+
+    def _mode_data(self, mode, mesh, angle):
+        """(data key, array) - the per-corner or per-face data a region mode splits on"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(mode.encode())
+
+        if mode == 'UV_ISLAND':
+            uv_layer = mesh.uv_layers.active
+            if uv_layer is None:
+                raise ValueError("mesh has no UV map")
+            data = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+            uv_layer.uv.foreach_get("vector", data)
+            data = data.reshape(-1, 2)
+            digest.update(uv_layer.name.encode())
+        elif mode in {'MATERIAL', 'FACE_SET'}:
+            attribute_name = "material_index" if mode == 'MATERIAL' else ".sculpt_face_set"
+            data = _read(mesh, attribute_name, "value", None, None, len(mesh.polygons), np.int32)
+            if data is None:
+                data = np.zeros(len(mesh.polygons), dtype=np.int32)     # one material / face set
+        elif mode == 'NORMAL':
+            data = np.empty(len(mesh.polygons) * 3, dtype=np.float32)
+            mesh.polygon_normals.foreach_get("vector", data)
+            data = data.reshape(-1, 3)
+            digest.update(np.float64(angle).tobytes())
+        else:
+            raise ValueError(f"unknown region mode {mode}")
+
+        digest.update(data.tobytes())
+        return digest.hexdigest(), data
+
+    def _joined(self, mode, data, angle):
+        """Bool per face pair: do the two faces belong to the same region?"""
+        topology = self.topology
+        face_a, face_b = topology["face_pairs"].T
+
+        if mode == 'UV_ISLAND':
+            # Both ends of the shared edge must have the same UV on each side
+            loop_verts = topology["loop_verts"]
+            next_corners = topology["next_corners"]
+            a_start, b_start = topology["corner_a"], topology["corner_b"]
+            a_end, b_end = next_corners[a_start], next_corners[b_start]
+            same_direction = loop_verts[a_start] == loop_verts[b_start]
+            b_first = np.where(same_direction, b_start, b_end)
+            b_second = np.where(same_direction, b_end, b_start)
+            return (
+                np.all(np.abs(data[a_start] - data[b_first]) <= UV_EPSILON, axis=1)
+                & np.all(np.abs(data[a_end] - data[b_second]) <= UV_EPSILON, axis=1)
+            )
+        if mode == 'NORMAL':
+            return np.einsum('ij,ij->i', data[face_a], data[face_b]) >= np.cos(angle)
+        return data[face_a] == data[face_b]
+
+    def face_regions(self, mode, mesh, angle=0.0):
+        """RegionIndex over faces for `mode`, reused while the data behind it is unchanged"""
+        data_key, data = self._mode_data(mode, mesh, angle)
+        cached = self.face_regions_cache.get(mode)
+        if cached is not None and cached[0] == data_key:
+            return cached[1]
+
+        topology = self._topology(mesh)
+        pairs = topology["face_pairs"][self._joined(mode, data, angle)]
+        index = RegionIndex(label_components(len(mesh.polygons), pairs))
+        self.face_regions_cache[mode] = (data_key, index)
+        return index
+
+    def face_vertices(self, faces):
+        """Unique vertices used by `faces`"""
+        topology = self.topology
+        totals = topology["loop_totals"][faces].astype(np.int64)
+        starts = topology["loop_starts"][faces].astype(np.int64)
+        corners = np.repeat(starts - (np.cumsum(totals) - totals), totals) + np.arange(int(totals.sum()))
+        return np.unique(topology["loop_verts"][corners])
+
+    def region_vertices(self, index, face):
+        """Vertices of the region containing `face`"""
+        return self.face_vertices(index.members(face))
+
+    def regions_vertices(self, index, vertex_indices):
+        """(vertices, region count) for every region with a face touching one of `vertex_indices`"""
+        topology = self.topology
+        touched = np.zeros(self.vertex_count, dtype=bool)
+        touched[vertex_indices] = True
+        faces = np.unique(topology["corner_faces"][touched[topology["loop_verts"]]])
+        if not len(faces):
+            return np.empty(0, dtype=np.int64), 0
+        region_faces, count = index.members_of_all(faces)
+        return self.face_vertices(region_faces), count
+
+
+def mesh_regions(mesh):
+    """Cached MeshRegions for `mesh`, rebuilt only if its topology changed"""
+    edges = _read_edges(mesh)
+    key = topology_key(mesh, edges)
+    regions = _cache.get(mesh.name_full)
+    if regions is None or regions.key != key:
+        regions = MeshRegions(mesh, edges, key)
+        _cache.pop(mesh.name_full, None)
+        _cache[mesh.name_full] = regions
+        while len(_cache) > CACHE_SIZE:
+            del _cache[next(iter(_cache))]
+    return regions
@@ -0,0 +1,217 @@
+# Streaming OBJ / binary PLY writers for very dense meshes.
+# Meshes are read one at a time: arrays come out of the mesh with foreach_get
+# (compact binary), the temporary evaluated copy is freed, and text or bytes
+# are produced CHUNK rows at a time through a large buffered file. Peak extra
+# memory is one mesh's arrays plus one chunk, not the whole selection, and no
+# Python code runs per vertex.
+from contextlib import contextmanager
+import numpy as np
+
+CHUNK = 1 << 18             # vertices / faces formatted per block
+BUFFER_SIZE = 1 << 22       # file write buffer
+
+# Blender Z-up -> Y-up with -Z forward, same as the stock OBJ exporter default
+Y_UP = np.array(((1.0, 0.0, 0.0), (0.0, 0.0, 1.0), (0.0, -1.0, 0.0)))
+
+
+def _read_array(mesh, attribute_name, attribute_prop, collection, prop, count, dtype):
+    """foreach_get from the raw attribute when it exists - for 'position' and
+    '.corner_vert' that is a straight memcpy, 10-100x faster than going through
+    MeshVertex/MeshLoop RNA on multi-million element meshes"""
+    buffer = np.empty(count, dtype=dtype)
+    attribute = mesh.attributes.get(attribute_name)
+    if attribute is not None:
+        attribute.data.foreach_get(attribute_prop, buffer)
+    else:
+        collection.foreach_get(prop, buffer)
+    return buffer
+
+
+class StreamMesh:
+    """Everything the writers need from one mesh, read with foreach_get.
+
+    `coords` / `faces` can be turned off to read only half - the PLY writer
+    needs every mesh's vertices before any faces.
+    """
+
+    def __init__(self, name, mesh, matrix=None, coords=True, faces=True):
+        self.name = name
+        self.coords = None
+        self.loop_verts = self.loop_totals = self.loop_starts = None
+        if coords:
+            self.coords = _read_array(
+                mesh, "position", "vector", mesh.vertices, "co", len(mesh.vertices) * 3, np.float32
+            ).reshape(-1, 3)
+        if faces:
+            self.loop_verts = _read_array(
+                mesh, ".corner_vert", "value", mesh.loops, "vertex_index", len(mesh.loops), np.int32
+            )
+            self.loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+            mesh.polygons.foreach_get("loop_total", self.loop_totals)
+            self.loop_starts = np.concatenate(([0], np.cumsum(self.loop_totals, dtype=np.int64)[:-1]))
+        self.matrix = None if matrix is None else np.asarray(matrix, dtype=np.float64)
+        # A mirroring transform turns faces inside out unless their corners are reversed
+        self.flip = self.matrix is not None and np.linalg.det(self.matrix[:3, :3]) < 0.0
+
+    def vertex_block(self, start, end):
+        block = self.coords[start:end]
+        if self.matrix is None:
+            return block
+        return (block @ self.matrix[:3, :3].T + self.matrix[:3, 3]).astype(np.float32)
+
+    def face_block(self, start, end):
+        """(vertex indices, polygon sizes) for faces start:end"""
+        totals = self.loop_totals[start:end]
+        first = self.loop_starts[start]
+        indices = self.loop_verts[first:first + int(totals.sum())]
+        if self.flip:
+            # Corner p of a face spanning [s, e) swaps with corner s + e - 1 - p
+            face_ends = np.cumsum(totals, dtype=np.int64)
+            mirror = np.repeat(2 * face_ends - totals - 1, totals)
+            indices = indices[mirror - np.arange(len(indices))]
+        return indices, totals
+
+
+class MeshSource:
+    """One object to export: counts up front, the mesh itself only while open.
+
+    With a depsgraph the evaluated mesh (modifiers applied) is used; the
+    to_mesh() copy lives only inside open(), so a selection of dense sculpts
+    never has more than one evaluated copy around.
+    """
+
+    def __init__(self, obj, depsgraph=None, matrix=None):
+        self.obj = obj
+        self.name = obj.name
+        self.depsgraph = depsgraph
+        self.matrix = None if matrix is None else np.asarray(matrix, dtype=np.float64)
+        if obj.mode == 'EDIT':
+            # obj.data only catches up with the edit-mode mesh when asked to
+            obj.update_from_editmode()
+        # The evaluated mesh is already in the depsgraph - len() reads its counts without a copy
+        mesh = self._peek()
+        self.vertex_count = len(mesh.vertices)
+        self.face_count = len(mesh.polygons)
+
+    def _peek(self):
+        return self.obj.evaluated_get(self.depsgraph).data if self.depsgraph is not None else self.obj.data
+
+    def max_corners(self):
+        """Largest polygon size, read without a to_mesh() copy"""
+        if not self.face_count:
+            return 0
+        totals = np.empty(self.face_count, dtype=np.int32)
+        self._peek().polygons.foreach_get("loop_total", totals)
+        return int(totals.max())
+
+    @contextmanager
+    def open(self):
+        if self.depsgraph is None:
+            # No copy - read straight from the original datablock
+            yield self.obj.data
+            return
+        obj_eval = self.obj.evaluated_get(self.depsgraph)
+        try:
+            yield obj_eval.to_mesh()
+        finally:
+            obj_eval.to_mesh_clear()
+
+    def read(self, coords=True, faces=True):
+        """StreamMesh of this source, with the temporary mesh already freed"""
+        with self.open() as mesh:
+            return StreamMesh(self.name, mesh, self.matrix, coords, faces)
+
+
+def _size_runs(totals):
+    """(start, end) of runs of equal polygon size - a sculpt is usually one run"""
+    edges = np.flatnonzero(np.diff(totals)) + 1
+    bounds = [0, *edges.tolist(), len(totals)]
+    return zip(bounds[:-1], bounds[1:])
+
+
+def write_obj(filepath, sources, chunk=CHUNK):
+    """Positions and faces only - what sculpt round-trips need. Returns the face count."""
+    offset = 1
+    faces = 0
+    with open(filepath, 'w', encoding='utf-8', newline='\n', buffering=BUFFER_SIZE) as f:
+        f.write("# DH Toolkit streaming OBJ\n")
+        for source in sources:
+            mesh = source.read()
+            f.write(f"o {mesh.name}\n")
+
+            for start in range(0, len(mesh.coords), chunk):
+                block = mesh.vertex_block(start, start + chunk)
+                f.write(("v %.6f %.6f %.6f\n" * len(block)) % tuple(block.ravel().tolist()))
+
+            for start in range(0, len(mesh.loop_totals), chunk):
+                indices, totals = mesh.face_block(start, start + chunk)
+                indices = indices.astype(np.int64) + offset
+                loop = 0
+                for run_start, run_end in _size_runs(totals):
+                    size = int(totals[run_start])
+                    count = run_end - run_start
+                    run = indices[loop:loop + size * count]
+                    f.write((("f" + " %d" * size + "\n") * count) % tuple(run.tolist()))
+                    loop += size * count
+
+            offset += len(mesh.coords)
+            faces += len(mesh.loop_totals)
+            del mesh    # before the next source is read
+    return faces
+
+
+def _ply_face_bytes(indices, totals):
+    """Binary PLY face records (uchar count + int32 indices each), one packed record array per size run"""
+    parts = []
+    loop = 0
+    for run_start, run_end in _size_runs(totals):
+        size = int(totals[run_start])
+        count = run_end - run_start
+        records = np.empty(count, dtype=np.dtype([('count', 'u1'), ('indices', '<i4', (size,))]))
+        records['count'] = size
+        records['indices'] = indices[loop:loop + size * count].reshape(count, size)
+        parts.append(records.tobytes())
+        loop += size * count
+    return b"".join(parts)
+
+
+def write_ply(filepath, sources, chunk=CHUNK):
+    """Binary little-endian PLY, all meshes merged into one vertex/face list. Returns the face count.
+
+    PLY wants every vertex before the first face, so each source is read twice:
+    positions on the first pass, faces on the second - never both at once.
+    """
+    vertex_total = sum(source.vertex_count for source in sources)
+    face_total = sum(source.face_count for source in sources)
+    if any(source.max_corners() > 255 for source in sources):
+        raise ValueError("PLY face lists are limited to 255 corners - triangulate large n-gons first")
+
+    header = (
+        "ply\n"
+        "format binary_little_endian 1.0\n"
+        "comment DH Toolkit streaming PLY\n"
+        f"element vertex {vertex_total}\n"
+        "property float x\n"
+        "property float y\n"
+        "property float z\n"
+        f"element face {face_total}\n"
+        "property list uchar int vertex_indices\n"
+        "end_header\n"
+    )
+    with open(filepath, 'wb', buffering=BUFFER_SIZE) as f:
+        f.write(header.encode('ascii'))
+        for source in sources:
+            mesh = source.read(faces=False)
+            for start in range(0, len(mesh.coords), chunk):
+                f.write(mesh.vertex_block(start, start + chunk).astype('<f4').tobytes())
+            del mesh
+
+        offset = 0
+        for source in sources:
+            mesh = source.read(coords=False)
+            for start in range(0, len(mesh.loop_totals), chunk):
+                indices, totals = mesh.face_block(start, start + chunk)
+                f.write(_ply_face_bytes(indices + offset, totals))
+            offset += source.vertex_count
+            del mesh
+    return face_total
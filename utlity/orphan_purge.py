@@ -0,0 +1,96 @@
+import bpy
+
+# (enum id, label, bpy.data collection, bpy.types class name)
+PURGE_TYPES = (
+    ('MESH', "Meshes", "meshes", "Mesh"),
+    ('CURVE', "Curves", "curves", "Curve"),
+    ('ARMATURE', "Armatures", "armatures", "Armature"),
+    ('ACTION', "Actions", "actions", "Action"),
+    ('MATERIAL', "Materials", "materials", "Material"),
+    ('NODETREE', "Node Groups", "node_groups", "NodeTree"),
+    ('TEXTURE', "Textures", "textures", "Texture"),
+    ('IMAGE', "Images", "images", "Image"),
+    ('LIGHT', "Lights", "lights", "Light"),
+    ('CAMERA', "Cameras", "cameras", "Camera"),
+    ('WORLD', "Worlds", "worlds", "World"),
+)
+
+PURGE_TYPE_ITEMS = [(key, label, f"Purge orphan {label.lower()}") for key, label, _, _ in PURGE_TYPES]
+DEFAULT_PURGE_TYPES = {'MESH', 'CURVE', 'ARMATURE', 'ACTION'}
+
+
+def estimate_bytes(block):
+    """Rough in-memory size of a datablock's bulk data (0 if we don't know how to size it)"""
+    if isinstance(block, bpy.types.Mesh):
+        # co + edge pairs + loop vert/edge + face start/total, as stored
+        return (len(block.vertices) * 12 + len(block.edges) * 8
+                + len(block.loops) * 8 + len(block.polygons) * 8)
+    if isinstance(block, bpy.types.Image):
+        if not block.has_data:
+            return 0
+        width, height = block.size
+        return width * height * block.channels * (4 if block.is_float else 1)
+    if isinstance(block, bpy.types.Curve):
+        return sum(len(spline.points) * 16 + len(spline.bezier_points) * 40 for spline in block.splines)
+    if isinstance(block, bpy.types.Action):
+        return sum(len(fcurve.keyframe_points) * 36 for fcurve in block.fcurves)
+    return 0
+
+
+def _is_orphan(block):
+    return block.users == 0 and not block.use_fake_user
+
+
+def purge_orphans(types, do_linked=True):
+    """Free zero-user datablocks of the picked types, in dependency order.
+
+    bpy.data.user_map() is built once for the picked types and inverted, so after
+    each wave only the blocks the freed ones were using get re-checked (an orphan
+    material can orphan its node groups and images, and so on). Returns
+    {type id: {'count': n, 'bytes': estimate}}.
+    """
+    picked = [(key, getattr(bpy.data, attr)) for key, _, attr, _ in PURGE_TYPES if key in types]
+    stats = {key: {'count': 0, 'bytes': 0} for key, _ in picked}
+    if not picked:
+        return stats
+
+    type_of = {}
+    for key, blocks in picked:
+        for block in blocks:
+            if do_linked or not block.library:
+                type_of[block] = key
+
+    # user_map: block -> blocks using it. Invert it to block -> blocks it uses.
+    uses = {}
+    for used, users in bpy.data.user_map(subset=list(type_of)).items():
+        for user in users:
+            if user in type_of:
+                uses.setdefault(user, set()).add(used)
+
+    wave = [block for block in type_of if _is_orphan(block)]
+    while wave:
+        # Size everything before freeing - the RNA is gone afterwards
+        next_check = set()
+        for block in wave:
+            entry = stats[type_of[block]]
+            entry['count'] += 1
+            entry['bytes'] += estimate_bytes(block)
+            next_check |= uses.pop(block, set())
+            del type_of[block]
+
+        # Drop anything freed in this wave before the pointers go stale
+        next_check = [block for block in next_check if block in type_of]
+
+        bpy.data.batch_remove(wave)
+        print(f"🗑️ Purge wave: {len(wave)} blocks")
+
+        wave = [block for block in next_check if _is_orphan(block)]
+
+    return stats
+
+
+def format_bytes(size):
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
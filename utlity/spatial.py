@@ -0,0 +1,139 @@
+import math
+import numpy as np
+
+
+def collect_world_bboxes(objects):
+    """World-space AABBs for every object in a bpy collection, in one batched pass.
+
+    bound_box and matrix_world are pulled with foreach_get into stacked arrays
+    and all 8 corners of every object are transformed with a single matmul.
+    Returns an (N, 6) float64 array of (min_x, max_x, min_y, max_y, min_z, max_z)
+    rows in collection order.
+    """
+    count = len(objects)
+    if count == 0:
+        return np.empty((0, 6))
+
+    corners = np.empty(count * 24, dtype=np.float32)
+    matrices = np.empty(count * 16, dtype=np.float32)
+    try:
+        objects.foreach_get("bound_box", corners)
+        objects.foreach_get("matrix_world", matrices)
+    except (AttributeError, TypeError, RuntimeError):
+        # Plain Python lists of objects - gather per object instead
+        corners = np.array([[tuple(corner) for corner in obj.bound_box] for obj in objects], dtype=np.float32)
+        matrices = np.array([[tuple(col) for col in obj.matrix_world.col] for obj in objects], dtype=np.float32)
+
+    corners = corners.reshape(count, 8, 3).astype(np.float64)
+    # RNA matrices come out column-major: rows of this array are the matrix columns
+    matrices = matrices.reshape(count, 4, 4).astype(np.float64)
+
+    world = corners @ matrices[:, :3, :3] + matrices[:, 3, np.newaxis, :3]
+    mins = world.min(axis=1)
+    maxs = world.max(axis=1)
+
+    return np.stack((mins[:, 0], maxs[:, 0], mins[:, 1], maxs[:, 1], mins[:, 2], maxs[:, 2]), axis=1)
+
+
+def collect_mesh_bboxes(objects):
+    """Filter a bpy object collection to meshes and return (mesh_objects, (M, 6) world bboxes)"""
+    is_mesh = np.array([obj.type == 'MESH' and obj.data is not None for obj in objects], dtype=bool)
+    mesh_objects = [obj for obj, keep in zip(objects, is_mesh) if keep]
+    return mesh_objects, collect_world_bboxes(objects)[is_mesh]
+
+
+def bboxes_overlap(bbox1, bbox2, tolerance=0.1):
+    """Check if two (min_x, max_x, min_y, max_y, min_z, max_z) boxes overlap with tolerance"""
+    if not (bbox1 and bbox2):
+        return False
+
+    min_x1, max_x1, min_y1, max_y1, min_z1, max_z1 = bbox1
+    min_x2, max_x2, min_y2, max_y2, min_z2, max_z2 = bbox2
+
+    # Check overlap on each axis with tolerance
+    x_overlap = not (max_x1 + tolerance < min_x2 or max_x2 + tolerance < min_x1)
+    y_overlap = not (max_y1 + tolerance < min_y2 or max_y2 + tolerance < min_y1)
+    z_overlap = not (max_z1 + tolerance < min_z2 or max_z2 + tolerance < min_z1)
+
+    return x_overlap and y_overlap and z_overlap
+
+
+def find_overlapping_pairs(bboxes, tolerance=0.1, max_cells_per_box=64):
+    """Broadphase: return sorted (i, j) index pairs, i < j, whose boxes overlap.
+
+    Boxes are hashed into a uniform grid sized from the median box extent, so
+    only boxes sharing a cell get the exact overlap test. Entries that are None
+    are ignored. Boxes covering more than max_cells_per_box cells (ground
+    planes and the like) skip the grid and are tested against everything.
+    """
+    if hasattr(bboxes, "tolist"):
+        # NumPy rows from collect_world_bboxes - plain floats are much faster to index
+        bboxes = bboxes.tolist()
+    boxes = [(i, bbox) for i, bbox in enumerate(bboxes) if bbox]
+    if len(boxes) < 2:
+        return []
+
+    # Cell size = median largest extent (+ tolerance) keeps most boxes in 1-8 cells
+    extents = sorted(
+        max(bbox[1] - bbox[0], bbox[3] - bbox[2], bbox[5] - bbox[4]) + tolerance
+        for _, bbox in boxes
+    )
+    cell_size = extents[len(extents) // 2]
+    if not cell_size > 0.0:
+        cell_size = 1.0
+    inv = 1.0 / cell_size
+
+    grid = {}
+    oversized = []
+    for i, bbox in boxes:
+        # Only grow the max side - two grown boxes touch exactly when bboxes_overlap() says so
+        x0, x1 = math.floor(bbox[0] * inv), math.floor((bbox[1] + tolerance) * inv)
+        y0, y1 = math.floor(bbox[2] * inv), math.floor((bbox[3] + tolerance) * inv)
+        z0, z1 = math.floor(bbox[4] * inv), math.floor((bbox[5] + tolerance) * inv)
+
+        if (x1 - x0 + 1) * (y1 - y0 + 1) * (z1 - z0 + 1) > max_cells_per_box:
+            oversized.append(i)
+            continue
+
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                for cz in range(z0, z1 + 1):
+                    cell = grid.get((cx, cy, cz))
+                    if cell is None:
+                        grid[(cx, cy, cz)] = [i]
+                    else:
+                        cell.append(i)
+
+    tested = set()
+    pairs = set()
+
+    def test(i, j):
+        key = (i, j) if i < j else (j, i)
+        if key in tested:
+            return
+        tested.add(key)
+        if bboxes_overlap(bboxes[key[0]], bboxes[key[1]], tolerance):
+            pairs.add(key)
+
+    for members in grid.values():
+        if len(members) < 2:
+            continue
+        for a in range(len(members) - 1):
+            i = members[a]
+            for j in members[a + 1:]:
+                test(i, j)
+
+    for i in oversized:
+        for j, _ in boxes:
+            if i != j:
+                test(i, j)
+
+    return sorted(pairs)
+
+
+def build_overlap_neighbors(pairs):
+    """Turn (i, j) pairs into {i: [j, ...]} with ascending j, for ordered dupe scans"""
+    neighbors = {}
+    for i, j in pairs:
+        neighbors.setdefault(i, []).append(j)
+    return neighbors
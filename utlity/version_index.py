@@ -0,0 +1,112 @@
+import os
+import re
+import json
+
+INDEX_NAME = ".dh_versions.json"
+LATEST_LINK = "latest"
+VERSION_PATTERN = re.compile(r"^v(\d{3})$") # Matches "v" followed by 3 digits
+
+
+def version_folder_name(num):
+    return f"v{str(num).zfill(3)}"
+
+
+class VersionIndex:
+    """Cached view of an export directory's vNNN folders.
+
+    The index file remembers the latest version number, the files in that folder
+    and the folder's mtime. Validating it costs two stats (latest folder still
+    unchanged, next version not created by someone else) instead of a listdir,
+    an isdir per entry and an exists per file - which matters on network shares.
+    Anything that doesn't check out falls back to a full rescan.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.latest = 0
+        self.latest_files = set()
+        self.latest_mtime_ns = 0
+        if not self._load():
+            self.rescan()
+
+    @property
+    def index_path(self):
+        return os.path.join(self.directory, INDEX_NAME)
+
+    def folder(self, num):
+        return os.path.join(self.directory, version_folder_name(num))
+
+    def _load(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            latest = int(data["latest"])
+            files = set(data["files"])
+            mtime_ns = int(data["latest_mtime_ns"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+        if latest == 0:
+            return False
+        try:
+            if os.stat(self.folder(latest)).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+        if os.path.exists(self.folder(latest + 1)):
+            return False
+
+        self.latest, self.latest_files, self.latest_mtime_ns = latest, files, mtime_ns
+        return True
+
+    def rescan(self):
+        """Slow path: list the directory like the exporters used to"""
+        self.latest = 0
+        try:
+            for item in os.listdir(self.directory):
+                match = VERSION_PATTERN.match(item)
+                if match and os.path.isdir(os.path.join(self.directory, item)):
+                    self.latest = max(self.latest, int(match.group(1)))
+        except FileNotFoundError:
+            pass
+
+        self.latest_files = set()
+        self.latest_mtime_ns = 0
+        if self.latest:
+            self._read_folder(self.latest)
+        print(f"📂 Rescanned versions in {self.directory}: latest v{str(self.latest).zfill(3)}")
+
+    def _read_folder(self, num):
+        folder = self.folder(num)
+        self.latest_files = set(os.listdir(folder))
+        self.latest_mtime_ns = os.stat(folder).st_mtime_ns
+
+    def record_export(self, num):
+        """Call after writing into version `num`: refresh, save the index and point `latest` at it"""
+        if num < self.latest or not os.path.isdir(self.folder(num)):
+            return
+        self.latest = num
+        self._read_folder(num)
+
+        temp_path = self.index_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "latest": self.latest,
+                "latest_mtime_ns": self.latest_mtime_ns,
+                "files": sorted(self.latest_files),
+            }, f, indent=2)
+        os.replace(temp_path, self.index_path)
+
+        self._update_latest_link(num)
+
+    def _update_latest_link(self, num):
+        """Relative `latest` symlink, swapped in atomically (skipped where symlinks aren't allowed)"""
+        link_path = os.path.join(self.directory, LATEST_LINK)
+        temp_link = link_path + ".tmp"
+        try:
+            if os.path.lexists(temp_link):
+                os.remove(temp_link)
+            os.symlink(version_folder_name(num), temp_link, target_is_directory=True)
+            os.replace(temp_link, link_path)
+        except OSError as e:
+            print(f"⚠️ Could not update '{LATEST_LINK}' link: {e}")